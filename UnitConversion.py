@@ -28,6 +28,13 @@ email: mark@shuck.engineering
 
 degree_sign = u'\N{DEGREE SIGN}'
 import numpy as np
+import pandas as pd
+
+
+class UnitConversionError(ValueError):
+    """
+    Raised by the array conversions when a unit label is not known
+    """
 
 
 class UnitConvert:
@@ -364,6 +371,115 @@ class UnitConvert:
             'radians': self.angle_lookup_value_rad,
         }
 
+        # dense factor/offset matrices [input code, output code] used by the array conversions,
+        # output = value * factor + offset
+        self.conversion_matrix = {
+            'temp': self.c_conversion_matrix(self.dict_temp_convert),
+            'speed': self.c_conversion_matrix(self.dict_speed_convert),
+            'length': self.c_conversion_matrix(self.dict_length_convert),
+            'angle': self.c_conversion_matrix(self.dict_angle_convert),
+        }
+        self.conversion_units = {
+            'temp': self.dict_temp,
+            'speed': self.dict_speed,
+            'length': self.dict_length,
+            'angle': self.dict_angle,
+        }
+
+    @staticmethod
+    def c_conversion_matrix(dict_convert):
+        """
+        Compiles a nested conversion dictionary into factor and offset matrices
+        :param dict_convert: {input code: {output code: factor or (offset before, factor, offset after)}}
+        :return: factor matrix, offset matrix
+        """
+        size = len(dict_convert)
+        factor = np.zeros((size, size))
+        offset = np.zeros((size, size))
+        for input_code, outputs in dict_convert.items():
+            for output_code, conversion in outputs.items():
+                if isinstance(conversion, tuple):
+                    # (value + a) * b + c == value * b + (a * b + c)
+                    factor[input_code, output_code] = conversion[1]
+                    offset[input_code, output_code] = conversion[0] * conversion[1] + conversion[2]
+                else:
+                    factor[input_code, output_code] = conversion
+        return factor, offset
+
+    def unit_codes(self, units, quantity, errors='raise'):
+        """
+        Resolves unit labels to unit codes, each distinct label is looked up once
+        :param units: unit label or array/Series of unit labels
+        :param quantity: 'temp', 'speed', 'length' or 'angle'
+        :param errors: 'raise' raises UnitConversionError on unknown labels, 'nan' marks them with code -1
+        :return: unit code(s), same shape as units
+        """
+        lookup = self.conversion_units[quantity]
+        if np.ndim(units) == 0:
+            labels, inverse = np.array([units], dtype=object), np.zeros(1, dtype=int)
+        else:
+            inverse, labels = pd.factorize(np.asarray(units, dtype=object).ravel(), use_na_sentinel=False)
+        codes = np.array([lookup.get(label, -1) if isinstance(label, str) else -1 for label in labels], dtype=int)
+        if errors == 'raise' and (codes == -1).any():
+            unknown = [label for label, code in zip(labels, codes) if code == -1]
+            raise UnitConversionError(f'unknown {quantity} units: {unknown}')
+        return codes[inverse].reshape(np.shape(units))
+
+    def convert_array(self, value, input_units, output_units, quantity, out=None, errors='raise'):
+        """
+        Vectorized conversion of a whole array/Series in one broadcast. Units may be single labels or arrays of
+        labels (one per element) broadcast against value.
+        :param value: numpy array, pandas Series or scalar
+        :param input_units: input unit label(s)
+        :param output_units: output unit label(s)
+        :param quantity: 'temp', 'speed', 'length' or 'angle'
+        :param out: float array to write the result into, pass value itself to convert in place
+        :param errors: 'raise' raises UnitConversionError on unknown labels, 'nan' returns NaN for those elements
+        :return: converted values (Series when value is a Series)
+        """
+        factor, offset = self.conversion_matrix[quantity]
+        input_code = self.unit_codes(input_units, quantity, errors)
+        output_code = self.unit_codes(output_units, quantity, errors)
+        valid = (input_code >= 0) & (output_code >= 0)
+        factor = np.where(valid, factor[input_code, output_code], np.nan)
+        offset = np.where(valid, offset[input_code, output_code], np.nan)
+
+        values = value.values if isinstance(value, pd.Series) else value
+        values = np.asarray(values, dtype=float)
+        if out is None:
+            output = values * factor + offset
+        else:
+            output = np.multiply(values, factor, out=out)
+            output += offset
+
+        if isinstance(value, pd.Series):
+            return pd.Series(output, index=value.index, name=value.name)
+        return output
+
+    def temp_convert_array(self, value, input_units, output_units, out=None, errors='raise'):
+        """
+        Array version of temp_convert, see convert_array
+        """
+        return self.convert_array(value, input_units, output_units, 'temp', out, errors)
+
+    def speed_convert_array(self, value, input_units, output_units, out=None, errors='raise'):
+        """
+        Array version of speed_convert, see convert_array
+        """
+        return self.convert_array(value, input_units, output_units, 'speed', out, errors)
+
+    def length_convert_array(self, value, input_units, output_units, out=None, errors='raise'):
+        """
+        Array version of length_convert, see convert_array
+        """
+        return self.convert_array(value, input_units, output_units, 'length', out, errors)
+
+    def angle_convert_array(self, value, input_units, output_units, out=None, errors='raise'):
+        """
+        Array version of angle_convert, see convert_array
+        """
+        return self.convert_array(value, input_units, output_units, 'angle', out, errors)
+
     def temp_convert(self, value, input_units, output_units):
         """
         Converts temperature from input units to output units
@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+MIT License
+
+Copyright (c) 2023 Mark Shuck
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@author: Mark Shuck
+email: mark@shuck.engineering
+
+Benchmark suite for the calculation hot paths, runs offline against the sample workbooks.
+
+    python benchmark.py --size small medium --output bench.json
+    python benchmark.py --compare bench.json
+
+Every benchmark is timed --repeat times after one untimed warm up run, the results (min/median/mean seconds and
+seconds per item) are written to a JSON file that can be passed to --compare on a later commit.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import main as ieee738
+
+path_config = 'Sample/config-sample.xlsx'  # location of configuration file
+path_conductor = 'Sample/Conductor_Prop-Sample.xlsx'  # location of conductor file
+
+# conductors/configurations rated, steady state/load dump points and rows of the imported conductor workbook,
+# None uses the whole sample catalog
+sizes = {
+    'small': {'conductors': 1, 'configs': 1, 'points': 10, 'rows': 31},
+    'medium': {'conductors': 8, 'configs': 2, 'points': 200, 'rows': 500},
+    'catalog': {'conductors': None, 'configs': None, 'points': 2000, 'rows': 2000},
+}
+
+
+class BenchmarkContext:
+    """
+    Inputs shared by the benchmarks of one size, the catalog is imported and converted once
+    """
+
+    def __init__(self, size, directory):
+        self.size = size
+        self.settings = sizes[size]
+        self.directory = directory
+        self.app = ieee738.IEEE738()
+
+        config_list = self.app.import_config(path_config, sheet_name='config')
+        conductor_list, spec_list = self.app.import_conductor(path_conductor, ['conductors', 'conductor spec'])
+        rated = ieee738.IEEE738.c_rating_pairs(conductor_list, spec_list, config_list.iloc[:1])
+        conductor_list = conductor_list.iloc[[_idx for _, _idx in rated]].reset_index(drop=True)
+
+        self.config_list = config_list.iloc[:self.settings['configs']].reset_index(drop=True)
+        self.conductor_list = conductor_list.iloc[:self.settings['conductors']].reset_index(drop=True)
+        self.spec_list = spec_list
+        self.pairs = self.app.c_rating_pairs(self.conductor_list, self.spec_list, self.config_list)
+
+        df_conductor, df_spec, df_config = self.pair(0)
+        self.df_adjusted = self.app.add_calc_columns(self.app.unit_conversion(df_conductor, df_spec, df_config))
+        self.conductor = ieee738.ConductorParameters.from_adjusted(self.df_adjusted)
+
+        # evenly spread steady state points between ambient and emergency temperature
+        rng = np.random.default_rng(738)
+        self.ambient_temp = rng.uniform(-10, 45, self.settings['points'])
+        self.conductor_temp = self.ambient_temp + rng.uniform(5, 100, self.settings['points'])
+
+        self.workbook = None
+
+    def pair(self, _pos):
+        config_idx, conductor_idx = self.pairs[_pos]
+        df_conductor = self.conductor_list.iloc[[conductor_idx]].reset_index(drop=True)
+        df_spec = self.spec_list[self.spec_list['Conductor Spec'] ==
+                                 df_conductor.at[0, 'Conductor Spec']].reset_index(drop=True)
+        df_config = self.config_list.iloc[[config_idx]].reset_index(drop=True)
+        return df_conductor, df_spec, df_config
+
+    def conductor_workbook(self):
+        """
+        Conductor workbook with the sample catalog repeated up to the size's row count
+        """
+        if self.workbook is None:
+            conductor_list = pd.read_excel(path_conductor, sheet_name='conductors', engine='openpyxl')
+            spec_list = pd.read_excel(path_conductor, sheet_name='conductor spec', engine='openpyxl')
+            repeat = -(-self.settings['rows'] // conductor_list.shape[0])
+            conductor_list = pd.concat([conductor_list] * repeat, ignore_index=True).iloc[:self.settings['rows']]
+            self.workbook = os.path.join(self.directory, f'conductors_{self.size}.xlsx')
+            with pd.ExcelWriter(self.workbook, engine='openpyxl') as writer:
+                conductor_list.to_excel(writer, sheet_name='conductors', index=False)
+                spec_list.to_excel(writer, sheet_name='conductor spec', index=False)
+        return self.workbook
+
+
+def bench_c_SSRating(ctx):
+    df = ctx.df_adjusted
+    args = [(ctx.df_adjusted.at[0, 'calculation units'], ctx.conductor.diameter, conductor_temp, ambient_temp,
+             df.at[0, 'elevation'], df.at[0, 'normal wind angle'], df.at[0, 'normal wind speed'],
+             ctx.conductor.emissivity, ctx.conductor.solar_absorptivity, df.at[0, 'atmosphere'], df.at[0, 'latitude'],
+             df.at[0, 'day'], df.at[0, 'month'], df.at[0, 'year'], df.at[0, 'hour'], df.at[0, 'conductor direction'],
+             ctx.conductor.projection, ctx.conductor)
+            for conductor_temp, ambient_temp in zip(ctx.conductor_temp, ctx.ambient_temp)]
+
+    def run():
+        for arg in args:
+            ctx.app.c_SSRating(*arg)
+
+    return run, len(args)
+
+
+def bench_c_SSRating_array(ctx):
+    df = ctx.df_adjusted
+
+    def run():
+        ctx.app.c_SSRating_array(df.at[0, 'calculation units'], ctx.conductor.diameter, ctx.conductor_temp,
+                                 ctx.ambient_temp, df.at[0, 'elevation'], df.at[0, 'normal wind angle'],
+                                 df.at[0, 'normal wind speed'], ctx.conductor.emissivity,
+                                 ctx.conductor.solar_absorptivity, df.at[0, 'atmosphere'], df.at[0, 'latitude'],
+                                 df.at[0, 'day'], df.at[0, 'month'], df.at[0, 'year'], df.at[0, 'hour'],
+                                 df.at[0, 'conductor direction'], ctx.conductor.projection, ctx.conductor)
+
+    return run, ctx.ambient_temp.size
+
+
+def load_dump_args(ctx, ambient_temp):
+    df = ctx.df_adjusted
+    return (df.at[0, 'calculation units'], ctx.conductor.diameter, df.at[0, 'normal temperature rating'],
+            df.at[0, 'emergency temperature rating'], ambient_temp, df.at[0, 'elevation'],
+            df.at[0, 'emergency wind angle'], df.at[0, 'emergency wind speed'], ctx.conductor.emissivity,
+            ctx.conductor.solar_absorptivity, df.at[0, 'atmosphere'], df.at[0, 'latitude'], df.at[0, 'day'],
+            df.at[0, 'month'], df.at[0, 'year'], df.at[0, 'hour'], df.at[0, 'conductor direction'],
+            ctx.conductor.projection, ctx.conductor, ctx.conductor.mcp, df.at[0, 'duration (minutes)'])
+
+
+def bench_load_dump(ctx):
+    # scalar solver, limited number of ambient temperatures to keep the run time reasonable
+    ambient_temp = ctx.ambient_temp[:max(1, ctx.ambient_temp.size // 10)]
+    args = [load_dump_args(ctx, element) for element in ambient_temp]
+
+    def run():
+        for arg in args:
+            ctx.app.load_dump(*arg)
+
+    return run, len(args)
+
+
+def bench_load_dump_array(ctx):
+    args = load_dump_args(ctx, ctx.ambient_temp)
+
+    def run():
+        ctx.app.load_dump_array(*args)
+
+    return run, ctx.ambient_temp.size
+
+
+def bench_unit_conversion(ctx):
+    pairs = [ctx.pair(_pos) for _pos in range(len(ctx.pairs))]
+
+    def run():
+        for df_conductor, df_spec, df_config in pairs:
+            ctx.app.unit_conversion(df_conductor, df_spec, df_config)
+
+    return run, len(pairs)
+
+
+def bench_unit_conversion_table(ctx):
+    def run():
+        ctx.app.unit_conversion_table(ctx.conductor_list, ctx.spec_list, ctx.config_list)
+
+    return run, len(ctx.pairs)
+
+
+def bench_c_reporting(ctx):
+    pairs = [ctx.pair(_pos) for _pos in range(len(ctx.pairs))]
+
+    def run():
+        for df_conductor, df_spec, df_config in pairs:
+            ctx.app.c_reporting(df_conductor, df_spec, df_config)
+
+    return run, len(pairs)
+
+
+def bench_c_reporting_grid(ctx):
+    pairs = [ctx.pair(_pos) for _pos in range(len(ctx.pairs))]
+
+    def run():
+        for df_conductor, df_spec, df_config in pairs:
+            ctx.app.c_reporting_grid(df_conductor, df_spec, df_config)
+
+    return run, len(pairs)
+
+
+def bench_c_reporting_batch(ctx):
+    def run():
+        ctx.app.c_reporting_batch(ctx.conductor_list, ctx.spec_list, ctx.config_list)
+
+    return run, len(ctx.pairs)
+
+
+def config_edit(ctx, method, incremental):
+    """
+    Rates the pairs with the configuration as imported and again after extending the ambient air temperature upper
+    range by 5 C, the way a configuration is iterated on. With incremental both passes share a fresh
+    IncrementalCache, the second pass only evaluates the intermediates of the new ambient temperatures.
+    :param method: 'c_reporting' (one pair at a time) or 'c_reporting_batch'
+    """
+    app = ieee738.IEEE738()
+    config_list = ctx.config_list.copy()
+    config_list['ambient air temperature upper range'] += 5
+    pairs = [ctx.pair(_pos) for _pos in range(len(ctx.pairs))]
+    edited = [(df_conductor, df_spec, config_list.iloc[[config_idx]].reset_index(drop=True))
+              for (df_conductor, df_spec, _), (config_idx, _) in zip(pairs, ctx.pairs)]
+
+    def run():
+        app.incremental = ieee738.IncrementalCache() if incremental else None
+        if method == 'c_reporting':
+            for df_conductor, df_spec, df_config in pairs + edited:
+                app.c_reporting(df_conductor, df_spec, df_config)
+        else:
+            for df_config_list in (ctx.config_list, config_list):
+                app.c_reporting_batch(ctx.conductor_list, ctx.spec_list, df_config_list)
+
+    return run, len(ctx.pairs)
+
+
+def bench_c_reporting_edit(ctx):
+    return config_edit(ctx, 'c_reporting', incremental=False)
+
+
+def bench_c_reporting_incremental(ctx):
+    return config_edit(ctx, 'c_reporting', incremental=True)
+
+
+def bench_c_reporting_batch_edit(ctx):
+    return config_edit(ctx, 'c_reporting_batch', incremental=False)
+
+
+def bench_c_reporting_batch_incremental(ctx):
+    return config_edit(ctx, 'c_reporting_batch', incremental=True)
+
+
+def bench_import_conductor(ctx):
+    workbook = ctx.conductor_workbook()
+
+    def run():
+        ctx.app.import_conductor(workbook, ['conductors', 'conductor spec'])
+
+    return run, ctx.settings['rows']
+
+
+def bench_export_excel(ctx):
+    df_n, df_e, df_l = ctx.app.c_reporting_batch(ctx.conductor_list, ctx.spec_list, ctx.config_list)
+    filename_ = os.path.join(ctx.directory, f'export_{ctx.size}')
+
+    def run():
+        ctx.app.export_excel(df_n, df_e, df_l, ctx.config_list, filename_)
+
+    return run, df_n.shape[0]
+
+
+def bench_export_excel_stream(ctx):
+    df_n, df_e, df_l = ctx.app.c_reporting_batch(ctx.conductor_list, ctx.spec_list, ctx.config_list)
+    filename_ = os.path.join(ctx.directory, f'export_stream_{ctx.size}')
+
+    def run():
+        ctx.app.export_excel_stream(df_n, df_e, df_l, ctx.config_list, filename_)
+
+    return run, df_n.shape[0]
+
+
+benchmarks = {
+    'c_SSRating': bench_c_SSRating,
+    'c_SSRating_array': bench_c_SSRating_array,
+    'load_dump': bench_load_dump,
+    'load_dump_array': bench_load_dump_array,
+    'unit_conversion': bench_unit_conversion,
+    'unit_conversion_table': bench_unit_conversion_table,
+    'c_reporting': bench_c_reporting,
+    'c_reporting_grid': bench_c_reporting_grid,
+    'c_reporting_batch': bench_c_reporting_batch,
+    'c_reporting_edit': bench_c_reporting_edit,
+    'c_reporting_incremental': bench_c_reporting_incremental,
+    'c_reporting_batch_edit': bench_c_reporting_batch_edit,
+    'c_reporting_batch_incremental': bench_c_reporting_batch_incremental,
+    'import_conductor': bench_import_conductor,
+    'export_excel': bench_export_excel,
+    'export_excel_stream': bench_export_excel_stream,
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(name, ctx, repeat):
+    run, items = benchmarks[name](ctx)
+    run()  # warm up (imports, solar tables, file cache)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return {
+        'name': name,
+        'size': ctx.size,
+        'items': items,
+        'repeat': repeat,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'per item': min(timings) / items,
+    }
+
+
+def compare(results, previous):
+    """
+    Prints the change of the minimum time against a previous result file
+    """
+    previous = {(result['name'], result['size']): result for result in previous['results']}
+    print(f"{'benchmark':<32}{'size':<10}{'previous':>12}{'current':>12}{'ratio':>8}")
+    for result in results['results']:
+        key = (result['name'], result['size'])
+        if key not in previous:
+            continue
+        ratio = result['min'] / previous[key]['min']
+        print(f"{key[0]:<32}{key[1]:<10}{previous[key]['min']:>12.4g}{result['min']:>12.4g}{ratio:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='IEEE 738 hot path benchmarks')
+    parser.add_argument('--size', nargs='+', choices=list(sizes), default=['small'])
+    parser.add_argument('--benchmark', nargs='+', choices=list(benchmarks), default=list(benchmarks))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', default='benchmark.json', help='JSON result file')
+    parser.add_argument('--compare', default=None, help='previous JSON result file to compare against')
+    args = parser.parse_args(argv)
+
+    # openpyxl warns about workbook features it drops on read (data validation, conditional formatting), the
+    # values are not affected
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+    results = {
+        'version': ieee738.ver,
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'results': [],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.size:
+            ctx = BenchmarkContext(size, directory)
+            for name in args.benchmark:
+                result = run_benchmark(name, ctx, args.repeat)
+                results['results'].append(result)
+                print(f"{name:<32}{size:<10}{result['min']:>12.4g} s{result['per item']:>12.4g} s/item")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
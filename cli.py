@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+MIT License
+
+Copyright (c) 2023 Mark Shuck
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@author: Mark Shuck
+email: mark@shuck.engineering
+
+Non-interactive rating runs (scheduled/cron use), the headless version of demo.py.
+
+    python cli.py --conductors all --format xlsx-stream --output ratings
+    python cli.py --conductors "ACSR,795,36,1" "HD Copper,500" --config-name default --format npz --workers 4
+
+A conductor key lists the leading catalog levels separated by commas (Conductor Spec, Size, Cond Strand,
+Core Strand), every conductor matching the key is rated, "all" rates the whole catalog.
+
+Exit codes:
+    0 ratings written
+    1 calculation or export failed
+    2 invalid arguments (unknown conductor key or configuration name)
+    3 input workbook could not be read
+    4 none of the selected conductors has normal/emergency temperature ratings
+"""
+import argparse
+import logging
+import sys
+import time
+import warnings
+
+import main as ieee738
+
+path_config = 'Sample/config-sample.xlsx'  # location of configuration file
+path_conductor = 'Sample/Conductor_Prop-Sample.xlsx'  # location of conductor file
+
+formats = ('xlsx', 'xlsx-stream') + ieee738.IEEE738.columnar_formats
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_INPUT = 3
+EXIT_NO_RATINGS = 4
+
+
+def parse_key(text):
+    """
+    :param text: comma separated catalog levels, ex. 'ACSR,795,36,1'
+    :return: catalog key tuple, numeric levels as float and empty/nan levels as None
+    """
+    key = []
+    for value in text.split(','):
+        value = value.strip()
+        try:
+            value = float(value)
+        except ValueError:
+            pass
+        key.append(value)
+    return ieee738.ConductorCatalog.key(*[None if value == '' else value for value in key])
+
+
+def select_rows(catalog, conductors):
+    """
+    :param catalog: ConductorCatalog
+    :param conductors: conductor keys or ['all']
+    :return: catalog row positions in catalog order
+    """
+    if any(text.lower() == 'all' for text in conductors):
+        return catalog.rows[()]
+    rows = set()
+    for text in conductors:
+        key = parse_key(text)
+        if len(key) > len(catalog.levels) or key not in catalog.rows:
+            raise KeyError(f'{text} does not match any conductor')
+        rows.update(catalog.rows[key])
+    return sorted(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='IEEE 738 batch ratings',
+                                     epilog='exit codes: 0 ok, 1 calculation/export failed, 2 invalid arguments, '
+                                            '3 input workbook not readable, 4 no rated conductors selected')
+    parser.add_argument('--config', default=path_config, help='configuration workbook')
+    parser.add_argument('--conductor', default=path_conductor, help='conductor workbook')
+    parser.add_argument('--conductors', nargs='+', default=['all'],
+                        help='conductor keys (spec,size,cond strand,core strand) or all')
+    parser.add_argument('--config-name', nargs='+', default=None, help='configuration names, default all')
+    parser.add_argument('--format', choices=formats, default='xlsx', help='output format')
+    parser.add_argument('--output', default='ratings', help='output file name without extension')
+    parser.add_argument('--per-conductor', action='store_true',
+                        help='one set of sheets per conductor (xlsx-stream)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='worker processes, 1 rates the batch in the current process')
+    parser.add_argument('--true-to-standard', action='store_true',
+                        help='follow IEEE 738 instead of the original PJM spreadsheet')
+    parser.add_argument('--cache', action='store_true',
+                        help='reuse parsed workbooks (cached under $XDG_CACHE_HOME/ieee738)')
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    def log(text):
+        if not args.quiet:
+            print(text)
+
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.per_conductor and args.format != 'xlsx-stream':
+        parser.error('--per-conductor requires --format xlsx-stream')
+
+    # openpyxl warns about workbook features it drops on read (data validation, conditional formatting), the
+    # values are not affected
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+    # conductors skipped for missing temperature ratings are reported through the ieee738 logger
+    logging.basicConfig(format='%(levelname)s: %(message)s')
+    start = time.perf_counter()
+    app = ieee738.IEEE738()
+    app.true_to_standard = args.true_to_standard
+
+    try:
+        config_list = app.import_config(args.config, sheet_name='config', cache=args.cache)
+        conductor_list, spec_list = app.import_conductor(args.conductor, ['conductors', 'conductor spec'],
+                                                         cache=args.cache)
+    except Exception as error:
+        print(f'error: could not read input workbooks: {error}', file=sys.stderr)
+        return EXIT_INPUT
+
+    conductor_list = conductor_list.reset_index(drop=True)
+    catalog = ieee738.ConductorCatalog(conductor_list, spec_list)
+    try:
+        df_conductor_list = conductor_list.iloc[select_rows(catalog, args.conductors)].reset_index(drop=True)
+    except KeyError as error:
+        print(f'error: {error.args[0]}', file=sys.stderr)
+        return EXIT_USAGE
+    if args.config_name is None:
+        df_config_list = config_list.reset_index(drop=True)
+    else:
+        unknown = [name for name in args.config_name if name not in config_list['config name'].astype(str).values]
+        if unknown:
+            print(f'error: unknown configuration {", ".join(unknown)}', file=sys.stderr)
+            return EXIT_USAGE
+        df_config_list = config_list[config_list['config name'].astype(str).isin(args.config_name)]
+        df_config_list = df_config_list.reset_index(drop=True)
+
+    pairs = app.c_rating_pairs(df_conductor_list, spec_list, df_config_list)
+    n_rated = len({conductor_idx for _, conductor_idx in pairs})
+    if not pairs:
+        print('error: none of the selected conductors has normal/emergency temperature ratings', file=sys.stderr)
+        return EXIT_NO_RATINGS
+    log(f'rating {n_rated} conductor(s) x {df_config_list.shape[0]} configuration(s)')
+
+    try:
+        if args.workers == 1:
+            df_n, df_e, df_l = app.c_reporting_batch(df_conductor_list, spec_list, df_config_list)
+        else:
+            df_n, df_e, df_l = app.c_reporting_parallel(df_conductor_list, spec_list, df_config_list,
+                                                        workers=args.workers, method='c_reporting_batch')
+
+        if args.format == 'xlsx':
+            app.export_excel(df_n, df_e, df_l, df_config_list, args.output)
+            filename_list = [args.output + '.xlsx']
+        elif args.format == 'xlsx-stream':
+            app.export_excel_stream(df_n, df_e, df_l, df_config_list, args.output, per_conductor=args.per_conductor)
+            filename_list = [args.output + '.xlsx']
+        else:
+            filename_list = app.export_columnar(df_n, df_e, df_l, df_config_list, args.output,
+                                                file_format=args.format)
+    except Exception as error:
+        print(f'error: {type(error).__name__}: {error}', file=sys.stderr)
+        return EXIT_FAILURE
+
+    for filename_ in filename_list:
+        log(f'wrote {filename_}')
+    log(f'{df_n.shape[0] + df_e.shape[0] + df_l.shape[0]} rating rows in {time.perf_counter() - start:.1f} s')
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -91,30 +91,30 @@ def select_config(df_config):
         config = df_config[df_config['config name'] == _df[_response - 1]].reset_index(drop=True)
     except KeyError:
         print(f'{_response} is not a valid selection')
-        app.select_config(df_config)
+        config = select_config(df_config)
     except IndexError:
         print('Please select a valid configuration')
-        app.select_config(df_config)
+        config = select_config(df_config)
     except TypeError:
         print('Please select a valid configuration')
-        app.select_config(df_config)
+        config = select_config(df_config)
     except ValueError:
         print('Please select a valid configuration')
-        app.select_config(df_config)
+        config = select_config(df_config)
     return config
 
 
 def select_conductor(df_conductor_list, df_conductor_spec_temp):
-    _config_name = None
     _conductor_spec = None
     _conductor_size = None
     _conductor_stranding = None
     _conductor_core_stranding = None
     _response = None
 
+    catalog = ieee738.ConductorCatalog(df_conductor_list, df_conductor_spec_temp)
+
     # Select conductor spec
-    _df = df_conductor_list.drop_duplicates(['Conductor Spec'])
-    _df = _df['Conductor Spec'].values
+    _df = catalog.choices()
     for _pos, _text in enumerate(_df):
         print(f"{_pos + 1}: {_text}")
     if demo:
@@ -125,8 +125,7 @@ def select_conductor(df_conductor_list, df_conductor_spec_temp):
     print(_conductor_spec)
 
     # Select conductor size
-    _df = df_conductor_list[df_conductor_list['Conductor Spec'] == _conductor_spec].drop_duplicates(['Size'])
-    _df = _df['Size'].values
+    _df = catalog.choices(_conductor_spec)
     for _pos, _text in enumerate(_df):
         print(f"{_pos + 1}: {_text}")
     if demo:
@@ -138,14 +137,9 @@ def select_conductor(df_conductor_list, df_conductor_spec_temp):
 
     # Depending on conductor spec, only sizing is required
     # Check to see if a single item exists
-    _df = df_conductor_list[df_conductor_list['Conductor Spec'] == _conductor_spec]
-    _df = _df[_df['Size'] == _conductor_size]
-
-    if not _df.shape[0] == 1:
+    if not catalog.count(_conductor_spec, _conductor_size) == 1:
         # Select conductor stranding
-        _df = _df.drop_duplicates(['Cond Strand'])
-        _df.sort_values('Cond Strand', ascending=True, inplace=True)
-        _df = _df['Cond Strand'].values
+        _df = sorted(catalog.choices(_conductor_spec, _conductor_size), key=lambda x: (x is None, x))
         for _pos, _text in enumerate(_df):
             print(f"{_pos + 1}: {_text}")
         if demo:
@@ -156,36 +150,23 @@ def select_conductor(df_conductor_list, df_conductor_spec_temp):
 
         # Depending on conductor spec, only sizing is required
         # Check to see if a single item exists
-        _df = df_conductor_list[df_conductor_list['Conductor Spec'] == _conductor_spec]
-        _df = _df[_df['Size'] == _conductor_size]
-        _df = _df[_df['Cond Strand'] == _conductor_stranding]
-        if not _df.shape[0] == 1:
-            _df = _df.drop_duplicates(['Core Strand'])
-            _df.sort_values('Core Strand', ascending=True, inplace=True)
-            _df = _df['Core Strand'].values
+        if not catalog.count(_conductor_spec, _conductor_size, _conductor_stranding) == 1:
+            _df = sorted(catalog.choices(_conductor_spec, _conductor_size, _conductor_stranding),
+                         key=lambda x: (x is None, x))
             for _pos, _text in enumerate(_df):
                 print(f"{_pos + 1}: {_text}")
             _response = int(input("Selection?"))
             print(_df[0])
             _conductor_core_stranding = _df[_response - 1]
 
-    _df = df_conductor_list  # Reset list to original excel import, could probably do this neater, but it works
-
     if _conductor_core_stranding is None:
         if _conductor_stranding is None:
-            conductor_data = _df.loc[
-                (_df['Conductor Spec'] == _conductor_spec) & (_df['Size'] == _conductor_size)]
+            df_conductor, df_spec = catalog.lookup(_conductor_spec, _conductor_size)
         else:
-            conductor_data = _df.loc[
-                (_df['Conductor Spec'] == _conductor_spec) & (_df['Size'] == _conductor_size) & (
-                        _df['Cond Strand'] == _conductor_stranding)]
+            df_conductor, df_spec = catalog.lookup(_conductor_spec, _conductor_size, _conductor_stranding)
     else:
-        conductor_data = _df.loc[
-            (_df['Conductor Spec'] == _conductor_spec) & (_df['Size'] == _conductor_size) & (
-                    _df['Cond Strand'] == _conductor_stranding) & (_df['Core Strand'] == _conductor_core_stranding)]
-    df_spec = df_conductor_spec_temp.loc[df_conductor_spec_temp['Conductor Spec'] == _conductor_spec].reset_index(
-        drop=True)
-    df_conductor = conductor_data.reset_index(drop=True)
+        df_conductor, df_spec = catalog.lookup(_conductor_spec, _conductor_size, _conductor_stranding,
+                                               _conductor_core_stranding)
     return df_conductor, df_spec
 
 
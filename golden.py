@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+MIT License
+
+Copyright (c) 2023 Mark Shuck
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@author: Mark Shuck
+email: mark@shuck.engineering
+
+Golden dataset equivalence harness. Generates a deterministic set of steady state and load dump inputs from the
+sample catalog, stores the results of the scalar reference path (c_SSRating, load_dump for true_to_standard off and
+on) and compares alternate engines against them.
+
+    python golden.py generate --output golden.npz
+    python golden.py check --golden golden.npz --engine c_SSRating_array load_dump_array
+
+check prints the largest differences, the number of points outside tolerance and the speedup against the reference
+timings, the exit code is 1 when any engine is outside tolerance.
+"""
+import argparse
+import sys
+import time
+import warnings
+
+import numpy as np
+
+import main as ieee738
+
+path_config = 'Sample/config-sample.xlsx'  # location of configuration file
+path_conductor = 'Sample/Conductor_Prop-Sample.xlsx'  # location of conductor file
+
+
+def conductor_rows(app):
+    """
+    Every ratable (configuration, conductor) pair of the sample catalog, unit converted
+    :return: {'table': unit_conversion_table rows used by the array engines,
+    'scalar': the same rows converted one pair at a time with unit_conversion (original path)}
+    """
+    config_list = app.import_config(path_config, sheet_name='config').reset_index(drop=True)
+    conductor_list, spec_list = app.import_conductor(path_conductor, ['conductors', 'conductor spec'])
+    conductor_list = conductor_list.reset_index(drop=True)
+    rated = sorted({_idx for _, _idx in app.c_rating_pairs(conductor_list, spec_list, config_list)})
+    conductor_list = conductor_list.iloc[rated].reset_index(drop=True)
+
+    # configuration major, same row order as unit_conversion_table
+    df_scalar = []
+    for config_idx in range(config_list.shape[0]):
+        df_config = config_list.iloc[[config_idx]].reset_index(drop=True)
+        for _idx in range(conductor_list.shape[0]):
+            df_conductor = conductor_list.iloc[[_idx]].reset_index(drop=True)
+            df_spec = spec_list[spec_list['Conductor Spec'] == df_conductor.at[0, 'Conductor Spec']]
+            df_scalar.append(app.unit_conversion(df_conductor, df_spec.reset_index(drop=True), df_config))
+
+    return {'table': app.unit_conversion_table(conductor_list, spec_list, config_list),
+            'scalar': [df.reset_index(drop=True) for df in df_scalar]}
+
+
+def conductor_parameters(df_adjusted, rows):
+    """
+    ConductorParameters for the given rows (same calculation units), one array element per row
+    """
+    unique_rows, inverse = np.unique(rows, return_inverse=True)
+    conductor = ieee738.ConductorParameters.stack([ieee738.ConductorParameters.from_adjusted(df_adjusted, _idx)
+                                                   for _idx in unique_rows])
+    return ieee738.ConductorParameters(conductor.calculation_units,
+                                       *[getattr(conductor, name)[inverse]
+                                         for name in ieee738.ConductorParameters.__slots__[1:]])
+
+
+def generate_inputs(df_adjusted, points, seed):
+    """
+    Deterministic random inputs, wind speeds are drawn in m/s and converted to the row's calculation units
+    """
+    rng = np.random.default_rng(seed)
+    row = rng.integers(0, df_adjusted.shape[0], points)
+    ambient_temp = rng.uniform(-15, 45, points)
+    metric = (df_adjusted['calculation units'].map(ieee738.uc.units_lookup).values[row] == ieee738.uc.metric_value)
+    inputs = {
+        'row': row,
+        'ambient air temperature': ambient_temp,
+        'conductor temperature': ambient_temp + rng.uniform(5, 150, points),
+        'wind speed': ieee738.uc.speed_convert_array(rng.uniform(0.3, 5, points), 'm/s',
+                                                     np.where(metric, 'm/s', 'ft/hr')),
+        'wind angle': rng.uniform(0, 90, points),
+        # lines sit at a handful of sites, keeps the number of SolarEphemeris tables bounded
+        'latitude': rng.choice(np.arange(25, 55, 5), points).astype(float),
+        'day': rng.integers(1, 29, points),
+        'month': rng.integers(1, 13, points),
+        'year': np.full(points, 2023),
+        # whole hours, solar position tables (SolarEphemeris) are exact on these times
+        'hour': rng.integers(6, 19, points) * 100,
+        'atmosphere': rng.choice(['clear', 'Industrial'], points),
+        'conductor direction': rng.choice(['N-S', 'E-W'], points),
+    }
+    return inputs
+
+
+def point_args(df, inputs, _pos):
+    """
+    Scalar arguments of c_SSRating taken from the unit_conversion output of the point's row, the conductor
+    resistance is passed as the DataFrame itself like c_steady_state did originally
+    """
+    calculation_units = df.at[0, 'calculation units']
+    diameter = df.at[0, 'Metal OD']
+    if ieee738.uc.units_lookup[calculation_units] == ieee738.uc.metric_value:
+        conductor_projection = diameter / 1000
+    else:
+        conductor_projection = diameter / 12
+    return (calculation_units, diameter, inputs['conductor temperature'][_pos],
+            inputs['ambient air temperature'][_pos], df.at[0, 'elevation'], inputs['wind angle'][_pos],
+            inputs['wind speed'][_pos], df.at[0, 'emissivity'], df.at[0, 'solar absorptivity'],
+            str(inputs['atmosphere'][_pos]), inputs['latitude'][_pos], int(inputs['day'][_pos]),
+            int(inputs['month'][_pos]), int(inputs['year'][_pos]), int(inputs['hour'][_pos]),
+            str(inputs['conductor direction'][_pos]), conductor_projection, df)
+
+
+def load_dump_point_args(df, inputs, _pos):
+    args = point_args(df, inputs, _pos)
+    return (args[0], args[1], df.at[0, 'normal temperature rating'], df.at[0, 'emergency temperature rating']) + \
+        args[3:] + (ieee738.IEEE738.c_mcp(df, 0), df.at[0, 'duration (minutes)'])
+
+
+def engine_c_SSRating(app, df_scalar, inputs):
+    results = np.empty((inputs['row'].size, 2))
+    for _pos in range(inputs['row'].size):
+        results[_pos] = app.c_SSRating(*point_args(df_scalar[inputs['row'][_pos]], inputs, _pos))
+    return results
+
+
+def engine_load_dump(app, df_scalar, inputs):
+    results = np.empty((inputs['row'].size, 2))
+    for _pos in range(inputs['row'].size):
+        results[_pos] = app.load_dump(*load_dump_point_args(df_scalar[inputs['row'][_pos]], inputs, _pos))
+    return results
+
+
+def array_groups(df_adjusted, inputs):
+    """
+    Splits the points by the inputs the array engines share (calculation units, atmosphere, conductor direction)
+    """
+    units = df_adjusted['calculation units'].values[inputs['row']]
+    keys = np.array([f'{a}|{b}|{c}' for a, b, c in zip(units, inputs['atmosphere'], inputs['conductor direction'])])
+    for key in np.unique(keys):
+        points = np.flatnonzero(keys == key)
+        calculation_units, atmosphere, conductor_direction = key.split('|')
+        yield points, calculation_units, atmosphere, conductor_direction
+
+
+def array_args(df_adjusted, inputs, points, calculation_units, atmosphere, conductor_direction):
+    rows = inputs['row'][points]
+    conductor = conductor_parameters(df_adjusted, rows)
+    return (calculation_units, conductor.diameter, inputs['conductor temperature'][points],
+            inputs['ambient air temperature'][points], df_adjusted['elevation'].values[rows].astype(float),
+            inputs['wind angle'][points], inputs['wind speed'][points], conductor.emissivity,
+            conductor.solar_absorptivity, atmosphere, inputs['latitude'][points], inputs['day'][points],
+            inputs['month'][points], inputs['year'][points], inputs['hour'][points], conductor_direction,
+            conductor.projection, conductor)
+
+
+def engine_c_SSRating_array(app, df_adjusted, inputs):
+    results = np.empty((inputs['row'].size, 2))
+    for points, calculation_units, atmosphere, conductor_direction in array_groups(df_adjusted, inputs):
+        args = array_args(df_adjusted, inputs, points, calculation_units, atmosphere, conductor_direction)
+        results[points, 0], results[points, 1] = app.c_SSRating_array(*args)
+    return results
+
+
+def engine_load_dump_array(app, df_adjusted, inputs):
+    results = np.empty((inputs['row'].size, 2))
+    for points, calculation_units, atmosphere, conductor_direction in array_groups(df_adjusted, inputs):
+        args = array_args(df_adjusted, inputs, points, calculation_units, atmosphere, conductor_direction)
+        rows = inputs['row'][points]
+        conductor = args[-1]
+        results[points, 0], results[points, 1] = app.load_dump_array(
+            args[0], args[1], df_adjusted['normal temperature rating'].values[rows].astype(float),
+            df_adjusted['emergency temperature rating'].values[rows].astype(float), *args[3:], conductor.mcp,
+            df_adjusted['duration (minutes)'].values[rows].astype(float))
+    return results
+
+
+def engine_c_SSRating_ephemeris(app, df_scalar, inputs):
+    app.solar_ephemeris = ieee738.SolarEphemeris(maxsize=64)
+    try:
+        return engine_c_SSRating(app, df_scalar, inputs)
+    finally:
+        app.solar_ephemeris = None
+
+
+# engine name: (function, reference it is compared against, conductor_rows input it takes)
+engines = {
+    'c_SSRating': (engine_c_SSRating, 'steady state', 'scalar'),
+    'c_SSRating_array': (engine_c_SSRating_array, 'steady state', 'table'),
+    'c_SSRating_ephemeris': (engine_c_SSRating_ephemeris, 'steady state', 'scalar'),
+    'load_dump': (engine_load_dump, 'load dump', 'scalar'),
+    'load_dump_array': (engine_load_dump_array, 'load dump', 'table'),
+}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def subset(inputs, points):
+    return {key: value[:points] for key, value in inputs.items()}
+
+
+def generate(args):
+    app = ieee738.IEEE738()
+    rows = conductor_rows(app)
+    inputs = generate_inputs(rows['table'], args.points, args.seed)
+    golden = {'version': np.array(ieee738.ver), 'seed': np.array(args.seed)}
+    golden.update({'input ' + key: value for key, value in inputs.items()})
+
+    golden['steady state'], golden['steady state time'] = timed(engine_c_SSRating, app, rows['scalar'], inputs)
+    print(f"steady state: {args.points} points {golden['steady state time']:.3f} s")
+
+    # the scalar load dump solver is slow, only the first load_dump_points points are used
+    inputs_load_dump = subset(inputs, args.load_dump_points)
+    for true_to_standard in (False, True):
+        app.true_to_standard = true_to_standard
+        key = f'load dump {true_to_standard}'
+        golden[key], golden[key + ' time'] = timed(engine_load_dump, app, rows['scalar'], inputs_load_dump)
+        print(f"load dump (true_to_standard={true_to_standard}): {args.load_dump_points} points "
+              f"{golden[key + ' time']:.3f} s")
+
+    np.savez_compressed(args.output, **golden)
+    return 0
+
+
+def check(args):
+    app = ieee738.IEEE738()
+    rows = conductor_rows(app)
+    failed = False
+
+    with np.load(args.golden) as archive:
+        golden = {key: archive[key] for key in archive.files}
+    inputs = {key[len('input '):]: value for key, value in golden.items() if key.startswith('input ')}
+
+    for name in args.engine:
+        func, reference, frame = engines[name]
+        cases = [('steady state', None)] if reference == 'steady state' else \
+            [(f'load dump {true_to_standard}', true_to_standard) for true_to_standard in (False, True)]
+        for key, true_to_standard in cases:
+            if true_to_standard is not None:
+                app.true_to_standard = true_to_standard
+            expected = golden[key]
+            result, elapsed = timed(func, app, rows[frame], subset(inputs, expected.shape[0]))
+
+            both_nan = np.isnan(expected) & np.isnan(result)
+            difference = np.where(both_nan, 0, np.abs(result - expected))
+            outside = ~(difference <= args.atol + args.rtol * np.abs(expected))
+            failed |= bool(outside.any())
+            relative = np.nanmax(difference / np.maximum(np.abs(expected), 1e-12)) if expected.size else 0
+            print(f"{name:<22}{key:<22}points {expected.shape[0]:>6}  max abs {np.nanmax(difference):.3g} A  "
+                  f"max rel {relative:.3g}  outside tolerance {int(outside.sum()):>5}  "
+                  f"speedup {float(golden[key + ' time']) / elapsed:.1f}x")
+
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='IEEE 738 golden dataset equivalence harness')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    parser_generate = commands.add_parser('generate', help='store reference results of the scalar path')
+    parser_generate.add_argument('--output', default='golden.npz')
+    parser_generate.add_argument('--points', type=int, default=5000, help='steady state points')
+    parser_generate.add_argument('--load-dump-points', type=int, default=200, help='load dump points')
+    parser_generate.add_argument('--seed', type=int, default=738)
+
+    parser_check = commands.add_parser('check', help='compare engines against the reference results')
+    parser_check.add_argument('--golden', default='golden.npz')
+    parser_check.add_argument('--engine', nargs='+', choices=list(engines),
+                              default=['c_SSRating_array', 'load_dump_array'])
+    parser_check.add_argument('--rtol', type=float, default=1e-6, help='relative tolerance')
+    parser_check.add_argument('--atol', type=float, default=1e-3, help='absolute tolerance (A)')
+
+    args = parser.parse_args(argv)
+    # openpyxl warns about workbook features it drops on read (data validation, conditional formatting), the
+    # values are not affected
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+    if args.command == 'generate':
+        return generate(args)
+    return check(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
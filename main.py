@@ -28,15 +28,34 @@ email: mark@shuck.engineering
 
 import numpy as np
 import pandas as pd
+import contextlib
 import datetime
+import hashlib
+import itertools
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import scipy.optimize as optimize
 
 import UnitConversion as Unc
 from openpyxl import Workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+try:
+    import pyarrow.feather as feather  # optional, Parquet/Feather export
+    import pyarrow.parquet as parquet
+except ImportError:
+    feather = None
+    parquet = None
+
 uc = Unc.UnitConvert()
 
+logger = logging.getLogger('ieee738')
+
 ver = 'v0.3.0'
 
 degree_sign = u'\N{DEGREE SIGN}'
@@ -46,33 +65,701 @@ degree_sign = u'\N{DEGREE SIGN}'
 # add input verification that input dataframe contains enough & proper data to perform all calculations.
 
 
+class ConductorParameters:
+    """
+    Immutable per-conductor parameters used by the rating calculations, built once per conductor from the
+    unit_conversion output instead of rebuilding a resistance dataframe on every call.
+    Resistance at temperature T (C) is resistance_slope * T + resistance_intercept (ohm per unit length)
+    """
+    __slots__ = ('calculation_units', 'diameter', 'projection', 'resistance_slope', 'resistance_intercept', 'mcp',
+                 'emissivity', 'solar_absorptivity')
+
+    def __init__(self, calculation_units, diameter, projection, resistance_slope, resistance_intercept, mcp,
+                 emissivity, solar_absorptivity):
+        """
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param diameter: Conductor diameter (mm or in)
+        :param projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
+        :param resistance_slope: change in resistance per degree (ohm/C per m or ft)
+        :param resistance_intercept: resistance at 0 C (ohm per m or ft)
+        :param mcp: conductor heat capacity
+        :param emissivity: Emissivity
+        :param solar_absorptivity: Solar absorptivity
+        """
+        for name, value in zip(self.__slots__, (calculation_units, diameter, projection, resistance_slope,
+                                                resistance_intercept, mcp, emissivity, solar_absorptivity)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self):
+        values = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({values})'
+
+    @classmethod
+    def stack(cls, conductors, column=False):
+        """
+        Combines several conductors into one array-backed record (one element per conductor) so that many lines
+        can be evaluated together
+        :param conductors: list of ConductorParameters sharing the same calculation units
+        :param column: shape the arrays (n, 1) to broadcast conductors against a row of calculation points
+        :return: ConductorParameters holding numpy arrays
+        """
+        conductors = list(conductors)
+        units = {uc.units_lookup[c.calculation_units] for c in conductors}
+        if len(units) != 1:
+            raise ValueError('conductors must share the same calculation units')
+        values = [np.array([getattr(c, name) for c in conductors], dtype=float) for name in cls.__slots__[1:]]
+        if column:
+            values = [value[:, None] for value in values]
+        return cls(conductors[0].calculation_units, *values)
+
+    def take(self, indices):
+        """
+        Selects conductors from an array-backed record (stack), conductors may repeat
+        :param indices: positions of the conductors in the record
+        :return: ConductorParameters holding numpy arrays, one element per index
+        """
+        return type(self)(self.calculation_units, *[np.asarray(getattr(self, name))[indices]
+                                                    for name in self.__slots__[1:]])
+
+    @classmethod
+    def from_adjusted(cls, df_adjusted, _idx=0):
+        """
+        Builds conductor parameters from a row of the unit_conversion output
+        :param df_adjusted: data frame containing all configuration parameters adjusted to required units
+        :param _idx: index (row) for dataframe
+        :return: ConductorParameters
+        """
+        projection = None
+        calculation_units = df_adjusted.at[_idx, 'calculation units']
+        diameter = df_adjusted.at[_idx, 'Metal OD']
+
+        if uc.units_lookup[calculation_units] == uc.metric_value:
+            projection = diameter / 1000
+        elif uc.units_lookup[calculation_units] == uc.imperial_value:
+            projection = diameter / 12
+
+        resistance_distance = df_adjusted.at[_idx, 'resistance distance']
+        high_resistance = df_adjusted.at[_idx, 'high resistance Ω/unit'] / resistance_distance
+        low_resistance = df_adjusted.at[_idx, 'low resistance Ω/unit'] / resistance_distance
+        high_resistance_temperature = df_adjusted.at[_idx, 'high resistance temperature']
+        low_resistance_temperature = df_adjusted.at[_idx, 'low resistance temperature']
+
+        resistance_slope = (high_resistance - low_resistance) / (high_resistance_temperature -
+                                                                 low_resistance_temperature)
+        resistance_intercept = low_resistance - resistance_slope * low_resistance_temperature
+
+        return cls(calculation_units, diameter, projection, resistance_slope, resistance_intercept,
+                   IEEE738.c_mcp(df_adjusted, _idx), df_adjusted.at[_idx, 'emissivity'],
+                   df_adjusted.at[_idx, 'solar absorptivity'])
+
+
+class SolarEphemeris:
+    """
+    Precomputed solar geometry tables, one per latitude (and calculation units/atmosphere for Qs).
+    Solar altitude, azimuth and Qs are tabulated for every day of the year and time of day at a fixed resolution,
+    lookups return the nearest tabulated time. The least recently used latitudes are evicted once more than
+    maxsize tables are held.
+    """
+
+    def __init__(self, maxsize=16, resolution=5):
+        """
+        :param maxsize: maximum number of latitude tables kept in memory
+        :param resolution: time of day resolution of the tables (minutes)
+        """
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.tables = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def table(self, latitude, calculation_units, atmosphere):
+        """
+        Returns the solar table for a latitude, calculating it when it is not cached
+        :param latitude: latitude
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :return: dict of 'solar altitude' (degrees), 'solar azimuth' (degrees), 'Qs' (W/m^2 or W/ft^2) arrays,
+        indexed [day of year - 1, time of day step]
+        """
+        key = (float(latitude), uc.units_lookup[calculation_units], atmosphere)
+        if key in self.tables:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return self.tables[key]
+        self.misses += 1
+
+        day_of_year = np.arange(1, 367)[:, None]
+        hour = np.arange(0, 24 * 60 + self.resolution, self.resolution)[None, :] / 60 * 100
+
+        latitude_rad = np.radians(latitude)
+        delta = IEEE738.c_delta(day_of_year)
+        omega = IEEE738.c_omega(hour)
+        solar_altitude = np.degrees(np.arcsin(np.cos(latitude_rad) * np.cos(delta) * np.cos(omega) +
+                                              np.sin(latitude_rad) * np.sin(delta)))
+        chi = IEEE738.c_chi(omega, latitude_rad, delta)
+        solar_azimuth = IEEE738.c_solar_constant(omega, chi) + np.degrees(np.arctan(chi))
+        aa, bb, cc, dd, ee, ff, gg = IEEE738.c_Qs_coefficients(calculation_units, atmosphere)
+        radiated_heat_flux_rate = aa + bb * solar_altitude + cc * solar_altitude ** 2 + dd * solar_altitude ** 3 + \
+            ee * solar_altitude ** 4 + ff * solar_altitude ** 5 + gg * solar_altitude ** 6
+
+        table = {'solar altitude': solar_altitude, 'solar azimuth': solar_azimuth, 'Qs': radiated_heat_flux_rate}
+        self.tables[key] = table
+        if len(self.tables) > self.maxsize:
+            self.tables.popitem(last=False)
+        return table
+
+    def lookup(self, latitude, calculation_units, atmosphere, day_of_year, hour):
+        """
+        Looks up solar altitude, azimuth and Qs, scalar or array inputs. Hours between two tabulated times are rounded
+        to the nearest one (resolution minutes), values are not interpolated.
+        :param latitude: latitude
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :param day_of_year: Day of Year (1 - 366), ex: Jan 21 day_of_year = 21, Feb 12 day_of_year = 43
+        :param hour: Hour of day (0 - 2400)
+        :return: solar altitude (degrees), solar azimuth (degrees), Qs (W/m^2 or W/ft^2)
+        """
+        day_of_year = np.asarray(day_of_year)
+        hour = np.asarray(hour, dtype=float)
+        if np.any((day_of_year < 1) | (day_of_year > 366)):
+            raise ValueError(f'day of year must be between 1 and 366, got {day_of_year}')
+        if np.any(~((hour >= 0) & (hour <= 2400))):
+            raise ValueError(f'hour must be between 0 and 2400, got {hour}')
+        table = self.table(latitude, calculation_units, atmosphere)
+        i = day_of_year.astype(int) - 1
+        j = np.rint(hour / 100 * 60 / self.resolution).astype(int)
+        return table['solar altitude'][i, j][()], table['solar azimuth'][i, j][()], table['Qs'][i, j][()]
+
+
+class TraceArray:
+    """
+    Preallocated structured array capturing the intermediate heat balance values of a vectorized calculation.
+    Passed to the calculation helpers in place of the dataframe, every df.at[_idx, column] = value write stores a
+    whole array (or broadcast scalar) into the matching field in one step. Messages written to 'Error' (ex. invalid
+    dates in c_day_of_year) are kept as text shared by all points.
+    """
+    columns = ('qc heat loss', 'qc0', 'qc1', 'qc2', 'uf', 'kf', 'pf', 'Qse', 'theta', 'hc: solar altitude', 'delta',
+               'omega', 'chi', 'qs heat gain', 'solar altitude correction factor', 'qr heat loss', 'day of year',
+               'k angle', 'solar azimuth constant', 'solar azimuth', 'Qs', 'conductor resistance', 'rating daytime',
+               'rating nighttime')
+
+    def __init__(self, shape):
+        """
+        :param shape: shape of the calculation results
+        """
+        self.data = np.full(shape, np.nan, dtype=[(column, float) for column in self.columns])
+        self.error = np.str_('')
+
+    @property
+    def at(self):
+        return self
+
+    def __getitem__(self, key):
+        _, column = key
+        if column == 'Error':
+            return self.error
+        return self.data[column]
+
+    def __setitem__(self, key, value):
+        _, column = key
+        if column == 'Error':
+            self.error = np.str_(value)
+        elif column in self.columns:
+            self.data[column][...] = value
+
+    def to_dict(self):
+        """
+        :return: dict of column name: flattened array, ready to assign to a dataframe, 'Error' is only included when
+        a message was written
+        """
+        values = {column: self.data[column].ravel() for column in self.columns}
+        if self.error:
+            values['Error'] = self.error.strip()
+        return values
+
+
+class Instrumentation:
+    """
+    Records wall time per calculation stage (unit_conversion, grid, steady state, load dump, frames, export) and the
+    number of c_SSRating evaluations performed by each minimize_scalar call of c_initial_temp and load_dump.
+    Attach an instance to IEEE738.instrumentation to enable it, times and counts are also kept per conductor (label)
+    so slow conductors can be singled out. c_reporting_parallel workers record each pair into a fresh copy that is
+    merged back into the caller's instance. export_excel and export_excel_stream are static, time them with
+    app.stage('export').
+    """
+
+    def __init__(self):
+        self.label = None  # conductor currently being rated, set by the reporting methods
+        self.stages = {}
+        self.solvers = {}
+        self.conductors = {}
+
+    def reset(self):
+        self.__init__()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Times the enclosed block and adds it to stage name
+        :param name: stage name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            record = self.stages.setdefault(name, {'calls': 0, 'time': 0.0})
+            record['calls'] += 1
+            record['time'] += elapsed
+            if self.label is not None:
+                conductor = self.conductors.setdefault(self.label, {})
+                conductor[name] = conductor.get(name, 0.0) + elapsed
+
+    def count(self, name, evaluations):
+        """
+        Adds the function evaluations of one solver call
+        :param name: solver name, ex. 'load_dump day'
+        :param evaluations: number of evaluations (scipy result.nfev)
+        """
+        record = self.solvers.setdefault(name, {'calls': 0, 'evaluations': 0, 'max evaluations': 0})
+        record['calls'] += 1
+        record['evaluations'] += int(evaluations)
+        record['max evaluations'] = max(record['max evaluations'], int(evaluations))
+        if self.label is not None:
+            conductor = self.conductors.setdefault(self.label, {})
+            conductor[name + ' evaluations'] = conductor.get(name + ' evaluations', 0) + int(evaluations)
+
+    def merge(self, other):
+        """
+        Adds the stage times, solver counts and per conductor breakdown recorded by another instance
+        :param other: Instrumentation, ex. the copy returned by a c_reporting_parallel worker
+        """
+        for name, record in other.stages.items():
+            total = self.stages.setdefault(name, {'calls': 0, 'time': 0.0})
+            total['calls'] += record['calls']
+            total['time'] += record['time']
+        for name, record in other.solvers.items():
+            total = self.solvers.setdefault(name, {'calls': 0, 'evaluations': 0, 'max evaluations': 0})
+            total['calls'] += record['calls']
+            total['evaluations'] += record['evaluations']
+            total['max evaluations'] = max(total['max evaluations'], record['max evaluations'])
+        for label, record in other.conductors.items():
+            conductor = self.conductors.setdefault(label, {})
+            for name, value in record.items():
+                conductor[name] = conductor.get(name, 0) + value
+
+    def report(self):
+        """
+        :return: dict with stage times, solver evaluation counts and the per conductor breakdown
+        """
+        stages = {name: dict(record, mean=record['time'] / record['calls']) for name, record in self.stages.items()}
+        solvers = {name: dict(record, mean=record['evaluations'] / record['calls'])
+                   for name, record in self.solvers.items()}
+        conductors = {label: dict(record) for label, record in self.conductors.items()}
+        return {'stages': stages, 'solvers': solvers, 'conductors': conductors}
+
+
+class ConductorCatalog:
+    """
+    Index over the conductor list from import_conductor, built once. Every prefix of (conductor spec, size,
+    conductor stranding, core stranding) maps to the matching catalog rows and to the distinct values of the next
+    level, so conductors are resolved with dictionary lookups instead of filtering the whole dataframe.
+    Missing stranding values (NaN) are indexed as None.
+    """
+    levels = ('Conductor Spec', 'Size', 'Cond Strand', 'Core Strand')
+
+    def __init__(self, df_conductor_list, df_spec_list):
+        """
+        :param df_conductor_list: conductor catalog (import_conductor)
+        :param df_spec_list: conductor specifications (import_conductor)
+        """
+        self.conductor_list = df_conductor_list
+        self.spec_list = df_spec_list
+        self.rows = {(): list(range(df_conductor_list.shape[0]))}
+        self.children = {}
+
+        values = zip(*[df_conductor_list[level].tolist() for level in self.levels])
+        for _pos, key in enumerate(values):
+            key = self.key(*key)
+            for depth in range(len(self.levels)):
+                prefix = key[:depth]
+                children = self.children.setdefault(prefix, [])
+                if key[depth] not in children:
+                    children.append(key[depth])
+                self.rows.setdefault(key[:depth + 1], []).append(_pos)
+
+        self.specs = {conductor_spec: df_spec_list[df_spec_list['Conductor Spec'] == conductor_spec].reset_index(
+            drop=True) for conductor_spec in self.children.get((), [])}
+
+    @staticmethod
+    def key(*keys):
+        return tuple(None if pd.isna(value) else value for value in keys)
+
+    def choices(self, *keys):
+        """
+        :param keys: leading levels already selected (spec, size, ...)
+        :return: distinct values of the next level in catalog order
+        """
+        return list(self.children.get(self.key(*keys), []))
+
+    def count(self, *keys):
+        """
+        :param keys: leading levels (spec, size, ...)
+        :return: number of conductors matching the keys
+        """
+        return len(self.rows.get(self.key(*keys), []))
+
+    def lookup(self, *keys):
+        """
+        :param keys: leading levels (spec, size, cond strand, core strand), as many as needed to identify the conductor
+        :return: matching conductor rows and the conductor specification, same as demo.select_conductor
+        (copies, changing them does not alter the catalog)
+        """
+        key = self.key(*keys)
+        if key not in self.rows:
+            raise KeyError(f'{key} is not in the conductor catalog')
+        df_conductor = self.conductor_list.iloc[self.rows[key]].reset_index(drop=True)
+        return df_conductor, self.specs[key[0]].copy()
+
+
+class RatingTable:
+    """
+    Precomputed steady state ratings of one conductor and configuration on a grid of ambient air temperature (C),
+    wind speed (calculation units), wind angle (degrees) and optionally hour of day. Lookups interpolate
+    multilinearly between the grid points instead of solving the heat balance. max_error holds the largest
+    difference to c_SSRating measured at the cell centers when the table was built (Amps), an estimate of the
+    interpolation error rather than a bound (see IEEE738.c_rating_table).
+    """
+    axis_names = ('ambient air temperature', 'wind speed', 'wind angle', 'hour')
+
+    def __init__(self, axes, rating_day, rating_night, info=None, max_error=None):
+        """
+        :param axes: dict of axis name (axis_names order, hour optional) to increasing grid values
+        :param rating_day: day ratings, one dimension per axis
+        :param rating_night: night ratings, one dimension per axis
+        :param info: conductor/configuration description (json serializable values)
+        :param max_error: {'rating daytime': A, 'rating nighttime': A} interpolation error at the cell centers
+        """
+        if tuple(axes) not in (self.axis_names[:3], self.axis_names):
+            raise ValueError(f'axes must be {self.axis_names[:3]} with optional hour')
+        self.axes = {name: np.asarray(values, dtype=float) for name, values in axes.items()}
+        shape = tuple(values.size for values in self.axes.values())
+        for name, values in self.axes.items():
+            if values.ndim != 1 or values.size < 2 or np.any(np.diff(values) <= 0):
+                raise ValueError(f'{name} must hold at least two increasing values')
+        self.rating_day = np.asarray(rating_day, dtype=float)
+        self.rating_night = np.asarray(rating_night, dtype=float)
+        if self.rating_day.shape != shape or self.rating_night.shape != shape:
+            raise ValueError(f'ratings must have the shape of the axes {shape}')
+        self.ratings = np.stack([self.rating_day, self.rating_night], axis=-1)  # interpolated in one pass
+        self.corners = np.array(list(itertools.product((0, 1), repeat=len(shape))), dtype=bool)
+        self.info = dict(info or {})
+        self.max_error = dict(max_error or {})
+
+    def __repr__(self):
+        axes = ', '.join(f'{name}={values[0]:g}..{values[-1]:g} ({values.size})' for name, values in self.axes.items())
+        return f'{type(self).__name__}({axes})'
+
+    def interpolate(self, values, points, extrapolate=False):
+        """
+        Multilinear interpolation of a table
+        :param values: array with one leading dimension per axis (ex. ratings), trailing dimensions are kept
+        :param points: one value/array per axis, broadcast against each other
+        :param extrapolate: extend the edge cells linearly, otherwise points outside the grid return nan
+        :return: interpolated values, shape of the broadcast points followed by the trailing dimensions of values
+        """
+        points = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in points])
+        n = len(points)
+        # position of a grid point in the flattened table is sum(index * stride)
+        strides = np.cumprod((values.shape[1:n] + (1,))[::-1])[::-1]
+        base = 0
+        weight = 1
+        outside = False
+        for axis, x, stride, corner in zip(self.axes.values(), points, strides, self.corners.T):
+            i = np.minimum(np.maximum(np.searchsorted(axis, x, side='right') - 1, 0), axis.size - 2)
+            t = ((x - axis[i]) / (axis[i + 1] - axis[i]))[..., None]
+            base = base + i * stride
+            # weight of every cell corner, t on the upper side of the axis and 1 - t on the lower side
+            weight = weight * np.where(corner, t, 1 - t)
+            outside = outside | (x < axis[0]) | (x > axis[-1])
+
+        corner_values = values.reshape((-1,) + values.shape[n:])[np.asarray(base)[..., None] + self.corners @ strides]
+        expand = (...,) + (None,) * (values.ndim - n)
+        result = np.sum(weight[expand] * corner_values, axis=np.ndim(base))
+        if not extrapolate:
+            result = np.where(np.asarray(outside)[expand], np.nan, result)
+        return result
+
+    def lookup(self, ambient_air_temp, wind_speed, wind_angle, hour=None, extrapolate=False):
+        """
+        Interpolated steady state ratings, scalar or array inputs
+        :param ambient_air_temp: Ambient air temperature (C)
+        :param wind_speed: Wind speed (m/s or ft/hr, table calculation units)
+        :param wind_angle: Angle between conductor and applied wind (degrees)
+        :param hour: Hour of day, required when the table has an hour axis
+        :param extrapolate: extend the edge cells linearly, otherwise points outside the grid return nan
+        :return: day rating, night rating (Amps)
+        """
+        points = [ambient_air_temp, wind_speed, wind_angle]
+        if 'hour' in self.axes:
+            if hour is None:
+                raise ValueError('hour is required, the table has an hour axis')
+            points.append(hour)
+        elif hour is not None:
+            raise ValueError(f'the table was built for hour {self.info.get("hour")}, it has no hour axis')
+        ratings = self.interpolate(self.ratings, points, extrapolate)
+        return ratings[..., 0][()], ratings[..., 1][()]
+
+    def save(self, filename_):
+        """
+        Writes the table to a compressed npz archive (no pickled objects)
+        :param filename_: file name without extension
+        :return: file written
+        """
+        arrays = {'axis_names': np.array(list(self.axes), dtype=str), 'rating_day': self.rating_day,
+                  'rating_night': self.rating_night,
+                  'info': np.array(json.dumps({'info': self.info, 'max_error': self.max_error}))}
+        for _pos, values in enumerate(self.axes.values()):
+            arrays[f'axis_{_pos}'] = values
+        np.savez_compressed(filename_ + '.npz', **arrays)
+        return filename_ + '.npz'
+
+    @classmethod
+    def load(cls, filename_):
+        """
+        :param filename_: file name without extension
+        :return: RatingTable
+        """
+        with np.load(filename_ + '.npz', allow_pickle=False) as data:
+            axes = {str(name): data[f'axis_{_pos}'] for _pos, name in enumerate(data['axis_names'])}
+            meta = json.loads(str(data['info']))
+            return cls(axes, data['rating_day'], data['rating_night'], meta['info'], meta['max_error'])
+
+
+class IncrementalCache:
+    """
+    Intermediate results of c_reporting/c_grid_ratings kept between runs (IEEE738.incremental) for iterating on
+    configurations. Every intermediate is stored under the values of the inputs it depends on (dependencies, the
+    SolarEphemeris object in use included) and tabulated over the temperatures it is evaluated at (axes). A run
+    after a configuration change only evaluates the intermediates whose inputs changed, a new ambient range or
+    temperature increment only evaluates the temperatures that were not evaluated before. The least recently used
+    entries are evicted once more than maxsize are held.
+    """
+    dependencies = {
+        'Qs': ('calculation units', 'solar absorptivity', 'elevation', 'atmosphere', 'latitude', 'day', 'month', 'year',
+               'hour', 'conductor direction', 'projection', 'solar ephemeris'),
+        'conductor resistance': ('resistance slope', 'resistance intercept'),
+        'Qc': ('calculation units', 'diameter', 'elevation', 'wind angle', 'wind speed'),
+        'Qr': ('calculation units', 'diameter', 'emissivity'),
+        'load dump': ('calculation units', 'diameter', 'emissivity', 'solar absorptivity', 'elevation', 'atmosphere',
+                      'latitude', 'day', 'month', 'year', 'hour', 'conductor direction', 'projection',
+                      'solar ephemeris', 'resistance slope', 'resistance intercept', 'mcp', 'emergency wind angle',
+                      'emergency wind speed', 'normal temperature rating', 'emergency temperature rating',
+                      'duration (minutes)', 'true to standard'),
+    }
+    axes = {
+        'Qs': (),
+        'conductor resistance': ('conductor temperature',),
+        'Qc': ('ambient air temperature', 'conductor temperature'),
+        'Qr': ('ambient air temperature', 'conductor temperature'),
+        'load dump': ('ambient air temperature',),
+    }
+
+    def __init__(self, maxsize=4096):
+        """
+        :param maxsize: maximum number of (intermediate, inputs) entries kept in memory
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.evaluated = dict.fromkeys(self.dependencies, 0)  # points calculated, per intermediate
+        self.reused = dict.fromkeys(self.dependencies, 0)  # points taken from earlier runs, per intermediate
+
+    def clear(self):
+        self.entries.clear()
+        self.evaluated = dict.fromkeys(self.dependencies, 0)
+        self.reused = dict.fromkeys(self.dependencies, 0)
+
+    def values(self, name, inputs, points, calculate):
+        """
+        Returns an intermediate for several rows (conductors) on the grid of points, only the points missing from the
+        cache are calculated, with one call for all rows
+        :param name: intermediate, key of dependencies
+        :param inputs: list of dicts of input name to value, one per row, holding at least dependencies[name]
+        :param points: temperatures (C) for every axis of the intermediate, 1-D arrays in axes[name] order
+        :param calculate: function called with the row of every missing point followed by one flat array per axis
+        holding the missing points, returns their values (leading dimension one per point, trailing dimensions kept)
+        :return: values, one row per inputs followed by one dimension per axis (np.ix_ grid of points) and the
+        trailing dimensions
+        """
+        # temperatures from np.arange with different bounds/increments are matched after rounding
+        points = [np.round(np.asarray(x, dtype=float), 9) for x in points]
+        requests = []
+        for row in inputs:
+            key = (name,) + tuple(row[column] for column in self.dependencies[name])
+            entry = self.entries.get(key)
+            if entry is None:
+                axes = [np.unique(x) for x in points]
+                entry = {'axes': axes, 'values': None, 'known': np.zeros([axis.size for axis in axes], dtype=bool)}
+                self.entries[key] = entry
+                if len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+            else:
+                self.entries.move_to_end(key)
+                self.grow(entry, points)
+            grid = np.ix_(*[np.searchsorted(axis, x) for axis, x in zip(entry['axes'], points)])
+            missing = ~entry['known'][grid]
+            missing_pos = np.nonzero(missing) if points else ((np.zeros(int(missing), dtype=int),))
+            requests.append((entry, grid, missing_pos))
+            n_missing = int(np.count_nonzero(missing))
+            self.evaluated[name] += n_missing
+            self.reused[name] += int(missing.size) - n_missing
+
+        counts = [pos[0].size for _, _, pos in requests]
+        if sum(counts):
+            index = np.repeat(np.arange(len(requests)), counts)
+            coords = [np.concatenate([x[pos[axis]] for _, _, pos in requests]) for axis, x in enumerate(points)]
+            result = np.asarray(calculate(index, *coords), dtype=float)
+            result = np.broadcast_to(result, (index.size,) + result.shape[1:])
+            for (entry, grid, missing_pos), part in zip(requests, np.split(result, np.cumsum(counts)[:-1])):
+                if not part.shape[0]:
+                    continue
+                if entry['values'] is None:
+                    entry['values'] = np.full(entry['known'].shape + part.shape[1:], np.nan)
+                cells = tuple(g.reshape(-1)[pos] for g, pos in zip(grid, missing_pos))
+                entry['values'][cells] = part if points else part[0]
+                entry['known'][cells] = True
+        return np.array([entry['values'][grid] for entry, grid, _ in requests])
+
+    @staticmethod
+    def grow(entry, points):
+        """
+        Extends the axes of a cache entry to new temperatures, earlier values keep their place in the grid
+        """
+        axes = [np.union1d(axis, x) for axis, x in zip(entry['axes'], points)]
+        if all(axis.size == old.size for axis, old in zip(axes, entry['axes'])):
+            return
+        grid = np.ix_(*[np.searchsorted(axis, old) for axis, old in zip(axes, entry['axes'])])
+        known = np.zeros([axis.size for axis in axes], dtype=bool)
+        known[grid] = entry['known']
+        if entry['values'] is not None:
+            values = np.full(known.shape + entry['values'].shape[len(axes):], np.nan)
+            values[grid] = entry['values']
+            entry['values'] = values
+        entry['axes'] = axes
+        entry['known'] = known
+
+
 class IEEE738:
     true_to_standard = True
     conductor_temp_steps = 6
+    solar_ephemeris = None  # SolarEphemeris, when set solar position/Qs are looked up instead of calculated
+    trace = False  # diagnostic mode, records intermediate heat balance values alongside the ratings
+    instrumentation = None  # Instrumentation, when set stage times and solver evaluations are recorded
+    incremental = None  # IncrementalCache, when set c_reporting/c_grid_ratings reuse earlier results
+
+    columnar_frames = ('normal', 'emergency', 'load', 'config')  # frames written by export_columnar
+    columnar_formats = ('parquet', 'feather', 'npz')
+    cache_format = 1  # import_cached file layout, cache files of another layout are parsed again
+
+    # default rating table grid (c_rating_table), wind speed in m/s converted to the calculation units
+    rating_table_wind_speed = np.concatenate([np.arange(0, 1, 0.05), np.arange(1, 3, 0.125), np.arange(3, 10.1, 0.5)])
+    rating_table_wind_angle = np.arange(0, 90.1, 2.5)
+
+    # (value column, units column, metric units, imperial units) converted by unit_conversion
+    conductor_wind_list = (
+        ('normal wind speed', 'normal wind speed units', 'm/s', 'ft/hr'),
+        ('emergency wind speed', 'emergency wind speed units', 'm/s', 'ft/hr'),
+    )
+    conductor_wind_angle_list = (
+        ('normal wind angle', 'normal wind angle units', 'deg', 'deg'),
+        ('emergency wind angle', 'emergency wind angle units', 'deg', 'deg')
+    )
+    conductor_length_list = (
+        ('Cond Wire Diameter', 'Cond Wire Diameter Units', 'mm', 'in'),
+        ('Core Wire Diameter', 'Core Wire Diameter Units', 'mm', 'in'),
+        ('Core OD', 'Core OD Units', 'mm', 'in'),
+        ('Metal OD', 'Metal OD Units', 'mm', 'in'),
+        ('resistance distance', 'resistance distance units', 'm', 'ft')
+    )
+    conductor_temp_list = (
+        ('low resistance temperature', 'resistance temperature units', 'C', 'C'),
+        ('high resistance temperature', 'resistance temperature units', 'C', 'C')
+    )
+    conductor_spec_temp_list = (
+        ('normal temperature rating', 'normal temperature rating units', 'C', 'C'),
+        ('emergency temperature rating', 'emergency temperature rating units', 'C', 'C')
+    )
+    config_temp_list = (
+        ('ambient air temperature lower range', 'ambient air temperature units', 'C', 'C'),
+        ('ambient air temperature upper range', 'ambient air temperature units', 'C', 'C'),
+        ('temperature increment', 'ambient air temperature units', 'C', 'C'),
+        ('ambient air temperature', 'ambient air temperature units', 'C', 'C')
+    )
+    config_length_list = (
+        ('elevation', 'elevation units', 'm', 'ft'),
+    )
+
+    direction_lookup_value_ns = 1
+    direction_lookup_value_ew = 2
+
+    direction_lookup = {
+        'n/s': direction_lookup_value_ns,
+        'n-s': direction_lookup_value_ns,
+        'north/south': direction_lookup_value_ns,
+        'north-south': direction_lookup_value_ns,
+        's/n': direction_lookup_value_ns,
+        's-n': direction_lookup_value_ns,
+        'south/north': direction_lookup_value_ns,
+        'South-north': direction_lookup_value_ns,
+
+        'e/w': direction_lookup_value_ew,
+        'e-w': direction_lookup_value_ew,
+        'east/west': direction_lookup_value_ew,
+        'east-west': direction_lookup_value_ew,
+        'w/e': direction_lookup_value_ew,
+        'w-e': direction_lookup_value_ew,
+        'west/east': direction_lookup_value_ew,
+        'west-east': direction_lookup_value_ew,
+    }
 
     # def __init__(self):
 
 
     @staticmethod
-    def import_config(path, sheet_name):
+    def import_config(path, sheet_name, cache=False):
         """
         Imports configuration from Excel file
         :param path: path to Excel file
         :param sheet_name: Excel sheet name with list of configurations (nonconductor based parameters for calculations)
+        :param cache: reuse/keep the parsed configurations in a binary cache file (see import_cached)
         :return: Configurations and parameters listed in file (pandas dataframe)
         """
+        if cache:
+            return IEEE738.import_cached(path, sheet_name, IEEE738.import_config)
         config_list = pd.read_excel(io=path, sheet_name=sheet_name, engine='openpyxl')
         return config_list
 
     @staticmethod
-    def import_conductor(path, sheet_name):
+    def import_conductor(path, sheet_name, cache=False):
         """
         Imports list of conductors & corresponding parameters and conductor specifications (max temp) from Excel file
         and sorts data smallest to largest and A-Z to be used later on
         :param path: path to file
         :param sheet_name: Excel sheet name with list of conductor parameters
+        :param cache: reuse/keep the parsed and sorted catalog in a binary cache file (see import_cached)
         :return: Conductors and parameters listed in file (pandas dataframe)
         """
+        if cache:
+            return IEEE738.import_cached(path, sheet_name, IEEE738.import_conductor)
         # read in list of conductors and corresponding parameters
         conductor_list = pd.read_excel(io=path, sheet_name=sheet_name[0], engine='openpyxl')
         # read temperature ranges for the different conductor specifications (ACCC/ASCR/etc...)
@@ -83,6 +770,127 @@ class IEEE738:
         conductor_spec.sort_values('Conductor Spec', ascending=True, inplace=True)
         return conductor_list, conductor_spec
 
+    @staticmethod
+    def cache_directory():
+        """
+        :return: directory holding the import_cached files, $XDG_CACHE_HOME/ieee738 or ~/.cache/ieee738
+        """
+        return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                            'ieee738')
+
+    @staticmethod
+    def import_cached(path, sheet_name, loader):
+        """
+        Runs an Excel import (import_config/import_conductor) through a cache file so that the workbook is only parsed
+        when it changed. Cache files are kept in the user cache directory (cache_directory), not next to the workbook,
+        named after a hash of the source path, sheet names, import function and file version. A cache file is reused
+        while the source modification time and size are unchanged or, when those changed, while the content hash
+        (sha256) still matches. Cache files are plain npz archives (export_cache), loading one never runs pickle. A
+        cache file that can not be read or written is ignored and the workbook is parsed as usual.
+        :param path: path to Excel file
+        :param sheet_name: sheet name(s) passed to the loader
+        :param loader: import function, called as loader(path, sheet_name)
+        :return: loader result
+        """
+        stat = os.stat(path)
+        key = [os.path.abspath(path), repr(sheet_name), loader.__name__, ver]
+        filename_cache = os.path.join(IEEE738.cache_directory(),
+                                      hashlib.sha256(repr(key).encode()).hexdigest() + '.cache')
+
+        try:
+            header, frames = IEEE738.import_cache(filename_cache)
+        except Exception:  # missing, partial or foreign file, parse the workbook
+            header, frames = None, None
+
+        if header is not None and header['key'] == key:
+            if (header['mtime'], header['size']) == (stat.st_mtime_ns, stat.st_size):
+                return tuple(frames) if header['tuple'] else frames[0]
+
+        with open(path, 'rb') as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+
+        if header is not None and header['key'] == key and header['hash'] == content_hash:
+            data = tuple(frames) if header['tuple'] else frames[0]
+        else:
+            data = loader(path, sheet_name)
+
+        header = {'key': key, 'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': content_hash,
+                  'tuple': isinstance(data, tuple)}
+        try:
+            IEEE738.export_cache(filename_cache, header, list(data) if header['tuple'] else [data])
+        except (OSError, ValueError, TypeError):
+            pass
+
+        return data
+
+    @staticmethod
+    def export_cache(filename_cache, header, frames):
+        """
+        Writes import_cached data as an npz archive that loads without pickle. The JSON header holds the cache key,
+        the source file state and the layout of every frame, each frame is stored as one array for its index and one
+        per column. Object columns (text mixed with numbers/NaN) are stored as JSON text. The archive is written to a
+        temporary file in the cache directory and moved into place, concurrent writers never leave a partial file.
+        :param filename_cache: cache file name
+        :param header: JSON serializable dict
+        :param frames: list of dataframes
+        :return: None
+        """
+        def store(name, values):
+            values = np.asarray(values)
+            if values.dtype == object:
+                arrays[name] = np.array(json.dumps(values.tolist()))
+                return True
+            arrays[name] = values
+            return False
+
+        arrays = {}
+        header = dict(header, format=IEEE738.cache_format, frames=[])
+        for _pos, df in enumerate(frames):
+            json_columns = [store(f'{_pos}_{_col}', df.iloc[:, _col].to_numpy()) for _col in range(df.shape[1])]
+            header['frames'].append({'columns': df.columns.tolist(), 'index name': df.index.name,
+                                     'json index': store(f'{_pos}_index', df.index.to_numpy()),
+                                     'json columns': json_columns})
+        arrays['header'] = np.array(json.dumps(header))
+
+        os.makedirs(os.path.dirname(filename_cache), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(filename_cache), suffix='.tmp', delete=False) as f:
+            filename_tmp = f.name
+        try:
+            with open(filename_tmp, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(filename_tmp, filename_cache)
+        except BaseException:
+            os.remove(filename_tmp)
+            raise
+
+    @staticmethod
+    def import_cache(filename_cache):
+        """
+        Loads a file written by export_cache
+        :param filename_cache: cache file name
+        :return: header dict and list of dataframes, ValueError for a file of another layout
+        """
+        def load(name, is_json):
+            if not is_json:
+                return archive[name]
+            values = json.loads(archive[name].item())
+            result = np.empty(len(values), dtype=object)
+            result[:] = values
+            return result
+
+        with np.load(filename_cache, allow_pickle=False) as archive:
+            header = json.loads(archive['header'].item())
+            if header.get('format') != IEEE738.cache_format:
+                raise ValueError(f'{filename_cache} is not a version {IEEE738.cache_format} cache file')
+            frames = []
+            for _pos, frame in enumerate(header['frames']):
+                index = pd.Index(load(f'{_pos}_index', frame['json index']), name=frame['index name'])
+                df = pd.DataFrame({_col: load(f'{_pos}_{_col}', is_json)
+                                   for _col, is_json in enumerate(frame['json columns'])}, index=index)
+                df.columns = frame['columns']
+                frames.append(df)
+        return header, frames
+
     @staticmethod
     def add_calc_columns(df):
         data = ['qc heat loss', 'qc0', 'qc1', 'qc2', 'uf', 'kf', 'pf', 'Qse', 'theta', 'hc: solar altitude', 'delta',
@@ -91,6 +899,32 @@ class IEEE738:
         df = pd.concat([df.reset_index(drop=True), pd.DataFrame(columns=data)], axis=1)
         return df
 
+    def stage(self, name):
+        """
+        :param name: stage name
+        :return: timing context of the attached Instrumentation, a no-op context when instrumentation is disabled
+        """
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.stage(name)
+
+    def instrument_label(self, df_conductor, df_config=None, columns=('Conductor Spec', 'Name', 'Size')):
+        """
+        Sets the conductor (and configuration) the following stage times and solver counts belong to
+        :param df_conductor: conductor parameters, first row is used, None for stages not tied to a conductor
+        :param df_config: configuration parameters, first row is used
+        :param columns: conductor columns making up the label
+        """
+        if self.instrumentation is None:
+            return
+        if df_conductor is None:
+            self.instrumentation.label = None
+            return
+        label = ' '.join(str(df_conductor.at[0, column]) for column in columns if column in df_conductor.columns)
+        if df_config is not None and 'config name' in df_config.columns:
+            label = f'{label} ({df_config.at[0, "config name"]})'
+        self.instrumentation.label = label
+
     @staticmethod
     def unit_conversion(df_conductor, df_spec, df_config):
 
@@ -114,61 +948,28 @@ class IEEE738:
         elif uc.units_lookup[calculation_units] == uc.imperial_value:
             unit_selection = 3
 
-        conductor_wind_list = (
-            ('normal wind speed', 'normal wind speed units', 'm/s', 'ft/hr'),
-            ('emergency wind speed', 'emergency wind speed units', 'm/s', 'ft/hr'),
-        )
-        conductor_wind_angle_list = (
-            ('normal wind angle', 'normal wind angle units', 'deg', 'deg'),
-            ('emergency wind angle', 'emergency wind angle units', 'deg', 'deg')
-        )
-        conductor_length_list = (
-            ('Cond Wire Diameter', 'Cond Wire Diameter Units', 'mm', 'in'),
-            ('Core Wire Diameter', 'Core Wire Diameter Units', 'mm', 'in'),
-            ('Core OD', 'Core OD Units', 'mm', 'in'),
-            ('Metal OD', 'Metal OD Units', 'mm', 'in'),
-            ('resistance distance', 'resistance distance units', 'm', 'ft')
-        )
-        conductor_temp_list = (
-            ('low resistance temperature', 'resistance temperature units', 'C', 'C'),
-            ('high resistance temperature', 'resistance temperature units', 'C', 'C')
-        )
-        conductor_spec_temp_list = (
-            ('normal temperature rating', 'normal temperature rating units', 'C', 'C'),
-            ('emergency temperature rating', 'emergency temperature rating units', 'C', 'C')
-        )
-        config_temp_list = (
-            ('ambient air temperature lower range', 'ambient air temperature units', 'C', 'C'),
-            ('ambient air temperature upper range', 'ambient air temperature units', 'C', 'C'),
-            ('temperature increment', 'ambient air temperature units', 'C', 'C'),
-            ('ambient air temperature', 'ambient air temperature units', 'C', 'C')
-        )
-        config_length_list = (
-            ('elevation', 'elevation units', 'm', 'ft'),
-        )
-
-        for x in conductor_wind_list:
+        for x in IEEE738.conductor_wind_list:
             value = uc.speed_convert(df_config.at[0, x[0]], df_config.at[0, x[1]], x[unit_selection])
             df_conductor_wind_list.at[0, x[0]] = value
             df_conductor_wind_list.at[0, x[1]] = x[unit_selection]
             df_config_adjusted.drop(columns=x[0], axis=1, inplace=True)
             df_config_adjusted.drop(columns=x[1], axis=1, inplace=True)
 
-        for x in conductor_wind_angle_list:
+        for x in IEEE738.conductor_wind_angle_list:
             value = uc.angle_convert(df_config.at[0, x[0]], df_config.at[0, x[1]], x[unit_selection])
             df_conductor_wind_angle_list.at[0, x[0]] = value
             df_conductor_wind_angle_list.at[0, x[1]] = x[unit_selection]
             df_config_adjusted.drop(columns=x[0], axis=1, inplace=True)
             df_config_adjusted.drop(columns=x[1], axis=1, inplace=True)
 
-        for x in conductor_length_list:
+        for x in IEEE738.conductor_length_list:
             value = uc.length_convert(df_conductor.at[0, x[0]], df_conductor.at[0, x[1]], x[unit_selection])
             df_conductor_length_list.at[0, x[0]] = value
             df_conductor_length_list.at[0, x[1]] = x[unit_selection]
             df_conductor_adjusted.drop(columns=x[0], axis=1, inplace=True)
             df_conductor_adjusted.drop(columns=x[1], axis=1, inplace=True)
 
-        for x in conductor_temp_list:
+        for x in IEEE738.conductor_temp_list:
             value = uc.temp_convert(df_conductor.at[0, x[0]], df_conductor.at[0, x[1]], 'C')
             df_conductor_temp_list.at[0, x[0]] = value
             df_conductor_temp_list.at[0, x[1]] = x[unit_selection]
@@ -178,12 +979,12 @@ class IEEE738:
             except KeyError:
                 None
 
-        for x in conductor_spec_temp_list:
+        for x in IEEE738.conductor_spec_temp_list:
             value = uc.temp_convert(df_spec.at[0, x[0]], df_spec.at[0, x[1]], 'C')
             df_conductor_spec_temp_list.at[0, x[0]] = value
             df_conductor_spec_temp_list.at[0, x[1]] = x[unit_selection]
 
-        for x in config_temp_list:
+        for x in IEEE738.config_temp_list:
             value = uc.temp_convert(df_config.at[0, x[0]], df_config.at[0, x[1]], 'C')
             df_config_temp_list.at[0, x[0]] = value
             df_config_temp_list.at[0, x[1]] = x[unit_selection]
@@ -193,7 +994,7 @@ class IEEE738:
             except KeyError:
                 None
 
-        for x in config_length_list:
+        for x in IEEE738.config_length_list:
             value = uc.length_convert(df_config.at[0, x[0]], df_config.at[0, x[1]], x[unit_selection])
             df_config_length_list.at[0, x[0]] = value
             df_config_length_list.at[0, x[1]] = x[unit_selection]
@@ -215,13 +1016,68 @@ class IEEE738:
 
         return df_adjusted
 
-    def c_steady_state(self, df, calcType=None, _idx=None):
+    @staticmethod
+    def unit_conversion_table(df_conductor, df_spec, df_config):
+        """
+        Multi-row version of unit_conversion. Every conductor row is combined with every configuration row and all
+        unit conversions are done column-wise in one pass, unknown units (ex. missing core dimensions) become 0.
+        Conductor specifications are matched to the conductors by 'Conductor Spec'.
+        :param df_conductor: conductor parameters, one row per conductor
+        :param df_spec: conductor specifications (normal/emergency temperature ratings)
+        :param df_config: configuration parameters, one row per configuration
+        :return: data frame with the same columns as unit_conversion, one row per (configuration, conductor) pair
+        ordered by configuration then conductor, numeric columns typed
+        """
+        n_conductor = df_conductor.shape[0]
+        n_config = df_config.shape[0]
+        df_conductor = df_conductor.iloc[np.tile(np.arange(n_conductor), n_config)].reset_index(drop=True)
+        df_config = df_config.iloc[np.repeat(np.arange(n_config), n_conductor)].reset_index(drop=True)
+        df_spec = df_spec.drop_duplicates('Conductor Spec').reset_index(drop=True)
+        df_spec = df_spec.reindex(pd.Index(df_spec['Conductor Spec']).get_indexer(df_conductor['Conductor Spec']))
+        df_spec = df_spec.reset_index(drop=True)
+
+        units = df_config['calculation units'].map(uc.units_lookup)
+        if units.isna().any():
+            raise Unc.UnitConversionError(
+                f'unknown calculation units: {df_config.loc[units.isna(), "calculation units"].unique().tolist()}')
+        metric = (units == uc.metric_value).values
+
+        columns = {}
+        conversions = (
+            (IEEE738.conductor_wind_list, df_config, 'speed', True),
+            (IEEE738.conductor_wind_angle_list, df_config, 'angle', True),
+            (IEEE738.conductor_length_list, df_conductor, 'length', True),
+            (IEEE738.conductor_temp_list, df_conductor, 'temp', False),
+            (IEEE738.conductor_spec_temp_list, df_spec, 'temp', False),
+            (IEEE738.config_temp_list, df_config, 'temp', False),
+            (IEEE738.config_length_list, df_config, 'length', True),
+        )
+        for conversion_list, df, quantity, calculation_units in conversions:
+            for x in conversion_list:
+                output_units = np.where(metric, x[2], x[3])
+                # temperatures are always calculated in C, the units column follows the calculation units
+                value = uc.convert_array(df[x[0]], df[x[1]], output_units if calculation_units else 'C', quantity,
+                                         errors='nan')
+                columns[x[0]] = value.values
+                columns[x[1]] = output_units
+
+        drop_conductor = [column for x in IEEE738.conductor_length_list + IEEE738.conductor_temp_list
+                          for column in x[:2]]
+        drop_config = [column for x in IEEE738.conductor_wind_list + IEEE738.conductor_wind_angle_list +
+                       IEEE738.config_temp_list + IEEE738.config_length_list for column in x[:2]]
+        df_conductor_adjusted = df_conductor.drop(columns=drop_conductor, errors='ignore')
+        df_config_adjusted = df_config.drop(columns=drop_config, errors='ignore')
+
+        df_adjusted = pd.concat([df_conductor_adjusted, pd.DataFrame(columns), df_config_adjusted], axis=1)
+
+        df_adjusted = df_adjusted.fillna(0).infer_objects()
+
+        return df_adjusted
+
+    def c_steady_state(self, df, calcType=None, _idx=None, conductor=None):
         # Configuration setup
-        conductor_projection = None
         calculation_units = df.at[_idx, 'calculation units']
         elevation = df.at[_idx, 'elevation']
-        emissivity = df.at[_idx, 'emissivity']
-        solar_absorptivity = df.at[_idx, 'solar absorptivity']
         atmosphere = df.at[_idx, 'atmosphere']
         latitude = df.at[_idx, 'latitude']
         day = df.at[_idx, 'day']
@@ -232,27 +1088,13 @@ class IEEE738:
         ambient_air_temp = df.at[_idx, 'ambient air temperature']
         conductor_temperature = df.at[_idx, 'conductor temperature']
 
-        # Conductor setup
-        diameter = df.at[_idx, 'Metal OD']
-
-        if uc.units_lookup[calculation_units] == uc.metric_value:
-            conductor_projection = diameter / 1000
-        elif uc.units_lookup[calculation_units] == uc.imperial_value:
-            conductor_projection = diameter / 12
-
-        d = {'high resistance Ω/unit': [df.at[0, 'high resistance Ω/unit']],  # high resistance
-             'low resistance Ω/unit': [df['low resistance Ω/unit'].values[0]],  # low resistance
-             'resistance temperature unit': [df['resistance temperature units'].values[0]],
-             # resistance distance unit (C, F, K, R)
-             'high resistance temperature': [df['high resistance temperature'].values[0]],
-             # high resistance temp
-             'low resistance temperature': [df['low resistance temperature'].values[0]],  # low resistance temp
-             'resistance distance': [df['resistance distance'].values[0]],  # resistance distance
-             'resistance distance unit': [df['resistance distance units'].values[0]]
-             # resistance distance unit (mile/meter/etc...)
-             }
-
-        conductor_resistance = pd.DataFrame(d)
+        # Conductor setup, built once per conductor by the caller when possible
+        if conductor is None:
+            conductor = ConductorParameters.from_adjusted(df, _idx)
+        emissivity = conductor.emissivity
+        solar_absorptivity = conductor.solar_absorptivity
+        diameter = conductor.diameter
+        conductor_projection = conductor.projection
         # Normal Rating (wind speed and angle variable)
 
         if calcType == 'Emergency':
@@ -267,16 +1109,17 @@ class IEEE738:
                                                                    conductor_wind_speed, emissivity, solar_absorptivity,
                                                                    atmosphere, latitude, day, month, year, hour,
                                                                    conductor_direction, conductor_projection,
-                                                                   conductor_resistance, df, _idx)
+                                                                   conductor, df if self.trace else None, _idx)
+        if not self.trace:
+            # fast path, only the ratings are recorded
+            df.at[_idx, 'rating daytime'] = current_rating_day
+            df.at[_idx, 'rating nighttime'] = current_rating_night
         return current_rating_day, current_rating_night
 
-    def c_load_dump(self, df, _idx):
+    def c_load_dump(self, df, _idx, conductor=None):
         # Configuration setup
-        conductor_projection = None
         calculation_units = df.at[_idx, 'calculation units']
         elevation = df.at[_idx, 'elevation']
-        emissivity = df.at[_idx, 'emissivity']
-        solar_absorptivity = df.at[_idx, 'solar absorptivity']
         atmosphere = df.at[_idx, 'atmosphere']
         latitude = df.at[_idx, 'latitude']
         day = df.at[_idx, 'day']
@@ -291,31 +1134,17 @@ class IEEE738:
         conductor_temp_emergency = df.at[_idx, 'emergency temperature rating']
         conductor_wind_emergency = df.at[_idx, 'emergency wind speed']
 
-        # Conductor setup
-        diameter = df.at[_idx, 'Metal OD']
-
-        if uc.units_lookup[calculation_units] == uc.metric_value:
-            conductor_projection = diameter / 1000
-        elif uc.units_lookup[calculation_units] == uc.imperial_value:
-            conductor_projection = diameter / 12
-
-        d = {'high resistance Ω/unit': [df['high resistance Ω/unit'].values[0]],  # high resistance
-             'low resistance Ω/unit': [df['low resistance Ω/unit'].values[0]],  # low resistance
-             'resistance temperature unit': [df['resistance temperature units'].values[0]],
-             # resistance distance unit (C, F, K, R)
-             'high resistance temperature': [df['high resistance temperature'].values[0]],
-             # high resistance temp
-             'low resistance temperature': [df['low resistance temperature'].values[0]],  # low resistance temp
-             'resistance distance': [df['resistance distance'].values[0]],  # resistance distance
-             'resistance distance unit': [df['resistance distance units'].values[0]]
-             # resistance distance unit (mile/meter/etc...)
-             }
-
-        conductor_resistance = pd.DataFrame(d)
+        # Conductor setup, built once per conductor by the caller when possible
+        if conductor is None:
+            conductor = ConductorParameters.from_adjusted(df, _idx)
+        emissivity = conductor.emissivity
+        solar_absorptivity = conductor.solar_absorptivity
+        diameter = conductor.diameter
+        conductor_projection = conductor.projection
 
         wind_angle = df.at[_idx, 'emergency wind angle']
 
-        mcp = self.c_mcp(df, _idx)
+        mcp = conductor.mcp
 
         duration = df.at[_idx, 'duration (minutes)']
 
@@ -325,7 +1154,7 @@ class IEEE738:
                                                         conductor_wind_emergency, emissivity, solar_absorptivity,
                                                         atmosphere, latitude, day, month, year, hour,
                                                         conductor_direction, conductor_projection,
-                                                        conductor_resistance, mcp, duration)
+                                                        conductor, mcp, duration)
 
         if df is not None:
             df.at[_idx, 'load dump rating daytime'] = load_dump_day
@@ -372,37 +1201,53 @@ class IEEE738:
     def c_reporting(self, df_conductor, df_spec, df_config):
         _idx = 1
 
-        df_adjusted = self.unit_conversion(df_conductor, df_spec, df_config)
+        self.instrument_label(df_conductor, df_config)
 
-        df_adjusted = self.add_calc_columns(df_adjusted)
+        with self.stage('unit_conversion'):
+            df_adjusted = self.unit_conversion(df_conductor, df_spec, df_config)
 
-        temp_range_ambient, temp_range_conductor = self.c_temperature_range(df_adjusted)
+        with self.stage('grid'):
+            df_adjusted = self.add_calc_columns(df_adjusted)
 
-        df = pd.DataFrame(df_adjusted)
+            temp_range_ambient, temp_range_conductor = self.c_temperature_range(df_adjusted)
 
-        total_row = temp_range_ambient.size * temp_range_conductor.size + 1
-        df_N = pd.concat([df] * total_row, axis=0, ignore_index=True)
-        df_E = pd.concat([df] * total_row, axis=0, ignore_index=True)
-        df_L = pd.concat([df] * total_row, axis=0, ignore_index=True)
+            df = pd.DataFrame(df_adjusted)
 
-        for i, element_i in enumerate(temp_range_ambient):
-            for j, element_j in enumerate(temp_range_conductor):
+            conductor = ConductorParameters.from_adjusted(df_adjusted)
 
-                df_N.at[_idx, 'ambient air temperature'] = element_i
-                df_N.at[_idx, 'conductor temperature'] = element_j
-                df_E.at[_idx, 'ambient air temperature'] = element_i
-                df_E.at[_idx, 'conductor temperature'] = element_j
-                df_L.at[_idx, 'ambient air temperature'] = element_i
-                df_L.at[_idx, 'conductor temperature'] = element_j
+            total_row = temp_range_ambient.size * temp_range_conductor.size + 1
+            df_N = pd.concat([df] * total_row, axis=0, ignore_index=True)
+            df_E = pd.concat([df] * total_row, axis=0, ignore_index=True)
+            df_L = pd.concat([df] * total_row, axis=0, ignore_index=True)
 
-                _, _ = self.c_steady_state(df_N, 'Normal', _idx)
-                _, _ = self.c_steady_state(df_E, 'Emergency', _idx)
-                if j == 0:
-                    _, _ = self.c_load_dump(df_L, _idx)
-                else:
-                    df_L.at[_idx, 'load dump rating daytime'] = df_L.at[_idx - 1, 'load dump rating daytime']
-                    df_L.at[_idx, 'load dump rating nighttime'] = df_L.at[_idx - 1, 'load dump rating nighttime']
-                _idx = _idx + 1
+            if not self.trace:
+                # intermediate values are only recorded in trace mode, keep the same output columns
+                df_N = df_N.assign(**{'Qs': np.nan, 'conductor resistance': np.nan})
+                df_E = df_E.assign(**{'Qs': np.nan, 'conductor resistance': np.nan})
+
+        if self.incremental is not None and not self.trace:
+            self.c_incremental_reporting(df_adjusted, df_N, df_E, df_L, temp_range_ambient, temp_range_conductor)
+        else:
+            for i, element_i in enumerate(temp_range_ambient):
+                for j, element_j in enumerate(temp_range_conductor):
+
+                    df_N.at[_idx, 'ambient air temperature'] = element_i
+                    df_N.at[_idx, 'conductor temperature'] = element_j
+                    df_E.at[_idx, 'ambient air temperature'] = element_i
+                    df_E.at[_idx, 'conductor temperature'] = element_j
+                    df_L.at[_idx, 'ambient air temperature'] = element_i
+                    df_L.at[_idx, 'conductor temperature'] = element_j
+
+                    with self.stage('steady state'):
+                        _, _ = self.c_steady_state(df_N, 'Normal', _idx, conductor)
+                        _, _ = self.c_steady_state(df_E, 'Emergency', _idx, conductor)
+                    if j == 0:
+                        with self.stage('load dump'):
+                            _, _ = self.c_load_dump(df_L, _idx, conductor)
+                    else:
+                        df_L.at[_idx, 'load dump rating daytime'] = df_L.at[_idx - 1, 'load dump rating daytime']
+                        df_L.at[_idx, 'load dump rating nighttime'] = df_L.at[_idx - 1, 'load dump rating nighttime']
+                    _idx = _idx + 1
 
         # TODO add polynomial regression to replace nan with none zero.
         #  ex HD Copper 500 @ Tc = 55C & Amb = 40C I = nan
@@ -416,6 +1261,546 @@ class IEEE738:
 
         return df_N, df_E, df_L
 
+    def c_incremental_reporting(self, df_adjusted, df_N, df_E, df_L, temp_range_ambient, temp_range_conductor):
+        """
+        Fills the c_reporting frames (rows 1..n, ambient major) from the intermediates held by self.incremental
+        instead of calculating every grid cell with c_steady_state/c_load_dump, ratings are written to the same
+        columns the loop writes outside of trace mode
+        :param df_adjusted: unit_conversion output of the conductor and configuration
+        :param df_N: normal rating dataframe, row 0 holds the configuration setup
+        :param df_E: emergency rating dataframe
+        :param df_L: load dump rating dataframe
+        :param temp_range_ambient: ambient temperatures (C)
+        :param temp_range_conductor: conductor temperatures (C)
+        """
+        rows = [self.incremental_inputs(df_adjusted)]
+        for df in (df_N, df_E, df_L):
+            df.loc[1:, 'ambient air temperature'] = np.repeat(temp_range_ambient, temp_range_conductor.size)
+            df.loc[1:, 'conductor temperature'] = np.tile(temp_range_conductor, temp_range_ambient.size)
+
+        with self.stage('steady state'):
+            for df, wind in ((df_N, 'normal'), (df_E, 'emergency')):
+                rating_day, rating_night = self.c_incremental_steady_state(rows, wind, temp_range_ambient,
+                                                                           temp_range_conductor)
+                df.loc[1:, 'rating daytime'] = rating_day[0]
+                df.loc[1:, 'rating nighttime'] = rating_night[0]
+
+        with self.stage('load dump'):
+            # load dump only depends on ambient temperature, repeated for every conductor temperature
+            load_dump_day, load_dump_night = self.c_incremental_load_dump(rows, temp_range_ambient)
+            df_L.loc[1:, 'load dump rating daytime'] = np.repeat(load_dump_day[0], temp_range_conductor.size)
+            df_L.loc[1:, 'load dump rating nighttime'] = np.repeat(load_dump_night[0], temp_range_conductor.size)
+            # c_reporting records the duration on the first conductor temperature of every ambient temperature
+            first = np.tile(np.arange(temp_range_conductor.size) == 0, temp_range_ambient.size)
+            df_L.loc[1:, 'load dump duration'] = np.where(first, df_adjusted.at[0, 'duration (minutes)'], np.nan)
+
+    def c_reporting_grid(self, df_conductor, df_spec, df_config):
+        """
+        Grid version of c_reporting. Builds the ambient x conductor temperature mesh once, evaluates the normal and
+        emergency ratings for every cell as whole arrays and assembles the result frames in one step.
+        Load dump ratings are solved for every ambient temperature at once with load_dump_array.
+        Returns the same df_N/df_E/df_L columns as c_reporting, intermediate heat balance columns are only filled in
+        trace mode.
+        :param df_conductor: conductor parameters (single conductor)
+        :param df_spec: conductor specification (normal/emergency temperature ratings)
+        :param df_config: configuration parameters (single configuration)
+        :return: normal, emergency and load dump rating dataframes
+        """
+        self.instrument_label(df_conductor, df_config)
+
+        with self.stage('unit_conversion'):
+            df_adjusted = self.unit_conversion(df_conductor, df_spec, df_config)
+
+        return self.c_grid_ratings(df_adjusted)
+
+    def c_grid_ratings(self, df_adjusted):
+        """
+        Evaluates the ambient x conductor temperature grid for every row of df_adjusted at once, rows are conductors
+        sharing the same configuration and conductor specification (one temperature grid). Air properties and solar
+        heat gain are calculated once for the grid and broadcast across conductors.
+        :param df_adjusted: data frame containing all configuration parameters adjusted to required units,
+        one row per conductor
+        :return: normal, emergency and load dump rating dataframes, conductors in row order
+        """
+        with self.stage('grid'):
+            df_adjusted = self.add_calc_columns(df_adjusted)
+
+            temp_range_ambient, temp_range_conductor = self.c_temperature_range(df_adjusted)
+
+            # ambient temperature is the outer loop of c_reporting, keep the same row order
+            ambient_temp, conductor_temp = np.meshgrid(temp_range_ambient, temp_range_conductor, indexing='ij')
+            ambient_temp = ambient_temp.ravel()
+            conductor_temp = conductor_temp.ravel()
+
+            calculation_units = df_adjusted.at[0, 'calculation units']
+            elevation = df_adjusted.at[0, 'elevation']
+            atmosphere = df_adjusted.at[0, 'atmosphere']
+            latitude = df_adjusted.at[0, 'latitude']
+            day = df_adjusted.at[0, 'day']
+            month = df_adjusted.at[0, 'month']
+            year = df_adjusted.at[0, 'year']
+            hour = df_adjusted.at[0, 'hour']
+            conductor_direction = df_adjusted.at[0, 'conductor direction']
+            conductor_temp_normal = df_adjusted.at[0, 'normal temperature rating']
+            conductor_temp_emergency = df_adjusted.at[0, 'emergency temperature rating']
+            duration = df_adjusted.at[0, 'duration (minutes)']
+
+            # one row per conductor, one column per grid cell
+            n_conductors = df_adjusted.shape[0]
+            conductor = ConductorParameters.stack([ConductorParameters.from_adjusted(df_adjusted, _idx)
+                                                   for _idx in range(n_conductors)], column=True)
+            diameter = conductor.diameter
+            conductor_projection = conductor.projection
+            emissivity = conductor.emissivity
+            solar_absorptivity = conductor.solar_absorptivity
+            if self.incremental is not None:
+                rows = [self.incremental_inputs(df_adjusted, _idx) for _idx in range(n_conductors)]
+
+        with self.stage('steady state'):
+            ratings = {}
+            for calcType, wind in (('Normal', 'normal'), ('Emergency', 'emergency')):
+                trace = TraceArray((n_conductors, ambient_temp.size)) if self.trace else None
+                if self.incremental is not None and trace is None:
+                    rating_day, rating_night = self.c_incremental_steady_state(rows, wind, temp_range_ambient,
+                                                                               temp_range_conductor)
+                else:
+                    rating_day, rating_night = \
+                        self.c_SSRating_array(calculation_units, diameter, conductor_temp, ambient_temp, elevation,
+                                              df_adjusted.at[0, wind + ' wind angle'],
+                                              df_adjusted.at[0, wind + ' wind speed'], emissivity, solar_absorptivity,
+                                              atmosphere, latitude, day, month, year, hour, conductor_direction,
+                                              conductor_projection, conductor, trace)
+                if trace is None:
+                    ratings[calcType] = {'Qs': np.nan, 'conductor resistance': np.nan,
+                                         'rating daytime': rating_day.ravel(), 'rating nighttime': rating_night.ravel()}
+                else:
+                    # intermediate values captured in bulk, same columns c_reporting writes in trace mode
+                    ratings[calcType] = trace.to_dict()
+
+        with self.stage('load dump'):
+            # load dump only depends on ambient temperature, repeated for every conductor temperature
+            if self.incremental is not None:
+                load_dump_day, load_dump_night = self.c_incremental_load_dump(rows, temp_range_ambient)
+            else:
+                load_dump_day, load_dump_night = \
+                    self.load_dump_array(calculation_units, diameter, conductor_temp_normal, conductor_temp_emergency,
+                                         temp_range_ambient, elevation, df_adjusted.at[0, 'emergency wind angle'],
+                                         df_adjusted.at[0, 'emergency wind speed'], emissivity, solar_absorptivity,
+                                         atmosphere, latitude, day, month, year, hour, conductor_direction,
+                                         conductor_projection, conductor, conductor.mcp, duration)
+            load_dump_day = np.repeat(load_dump_day, temp_range_conductor.size, axis=-1).ravel()
+            load_dump_night = np.repeat(load_dump_night, temp_range_conductor.size, axis=-1).ravel()
+
+        with self.stage('frames'):
+            df = df_adjusted.loc[np.repeat(np.arange(n_conductors), ambient_temp.size)].reset_index(drop=True)
+            df = df.assign(**{'ambient air temperature': np.tile(ambient_temp, n_conductors),
+                              'conductor temperature': np.tile(conductor_temp, n_conductors)})
+
+            df_N = df.assign(**ratings['Normal'])
+            df_N.insert(0, 'index', np.tile(np.arange(1, ambient_temp.size + 1), n_conductors))
+            df_E = df.assign(**ratings['Emergency'])
+            # c_reporting only records the duration on the rows that solve the load dump (first conductor temperature)
+            first = np.tile(conductor_temp == temp_range_conductor[0], n_conductors)
+            df_L = df.assign(**{'load dump rating daytime': load_dump_day,
+                                'load dump rating nighttime': load_dump_night,
+                                'load dump duration': np.where(first, duration, np.nan)})
+
+        return df_N, df_E, df_L
+
+    def incremental_inputs(self, df_adjusted, _idx=0):
+        """
+        Values of the inputs tracked by IncrementalCache for one row of df_adjusted
+        :param df_adjusted: data frame containing all configuration parameters adjusted to required units
+        :param _idx: index (row) for dataframe
+        :return: dict of input name to value, ConductorParameters of the row
+        """
+        conductor = ConductorParameters.from_adjusted(df_adjusted, _idx)
+        inputs = {column: df_adjusted.at[_idx, column] for column in (
+            'calculation units', 'elevation', 'atmosphere', 'latitude', 'day', 'month', 'year', 'hour',
+            'conductor direction', 'normal wind angle', 'normal wind speed', 'emergency wind angle',
+            'emergency wind speed', 'normal temperature rating', 'emergency temperature rating', 'duration (minutes)')}
+        inputs.update({'diameter': conductor.diameter, 'projection': conductor.projection,
+                       'emissivity': conductor.emissivity, 'solar absorptivity': conductor.solar_absorptivity,
+                       'resistance slope': conductor.resistance_slope,
+                       'resistance intercept': conductor.resistance_intercept, 'mcp': conductor.mcp,
+                       'solar ephemeris': self.solar_ephemeris, 'true to standard': self.true_to_standard})
+        return inputs, conductor
+
+    def c_incremental_steady_state(self, rows, wind, temp_range_ambient, temp_range_conductor):
+        """
+        Steady state ratings of the ambient x conductor temperature grid assembled from the intermediates (Qs,
+        conductor resistance, Qc, Qr) held by self.incremental, only intermediates and temperatures missing from the
+        cache are calculated. Rows share the configuration (c_grid_ratings).
+        :param rows: incremental_inputs of every conductor
+        :param wind: 'normal' or 'emergency' wind
+        :param temp_range_ambient: ambient temperatures (C)
+        :param temp_range_conductor: conductor temperatures (C)
+        :return: day and night ratings, one row per conductor, one column per grid cell (ambient major)
+        """
+        cache = self.incremental
+        inputs = [dict(row, **{'wind angle': row[wind + ' wind angle'], 'wind speed': row[wind + ' wind speed']})
+                  for row, _ in rows]
+        config = inputs[0]
+        units = config['calculation units']
+        conductors = ConductorParameters.stack([conductor for _, conductor in rows])
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            qs = cache.values('Qs', inputs, [], lambda index: self.c_qsHeatGain(
+                units, conductors.take(index).solar_absorptivity, config['elevation'], config['atmosphere'],
+                config['latitude'], config['day'], config['month'], config['year'], config['hour'],
+                config['conductor direction'], conductors.take(index).projection))
+            r = cache.values('conductor resistance', inputs, [temp_range_conductor],
+                             lambda index, tc: self.c_cond_resistance(tc, conductors.take(index)))
+            qc = cache.values('Qc', inputs, [temp_range_ambient, temp_range_conductor],
+                              lambda index, ta, tc: self.c_qcHeatLoss(units, conductors.take(index).diameter, tc, ta,
+                                                                      config['elevation'], config['wind angle'],
+                                                                      config['wind speed']))
+            qr = cache.values('Qr', inputs, [temp_range_ambient, temp_range_conductor],
+                              lambda index, ta, tc: self.c_qrHeatLoss(units, conductors.take(index).diameter,
+                                                                      conductors.take(index).emissivity, tc, ta))
+            rating_day = self.current_steady_state(qr, qs[:, None, None], qc, r[:, None, :])
+            rating_night = self.current_steady_state(qr, 0, qc, r[:, None, :])
+        return rating_day.reshape(len(rows), -1), rating_night.reshape(len(rows), -1)
+
+    def c_incremental_load_dump(self, rows, temp_range_ambient):
+        """
+        Load dump ratings per ambient temperature taken from self.incremental, only conductors whose inputs changed
+        and ambient temperatures missing from the cache are calculated (one load_dump_array call).
+        Rows share the configuration and conductor specification (c_grid_ratings).
+        :param rows: incremental_inputs of every conductor
+        :param temp_range_ambient: ambient temperatures (C)
+        :return: day and night load dump ratings, one row per conductor, one column per ambient temperature
+        """
+        config = rows[0][0]
+        conductors = ConductorParameters.stack([conductor for _, conductor in rows])
+
+        def calculate(index, ta):
+            conductor = conductors.take(index)
+            return np.stack(self.load_dump_array(
+                config['calculation units'], conductor.diameter, config['normal temperature rating'],
+                config['emergency temperature rating'], ta, config['elevation'], config['emergency wind angle'],
+                config['emergency wind speed'], conductor.emissivity, conductor.solar_absorptivity,
+                config['atmosphere'], config['latitude'], config['day'], config['month'], config['year'],
+                config['hour'], config['conductor direction'], conductor.projection, conductor, conductor.mcp,
+                config['duration (minutes)']), axis=-1)
+
+        load_dump = self.incremental.values('load dump', [row for row, _ in rows], [temp_range_ambient], calculate)
+        return load_dump[..., 0], load_dump[..., 1]
+
+    def c_reporting_batch(self, df_conductor_list, df_spec_list, df_config_list):
+        """
+        Rates every conductor of the catalog against every configuration in one call.
+        Conductors sharing a configuration and conductor specification are evaluated together with c_grid_ratings,
+        conductors without normal/emergency temperature ratings for their specification are skipped (ValueError when
+        that leaves nothing to rate).
+        :param df_conductor_list: conductor catalog (import_conductor)
+        :param df_spec_list: conductor specifications (import_conductor)
+        :param df_config_list: configurations (import_config)
+        :return: normal, emergency and load dump rating dataframes for every (conductor, configuration) pair,
+        ordered by configuration then conductor (catalog order)
+        """
+        df_N_list = []
+        df_E_list = []
+        df_L_list = []
+        order = []
+
+        df_conductor_list = df_conductor_list.reset_index(drop=True)
+        self.log_skipped(df_conductor_list, df_spec_list)
+        for config_idx in range(df_config_list.shape[0]):
+            df_config = df_config_list.iloc[[config_idx]].reset_index(drop=True)
+            for conductor_spec, df_group in df_conductor_list.groupby('Conductor Spec', sort=False):
+                df_spec = df_spec_list[df_spec_list['Conductor Spec'] == conductor_spec].reset_index(drop=True)
+                if df_spec.empty or df_spec.loc[0, ['normal temperature rating',
+                                                    'emergency temperature rating']].isna().any():
+                    continue
+                self.instrument_label(df_group.reset_index(drop=True), df_config, columns=('Conductor Spec',))
+                with self.stage('unit_conversion'):
+                    df_adjusted = self.unit_conversion_table(df_group, df_spec, df_config)
+                df_N, df_E, df_L = self.c_grid_ratings(df_adjusted)
+                df_N_list.append(df_N)
+                df_E_list.append(df_E)
+                df_L_list.append(df_L)
+                # rows of a conductor are contiguous, keep its catalog position to restore catalog order
+                order.append(np.repeat(config_idx * df_conductor_list.shape[0] + df_group.index.values,
+                                       df_N.shape[0] // df_group.shape[0]))
+
+        if not order:
+            raise ValueError('none of the conductors has normal/emergency temperature ratings for its specification')
+        order = np.argsort(np.concatenate(order), kind='stable')
+        df_N = pd.concat(df_N_list, axis=0, ignore_index=True).iloc[order].reset_index(drop=True)
+        df_E = pd.concat(df_E_list, axis=0, ignore_index=True).iloc[order].reset_index(drop=True)
+        df_L = pd.concat(df_L_list, axis=0, ignore_index=True).iloc[order].reset_index(drop=True)
+
+        return df_N, df_E, df_L
+
+    @staticmethod
+    def log_skipped(df_conductor_list, df_spec_list):
+        """
+        Logs a warning naming the conductor specifications left out of catalog-wide ratings because they are missing
+        from the specification list or have no normal/emergency temperature rating
+        :param df_conductor_list: conductor catalog (import_conductor)
+        :param df_spec_list: conductor specifications (import_conductor)
+        :return: list of skipped conductor specifications
+        """
+        df_spec = df_spec_list.drop_duplicates('Conductor Spec').set_index('Conductor Spec')
+        rated = df_spec.index[df_spec[['normal temperature rating',
+                                       'emergency temperature rating']].notna().all(axis=1)]
+        skipped = [conductor_spec for conductor_spec in df_conductor_list['Conductor Spec'].unique()
+                   if conductor_spec not in rated]
+        if skipped:
+            count = int(df_conductor_list['Conductor Spec'].isin(skipped).sum())
+            logger.warning(f'{count} conductor(s) without normal/emergency temperature ratings skipped '
+                           f'({", ".join(str(conductor_spec) for conductor_spec in skipped)})')
+        return skipped
+
+    @staticmethod
+    def c_rating_pairs(df_conductor_list, df_spec_list, df_config_list):
+        """
+        Lists every (configuration, conductor) pair of the catalog that can be rated, conductors whose specification
+        is missing or has no normal/emergency temperature rating are left out
+        :param df_conductor_list: conductor catalog (import_conductor)
+        :param df_spec_list: conductor specifications (import_conductor)
+        :param df_config_list: configurations (import_config)
+        :return: list of (configuration position, conductor position) tuples, configuration then conductor order
+        """
+        df_rated = df_spec_list.dropna(subset=['normal temperature rating', 'emergency temperature rating'])
+        rated = df_conductor_list['Conductor Spec'].isin(df_rated['Conductor Spec']).values
+        conductor_idx = np.flatnonzero(rated)
+
+        return [(config_idx, int(_idx)) for config_idx in range(df_config_list.shape[0]) for _idx in conductor_idx]
+
+    def c_reporting_parallel(self, df_conductor_list, df_spec_list, df_config_list, workers=None, chunksize=1,
+                             method='c_reporting'):
+        """
+        Rates every (configuration, conductor) pair on a process pool. The catalog is handed to each worker once when
+        the worker starts, tasks only carry the row positions of the pair. Results are returned in the order of
+        c_rating_pairs regardless of which worker finished first.
+        :param df_conductor_list: conductor catalog (import_conductor)
+        :param df_spec_list: conductor specifications (import_conductor)
+        :param df_config_list: configurations (import_config)
+        :param workers: number of worker processes, defaults to the number of CPUs; 1 runs in the current process
+        :param chunksize: number of pairs sent to a worker at a time
+        :param method: reporting method used per pair, 'c_reporting', 'c_reporting_grid' or 'c_reporting_batch'
+        ('c_reporting_batch' converts units with unit_conversion_table, same output as calling it in one process)
+        :return: normal, emergency and load dump rating dataframes for every pair
+        """
+        if method not in ('c_reporting', 'c_reporting_grid', 'c_reporting_batch'):
+            raise ValueError(f'{method} is not a valid reporting method')
+
+        self.log_skipped(df_conductor_list, df_spec_list)
+        tasks = self.c_rating_pairs(df_conductor_list, df_spec_list, df_config_list)
+        if not tasks:
+            raise ValueError('none of the conductors has normal/emergency temperature ratings for its specification')
+        initargs = (self, df_conductor_list, df_spec_list, df_config_list, method)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers == 1:
+            _init_rating_worker(*initargs)
+            try:
+                results = [_rate_pair(task) for task in tasks]
+            finally:
+                _rating_worker.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_rating_worker,
+                                     initargs=initargs) as executor:
+                results = list(executor.map(_rate_pair, tasks, chunksize=chunksize))
+
+        if self.instrumentation is not None:
+            for result in results:
+                self.instrumentation.merge(result[3])
+
+        df_N = pd.concat([result[0] for result in results], axis=0, ignore_index=True)
+        df_E = pd.concat([result[1] for result in results], axis=0, ignore_index=True)
+        df_L = pd.concat([result[2] for result in results], axis=0, ignore_index=True)
+
+        return df_N, df_E, df_L
+
+    def c_dynamic_rating(self, df_adjusted, weather, conductor_temp=None, conductor=None):
+        """
+        Dynamic line rating over a time series of weather records. Solar position is calculated from each record's
+        timestamp (local solar time) instead of the single day/month/year/hour of the configuration, all records are
+        evaluated in one vectorized pass through c_SSRating_array.
+        :param df_adjusted: data frame containing all configuration parameters adjusted to required units
+        :param weather: DataFrame (or dict of arrays) with a DatetimeIndex or 'timestamp' column and
+        'ambient air temperature' (C), 'wind speed' (m/s or ft/hr) and 'wind angle' (degrees) columns
+        :param conductor_temp: Conductor temperature (C), scalar or array per record, defaults to the normal rating
+        :param conductor: ConductorParameters, built from df_adjusted when not supplied
+        :return: DataFrame indexed like weather with solar altitude, day/night ratings and the day-aware rating
+        (daytime rating while the sun is above the horizon, nighttime rating otherwise)
+        """
+        if not isinstance(weather, pd.DataFrame):
+            weather = pd.DataFrame(weather)
+
+        if 'timestamp' in weather.columns:
+            timestamp = pd.DatetimeIndex(weather['timestamp'])
+        else:
+            timestamp = pd.DatetimeIndex(weather.index)
+
+        if conductor is None:
+            conductor = ConductorParameters.from_adjusted(df_adjusted)
+        if conductor_temp is None:
+            conductor_temp = df_adjusted.at[0, 'normal temperature rating']
+
+        calculation_units = df_adjusted.at[0, 'calculation units']
+        elevation = df_adjusted.at[0, 'elevation']
+        atmosphere = df_adjusted.at[0, 'atmosphere']
+        latitude = df_adjusted.at[0, 'latitude']
+        conductor_direction = df_adjusted.at[0, 'conductor direction']
+
+        day = timestamp.day.to_numpy()
+        month = timestamp.month.to_numpy()
+        year = timestamp.year.to_numpy()
+        # hour of day as used by c_omega (1430 = 14.3 hours)
+        hour = (timestamp.hour.to_numpy() + timestamp.minute.to_numpy() / 60 + timestamp.second.to_numpy() / 3600) * 100
+
+        rating_day, rating_night = self.c_SSRating_array(calculation_units, conductor.diameter, conductor_temp,
+                                                         weather['ambient air temperature'].to_numpy(dtype=float),
+                                                         elevation, weather['wind angle'].to_numpy(dtype=float),
+                                                         weather['wind speed'].to_numpy(dtype=float),
+                                                         conductor.emissivity, conductor.solar_absorptivity,
+                                                         atmosphere, latitude, day, month, year, hour,
+                                                         conductor_direction, conductor.projection, conductor)
+        solar_altitude = self.c_solar_altitude(latitude, day, month, year, hour)
+
+        return pd.DataFrame({'solar altitude': solar_altitude,
+                             'rating daytime': rating_day,
+                             'rating nighttime': rating_night,
+                             'rating': np.where(solar_altitude > 0, rating_day, rating_night)},
+                            index=weather.index)
+
+    def c_transient(self, df_adjusted, current, time_step, weather=None, conductors=None, initial_temperature=None,
+                    method='heun', max_step=None):
+        """
+        Transient conductor temperature for an arbitrary load profile. Integrates the non-steady state heat balance
+        mcp * dTc/dt = I^2 * R(Tc) + qs - qc - qr with a fixed step integrator for many lines at once.
+        Current and weather are held constant over each sample interval.
+        :param df_adjusted: data frame containing all configuration parameters adjusted to required units
+        :param current: conductor current (A), array (n_steps,) or (n_steps, n_lines)
+        :param time_step: time between samples (seconds)
+        :param weather: DataFrame or dict of arrays with 'ambient air temperature' (C), 'wind speed' (m/s or ft/hr)
+        and 'wind angle' (degrees), (n_steps,) or (n_steps, n_lines). A DatetimeIndex or 'timestamp' column sets the
+        solar position per sample (local solar time). Defaults to the configuration ambient temperature, normal wind
+        and solar time.
+        :param conductors: ConductorParameters or list of ConductorParameters (one per line),
+        defaults to the conductor in df_adjusted
+        :param initial_temperature: conductor temperature at the start (C), defaults to the steady state temperature
+        of the first sample
+        :param method: integrator 'euler', 'heun' or 'rk4'
+        :param max_step: largest integration step (seconds), sample intervals are subdivided to respect it
+        :return: conductor temperature (C) at the end of each sample interval, same shape as current
+        """
+        if method not in ('euler', 'heun', 'rk4'):
+            raise ValueError(f'unknown integration method {method}')
+
+        current = np.asarray(current, dtype=float)
+        squeeze = current.ndim == 1
+        current = current.reshape(current.shape[0], -1)
+        n_steps = current.shape[0]
+
+        if conductors is None:
+            conductor = ConductorParameters.from_adjusted(df_adjusted)
+        elif isinstance(conductors, ConductorParameters):
+            conductor = conductors
+        else:
+            conductor = ConductorParameters.stack(conductors)
+
+        calculation_units = df_adjusted.at[0, 'calculation units']
+        elevation = df_adjusted.at[0, 'elevation']
+        atmosphere = df_adjusted.at[0, 'atmosphere']
+        latitude = df_adjusted.at[0, 'latitude']
+        conductor_direction = df_adjusted.at[0, 'conductor direction']
+        day = df_adjusted.at[0, 'day']
+        month = df_adjusted.at[0, 'month']
+        year = df_adjusted.at[0, 'year']
+        hour = df_adjusted.at[0, 'hour']
+
+        if weather is None:
+            ambient_air_temp = df_adjusted.at[0, 'ambient air temperature']
+            wind_speed = df_adjusted.at[0, 'normal wind speed']
+            wind_angle = df_adjusted.at[0, 'normal wind angle']
+        else:
+            ambient_air_temp = np.asarray(weather['ambient air temperature'], dtype=float)
+            wind_speed = np.asarray(weather['wind speed'], dtype=float)
+            wind_angle = np.asarray(weather['wind angle'], dtype=float)
+            timestamp = None
+            if 'timestamp' in weather:
+                timestamp = pd.DatetimeIndex(weather['timestamp'])
+            elif isinstance(getattr(weather, 'index', None), pd.DatetimeIndex):
+                timestamp = weather.index
+            if timestamp is not None:
+                day = timestamp.day.to_numpy()[:, None]
+                month = timestamp.month.to_numpy()[:, None]
+                year = timestamp.year.to_numpy()[:, None]
+                hour = ((timestamp.hour.to_numpy() + timestamp.minute.to_numpy() / 60 +
+                         timestamp.second.to_numpy() / 3600) * 100)[:, None]
+
+        def per_step(value):
+            # samples along the first axis, lines along the second
+            value = np.asarray(value, dtype=float)
+            if value.ndim == 1 and value.shape[0] == n_steps:
+                value = value[:, None]
+            return np.atleast_2d(value)
+
+        # solar heat gain does not depend on conductor temperature, evaluated for every sample up front
+        solar_altitude = per_step(self.c_solar_altitude(latitude, day, month, year, hour))
+        qs = per_step(self.c_qsHeatGain(calculation_units, conductor.solar_absorptivity, elevation, atmosphere,
+                                        latitude, day, month, year, hour, conductor_direction,
+                                        conductor.projection))
+        qs = np.where(solar_altitude > 0, qs, 0)
+
+        current, ambient_air_temp, wind_speed, wind_angle = \
+            [per_step(x) for x in (current, ambient_air_temp, wind_speed, wind_angle)]
+        shape = np.broadcast_shapes((n_steps, 1), current.shape, ambient_air_temp.shape, wind_speed.shape,
+                                    wind_angle.shape, qs.shape, (1,) + np.shape(conductor.diameter))
+        current, ambient_air_temp, wind_speed, wind_angle, qs, solar_altitude = \
+            [np.broadcast_to(x, shape) for x in (current, ambient_air_temp, wind_speed, wind_angle, qs,
+                                                 solar_altitude)]
+
+        if initial_temperature is None:
+            initial_temperature = self.conductor_temperature_for_current(
+                calculation_units, conductor.diameter, current[0], ambient_air_temp[0], elevation, wind_angle[0],
+                wind_speed[0], conductor.emissivity, conductor.solar_absorptivity, atmosphere, latitude,
+                np.ravel(day)[0], np.ravel(month)[0], np.ravel(year)[0], np.ravel(hour)[0], conductor_direction,
+                conductor.projection, conductor, 'Day' if solar_altitude[0].max() > 0 else 'Night')
+
+        def heating_rate(temperature, k):
+            with np.errstate(invalid='ignore', divide='ignore'):
+                # convection is only a heat loss, conductor below ambient temperature only exchanges radiation
+                qc = self.c_qcHeatLoss(calculation_units, conductor.diameter,
+                                       np.maximum(temperature, ambient_air_temp[k]), ambient_air_temp[k], elevation,
+                                       wind_angle[k], wind_speed[k])
+                qr = self.c_qrHeatLoss(calculation_units, conductor.diameter, conductor.emissivity, temperature,
+                                       ambient_air_temp[k])
+            r_cond = self.c_cond_resistance(temperature, conductor)
+            return (current[k] ** 2 * r_cond + qs[k] - qc - qr) / conductor.mcp
+
+        sub_steps = 1 if max_step is None else max(1, int(np.ceil(time_step / max_step)))
+        h = time_step / sub_steps
+
+        temperature = np.broadcast_to(np.asarray(initial_temperature, dtype=float), shape[1:]).copy()
+        results = np.empty(shape)
+        for k in range(n_steps):
+            for _ in range(sub_steps):
+                if method == 'euler':
+                    temperature = temperature + h * heating_rate(temperature, k)
+                elif method == 'heun':
+                    k1 = heating_rate(temperature, k)
+                    k2 = heating_rate(temperature + h * k1, k)
+                    temperature = temperature + h / 2 * (k1 + k2)
+                else:
+                    k1 = heating_rate(temperature, k)
+                    k2 = heating_rate(temperature + h / 2 * k1, k)
+                    k3 = heating_rate(temperature + h / 2 * k2, k)
+                    k4 = heating_rate(temperature + h * k3, k)
+                    temperature = temperature + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            results[k] = temperature
+
+        if squeeze and shape[1] == 1:
+            return results[:, 0]
+        return results
+
     @staticmethod
     def export_excel(df_n, df_e, df_l, df_config, filename_):
         wb = Workbook()
@@ -439,6 +1824,165 @@ class IEEE738:
 
         wb.save(filename_)
 
+    @staticmethod
+    def export_excel_stream(df_n, df_e, df_l, df_config, filename_, per_conductor=False, chunk_rows=10000):
+        """
+        Streaming version of export_excel for large (catalog-wide) results. Rows are written through a write-only
+        workbook and converted to python values chunk_rows rows at a time, so apart from the finished file memory use
+        does not grow with the number of cells.
+        :param df_n: normal rating dataframe
+        :param df_e: emergency rating dataframe
+        :param df_l: load dump rating dataframe
+        :param df_config: configuration(s) used for the calculations
+        :param filename_: file name without extension
+        :param per_conductor: write normal/emergency/load sheets for every conductor (and configuration) instead of
+        one sheet each, the 'conductors' sheet lists which conductor every sheet number belongs to
+        :param chunk_rows: number of rows converted at a time
+        :return: None
+        """
+        def write_sheet(wb, title, df):
+            ws = wb.create_sheet(title)
+            ws.append([str(column) for column in df.columns])
+            for start in range(0, df.shape[0], chunk_rows):
+                for row in df.iloc[start:start + chunk_rows].itertuples(index=False, name=None):
+                    ws.append(row)
+
+        wb = Workbook(write_only=True)
+        filename_ = filename_ + '.xlsx'
+
+        if per_conductor:
+            keys = [key for key in ('config name', 'Conductor Spec', 'Name', 'Size', 'Cond Strand', 'Core Strand')
+                    if key in df_n.columns]
+            group = df_n.groupby(keys, sort=False, dropna=False).ngroup().values
+            first_rows = []
+            for number in range(group.max() + 1 if group.size else 0):
+                rows = np.flatnonzero(group == number)
+                first_rows.append(rows[0])
+                write_sheet(wb, f'normal {number + 1}', df_n.iloc[rows])
+                write_sheet(wb, f'emergency {number + 1}', df_e.iloc[rows])
+                write_sheet(wb, f'load {number + 1}', df_l.iloc[rows])
+            df_conductors = df_n.iloc[first_rows][keys].reset_index(drop=True)
+            df_conductors.insert(0, 'sheet number', np.arange(1, len(first_rows) + 1))
+            write_sheet(wb, 'conductors', df_conductors)
+        else:
+            write_sheet(wb, 'normal', df_n)
+            write_sheet(wb, 'emergency', df_e)
+            write_sheet(wb, 'load', df_l)
+
+        write_sheet(wb, 'config', df_config)
+
+        wb.save(filename_)
+
+    @staticmethod
+    def columnar_frame(df):
+        """
+        Prepares a dataframe for columnar storage, object columns holding only numbers/NaN (ex. add_calc_columns) are
+        stored as numbers and columns holding mixed types (ex. conductor name filled with 0 by unit_conversion) as text.
+        Missing values (None/NaN) of text columns stay missing (NaN).
+        :param df: dataframe to store
+        :return: dataframe with a default index and single typed columns
+        """
+        df = df.reset_index(drop=True).infer_objects()
+        df.columns = [str(column) for column in df.columns]
+        for column in df.columns[df.dtypes == object]:
+            missing = df[column].isna()
+            if df[column][~missing].map(type).nunique() > 1:
+                df[column] = df[column].astype(str)
+            df[column] = df[column].mask(missing, np.nan)
+        return df
+
+    def export_columnar(self, df_n, df_e, df_l, df_config, filename_, file_format='parquet'):
+        """
+        Exports the normal, emergency and load dump frames (c_reporting or batch output) and the configuration to a
+        columnar format. Parquet and Feather write one file per frame ({filename_}_normal.parquet, ...), Feather
+        files are left uncompressed so import_columnar can memory map them. npz writes a single compressed archive.
+        :param df_n: normal rating dataframe
+        :param df_e: emergency rating dataframe
+        :param df_l: load dump rating dataframe
+        :param df_config: configuration(s) used for the calculations
+        :param filename_: file name without extension
+        :param file_format: 'parquet', 'feather' or 'npz'
+        :return: list of files written
+        """
+        if file_format not in self.columnar_formats:
+            raise ValueError(f'{file_format} is not a valid export format')
+        if file_format != 'npz' and feather is None:
+            raise ImportError(f'pyarrow is required for {file_format} export')
+
+        self.instrument_label(None)
+        with self.stage('export'):
+            frames = dict(zip(self.columnar_frames, (df_n, df_e, df_l, df_config)))
+
+            if file_format == 'npz':
+                arrays = {}
+                for name, df in frames.items():
+                    df = self.columnar_frame(df)
+                    arrays[name + '_columns'] = np.array(df.columns, dtype=str)
+                    for _pos, column in enumerate(df.columns):
+                        values = df[column].values
+                        if values.dtype == object:
+                            # text columns are stored as unicode arrays, the archive never needs pickle to load,
+                            # missing values are kept in a separate mask instead of as the text 'nan'
+                            missing = pd.isna(values)
+                            values = np.where(missing, '', values).astype(str)
+                            if missing.any():
+                                arrays[f'{name}_{_pos}_missing'] = missing
+                        arrays[f'{name}_{_pos}'] = values
+                filename_list = [filename_ + '.npz']
+                np.savez_compressed(filename_list[0], **arrays)
+                return filename_list
+
+            filename_list = []
+            for name, df in frames.items():
+                filename_frame = f'{filename_}_{name}.{file_format}'
+                if file_format == 'parquet':
+                    self.columnar_frame(df).to_parquet(filename_frame, engine='pyarrow', index=False)
+                else:
+                    feather.write_feather(self.columnar_frame(df), filename_frame, compression='uncompressed')
+                filename_list.append(filename_frame)
+
+            return filename_list
+
+    def import_columnar(self, filename_, file_format='parquet', memory_map=True):
+        """
+        Loads frames written by export_columnar. Parquet/Feather files are read through a memory map instead of a read
+        buffer, the columns are still copied once into the returned pandas frames (to_pandas). npz archives are loaded
+        one array at a time (compressed archives can not be memory mapped), missing text values are restored as NaN.
+        :param filename_: file name without extension, as passed to export_columnar
+        :param file_format: 'parquet', 'feather' or 'npz'
+        :param memory_map: read Parquet/Feather files through a memory map
+        :return: normal, emergency, load dump rating and configuration dataframes
+        """
+        if file_format not in self.columnar_formats:
+            raise ValueError(f'{file_format} is not a valid export format')
+        if file_format != 'npz' and feather is None:
+            raise ImportError(f'pyarrow is required for {file_format} import')
+
+        frames = []
+        if file_format == 'npz':
+            with np.load(filename_ + '.npz') as archive:
+                for name in self.columnar_frames:
+                    columns = archive[name + '_columns']
+                    data = {}
+                    for _pos, column in enumerate(columns):
+                        values = archive[f'{name}_{_pos}']
+                        if f'{name}_{_pos}_missing' in archive.files:
+                            values = values.astype(object)
+                            values[archive[f'{name}_{_pos}_missing']] = np.nan
+                        data[column] = values
+                    frames.append(pd.DataFrame(data))
+            return tuple(frames)
+
+        for name in self.columnar_frames:
+            filename_frame = f'{filename_}_{name}.{file_format}'
+            if file_format == 'parquet':
+                table = parquet.read_table(filename_frame, memory_map=memory_map)
+            else:
+                table = feather.read_table(filename_frame, memory_map=memory_map)
+            frames.append(table.to_pandas())
+
+        return tuple(frames)
+
     @staticmethod
     def current_steady_state(qr, qs, qc, r):
         """
@@ -449,10 +1993,12 @@ class IEEE738:
         :param r: Conductor resistance (ohms)
         :return: Steady state current rating (Amps)
         """
-        if (qr - qs + qc) > 0:
-            rating = np.sqrt((qr - qs + qc) / r)
-        else:
-            rating = 0
+        heat_balance = qr - qs + qc
+        # works on scalars and arrays, any heat balance <= 0 (or nan) results in a 0 A rating
+        rating = np.sqrt(np.where(heat_balance > 0, heat_balance, 0) / r)
+        if np.ndim(rating) == 0:
+            # scalar inputs keep the original return types, np.float64 or 0 when there is no heat balance
+            return rating[()] if heat_balance > 0 else 0
         return rating
 
     @staticmethod
@@ -528,11 +2074,19 @@ class IEEE738:
         """
         Calculates resistance of conductor and returns results (ohm)
         :param conductor_temp: Conductor temperature (C)
-        :param conductor_resistance: Dataframe containing resistance values/temperatures/distance
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
         :param df: Dataframe holding output conductor/config/calculated values
         :param _idx: index (row) for dataframe
         :return: Resistance (ohm)
         """
+        if isinstance(conductor_resistance, ConductorParameters):
+            # slope/intercept precomputed once per conductor
+            resistance = conductor_resistance.resistance_slope * conductor_temp + \
+                         conductor_resistance.resistance_intercept
+            if df is not None:
+                df.at[_idx, 'conductor resistance'] = resistance
+            return resistance
+
         high_resistance_ohm_per_unit_distance = conductor_resistance.at[0, 'high resistance Ω/unit']
         low_resistance_ohm_per_unit_distance = conductor_resistance.at[0, 'low resistance Ω/unit']
         high_resistance_temperature = conductor_resistance.at[0, 'high resistance temperature']
@@ -555,19 +2109,13 @@ class IEEE738:
 
         return resistance
 
-    def c_Qs(self, calculation_units, atmosphere, latitude, day, month, year, hour, df=None, _idx=0):
+    @staticmethod
+    def c_Qs_coefficients(calculation_units, atmosphere):
         """
-        Calculates total solar and sky radiated heat flux rate (W/m^2) and returns results
+        Returns the polynomial coefficients (A-G) used to calculate total solar and sky radiated heat flux rate
         :param calculation_units: Units: 'Metric' or 'Imperial'
         :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
-        :param latitude: latitude
-        :param day: Day of month (int)
-        :param month: Month (int)
-        :param year: Year (int)
-        :param hour: Hour of day (int)
-        :param df: Dataframe holding output conductor/config/calculated values
-        :param _idx: index (row) for dataframe
-        :return: Total solar and sky radiated heat flux rate (W/m^2)
+        :return: coefficients A through G
         """
         aa = 0
         bb = 0
@@ -616,6 +2164,24 @@ class IEEE738:
                 ff = -4.03627E-7
                 gg = 1.22967E-9
 
+        return aa, bb, cc, dd, ee, ff, gg
+
+    def c_Qs(self, calculation_units, atmosphere, latitude, day, month, year, hour, df=None, _idx=0):
+        """
+        Calculates total solar and sky radiated heat flux rate (W/m^2) and returns results
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :param latitude: latitude
+        :param day: Day of month (int)
+        :param month: Month (int)
+        :param year: Year (int)
+        :param hour: Hour of day (int)
+        :param df: Dataframe holding output conductor/config/calculated values
+        :param _idx: index (row) for dataframe
+        :return: Total solar and sky radiated heat flux rate (W/m^2)
+        """
+        aa, bb, cc, dd, ee, ff, gg = self.c_Qs_coefficients(calculation_units, atmosphere)
+
         solar_altitude = self.c_solar_altitude(latitude, day, month, year, hour, df, _idx)
         radiated_heat_flux_rate = aa + bb * solar_altitude + cc * solar_altitude ** 2 + dd * solar_altitude ** 3 + ee * solar_altitude ** 4 + ff * solar_altitude ** 5 + gg * solar_altitude ** 6
 
@@ -661,15 +2227,25 @@ class IEEE738:
         """
         error = False
         day_of_year = 0
+        if np.ndim(day) or np.ndim(month) or np.ndim(year):
+            # array input, invalid dates fall back to 06/10/2009 like the scalar path below
+            day, month, year = np.broadcast_arrays(day, month, year)
+            date = pd.to_datetime(pd.DataFrame({'year': year.ravel(), 'month': month.ravel(), 'day': day.ravel()}),
+                                  errors='coerce')
+            day_of_year = date.dt.dayofyear.fillna(161).to_numpy(dtype=int).reshape(day.shape)
+            if df is not None:
+                df.at[_idx, 'day of year'] = day_of_year
+            return day_of_year
         try:
             date = datetime.datetime(int(year), int(month), int(day))
             day_of_year = int(date.strftime("%j"))  # Get the day of the year
         except ValueError:  # if date is not valid
-            df.at[_idx, 'Error'] = df.at[_idx, 'Error'].astype(
-                str) + ' c_day_of_year: Check day/month/year, using 06/10/2009 '
             date = datetime.datetime(2009, 6, 10)
             day_of_year = int(date.strftime("%j"))  # Get the day of the year
-            df.at[_idx, 'day of year'] = day_of_year
+            if df is not None:
+                df.at[_idx, 'Error'] = df.at[_idx, 'Error'].astype(
+                    str) + ' c_day_of_year: Check day/month/year, using 06/10/2009 '
+                df.at[_idx, 'day of year'] = day_of_year
             error = True
 
         if df is not None and not error:
@@ -693,24 +2269,12 @@ class IEEE738:
 
         if uc.units_lookup[calculation_units] == uc.metric_value:
             # meters
-            if elevation < 1000:
-                solar_heat_factor = 1.0
-            elif 1000 <= elevation < 2000:
-                solar_heat_factor = 1.10
-            elif 2000 <= elevation < 4000:
-                solar_heat_factor = 1.19
-            elif 4000 <= elevation:
-                solar_heat_factor = 1.28
+            solar_heat_factor = np.select([elevation < 1000, elevation < 2000, elevation < 4000, 4000 <= elevation],
+                                          [1.0, 1.10, 1.19, 1.28], np.nan)[()]
         elif uc.units_lookup[calculation_units] == uc.imperial_value:
             # feet
-            if elevation < 5000:
-                solar_heat_factor = 1.0
-            elif 5000 <= elevation < 10000:
-                solar_heat_factor = 1.15
-            elif 10000 <= elevation < 15000:
-                solar_heat_factor = 1.25
-            elif 15000 <= elevation:
-                solar_heat_factor = 1.30
+            solar_heat_factor = np.select([elevation < 5000, elevation < 10000, elevation < 15000, 15000 <= elevation],
+                                          [1.0, 1.15, 1.25, 1.30], np.nan)[()]
 
         solar_altitude_correction_factor = aks + bks * elevation + cks * elevation ** 2
 
@@ -774,16 +2338,9 @@ class IEEE738:
         :return: Solar azimuth constant (degrees)
         """
         omega = np.degrees(omega)
-        if -180 <= omega < 0:
-            if chi >= 0:
-                solar_azimuth_constant = 0
-            else:
-                solar_azimuth_constant = 180
-        else:
-            if chi >= 0:
-                solar_azimuth_constant = 180
-            else:
-                solar_azimuth_constant = 360
+        solar_azimuth_constant = np.where((-180 <= omega) & (omega < 0),
+                                          np.where(chi >= 0, 0, 180),
+                                          np.where(chi >= 0, 180, 360))[()]
         if df is not None:
             df.at[_idx, 'solar azimuth constant'] = solar_azimuth_constant
         return solar_azimuth_constant
@@ -846,30 +2403,7 @@ class IEEE738:
         :param _idx: index (row) for dataframe
         :return: Effective angles of incidence of the Sun's rays (degrees)
         """
-        direction_lookup_value_ns = 1
-        direction_lookup_value_ew = 2
-
-        direction_lookup = {
-            'n/s': direction_lookup_value_ns,
-            'n-s': direction_lookup_value_ns,
-            'north/south': direction_lookup_value_ns,
-            'north-south': direction_lookup_value_ns,
-            's/n': direction_lookup_value_ns,
-            's-n': direction_lookup_value_ns,
-            'south/north': direction_lookup_value_ns,
-            'South-north': direction_lookup_value_ns,
-
-            'e/w': direction_lookup_value_ew,
-            'e-w': direction_lookup_value_ew,
-            'east/west': direction_lookup_value_ew,
-            'east-west': direction_lookup_value_ew,
-            'w/e': direction_lookup_value_ew,
-            'w-e': direction_lookup_value_ew,
-            'west/east': direction_lookup_value_ew,
-            'west-east': direction_lookup_value_ew,
-        }
-
-        if direction_lookup[conductor_direction.lower()] == direction_lookup_value_ns:
+        if self.direction_lookup[conductor_direction.lower()] == self.direction_lookup_value_ns:
             _Z1 = 90
         else:
             _Z1 = 0
@@ -899,6 +2433,61 @@ class IEEE738:
             df.at[_idx, 'k angle'] = k_angle
         return k_angle
 
+    def c_solar_state(self, calculation_units, elevation, atmosphere, latitude, day, month, year, hour,
+                      conductor_direction, df=None, _idx=0):
+        """
+        Calculates every solar quantity used for solar heat gain in a single pass (day of year, declination, hour
+        angle, solar altitude, solar azimuth, theta, Qs and Qse), each computed once. Scalar or array inputs.
+        Uses SolarEphemeris lookups when solar_ephemeris is set and no dataframe is passed.
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param elevation: elevation of conductors
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :param latitude: latitude
+        :param day: Day of month (int)
+        :param month: Month (int)
+        :param year: Year (int)
+        :param hour: Hour of day (int)
+        :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
+        :param df: Dataframe holding output conductor/config/calculated values
+        :param _idx: index (row) for dataframe
+        :return: dict of solar values keyed by their dataframe column names
+        """
+        state = {'day of year': self.c_day_of_year(day, month, year, df, _idx)}
+
+        if df is None and self.solar_ephemeris is not None:
+            state['hc: solar altitude'], state['solar azimuth'], state['Qs'] = \
+                self.solar_ephemeris.lookup(latitude, calculation_units, atmosphere, state['day of year'], hour)
+        else:
+            latitude = np.radians(latitude)
+            state['delta'] = self.c_delta(state['day of year'], df, _idx)
+            state['omega'] = self.c_omega(hour, df, _idx)
+            state['hc: solar altitude'] = np.degrees(np.arcsin(
+                np.cos(latitude) * np.cos(state['delta']) * np.cos(state['omega']) +
+                np.sin(latitude) * np.sin(state['delta'])))
+            state['chi'] = self.c_chi(state['omega'], latitude, state['delta'], df, _idx)
+            state['solar azimuth constant'] = self.c_solar_constant(state['omega'], state['chi'], df, _idx)
+            state['solar azimuth'] = state['solar azimuth constant'] + np.degrees(np.arctan(state['chi']))
+
+            aa, bb, cc, dd, ee, ff, gg = self.c_Qs_coefficients(calculation_units, atmosphere)
+            solar_altitude = state['hc: solar altitude']
+            state['Qs'] = aa + bb * solar_altitude + cc * solar_altitude ** 2 + dd * solar_altitude ** 3 + \
+                ee * solar_altitude ** 4 + ff * solar_altitude ** 5 + gg * solar_altitude ** 6
+
+        state['Qse'] = self.c_ksolar(calculation_units, elevation, df, _idx) * state['Qs']
+
+        if self.direction_lookup[conductor_direction.lower()] == self.direction_lookup_value_ns:
+            _Z1 = 90
+        else:
+            _Z1 = 0
+        state['theta'] = np.degrees(np.arccos(np.cos(np.radians(state['hc: solar altitude'])) *
+                                              np.cos(np.radians(state['solar azimuth'] - _Z1))))
+
+        if df is not None:
+            for column in ('hc: solar altitude', 'solar azimuth', 'Qs', 'Qse', 'theta'):
+                df.at[_idx, column] = state[column]
+
+        return state
+
     def c_qsHeatGain(self, calculation_units, solar_absorptivity, elevation, atmosphere, latitude, day, month,
                      year, hour, conductor_direction, conductor_projection, df=None, _idx=0):
         """
@@ -918,9 +2507,9 @@ class IEEE738:
         :param _idx: index (row) for dataframe
         :return:
         """
-        qse = self.c_qse(calculation_units, elevation, atmosphere, latitude, day, month, year, hour, df, _idx)
-        theta = self.c_Theta(latitude, day, month, year, hour, conductor_direction, df, _idx)
-        qs_heat_gain = solar_absorptivity * qse * np.sin(np.radians(theta)) * conductor_projection
+        state = self.c_solar_state(calculation_units, elevation, atmosphere, latitude, day, month, year, hour,
+                                   conductor_direction, df, _idx)
+        qs_heat_gain = solar_absorptivity * state['Qse'] * np.sin(np.radians(state['theta'])) * conductor_projection
 
         if df is not None:
             df.at[_idx, 'qs heat gain'] = qs_heat_gain
@@ -989,7 +2578,7 @@ class IEEE738:
             # high wind speeds
             qc2 = (0.0119 * ((diameter * pf * wind_speed) / uf) ** 0.6) * kf * k_angle * (
                     conductor_temp - ambient_air_temp)
-            qc_heat_loss = np.amax((qc0, qc1, qc2))
+            qc_heat_loss = np.maximum(np.maximum(qc0, qc1), qc2)
         elif uc.units_lookup[calculation_units] == uc.imperial_value:
             # W/feet
 
@@ -1003,7 +2592,7 @@ class IEEE738:
             # high wind speeds
             qc2 = (0.1695 * ((diameter * pf * wind_speed) / uf) ** 0.6) * kf * k_angle * (
                     conductor_temp - ambient_air_temp)
-            qc_heat_loss = np.amax((qc0, qc1, qc2))
+            qc_heat_loss = np.maximum(np.maximum(qc0, qc1), qc2)
 
         if df is not None:
             df.at[_idx, 'qc0'] = qc0
@@ -1034,7 +2623,7 @@ class IEEE738:
         :param hour: Hour of day (int)
         :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
         :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
-        :param conductor_resistance: Dataframe containing resistance values/temperatures/distance
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
         :param df: Dataframe holding output conductor/config/calculated values
         :param _idx: index (row) for dataframe
         :return: Steady state current (Amps) Day rating includes solar heat gain, Night Rating does not include
@@ -1054,6 +2643,152 @@ class IEEE738:
             df.at[_idx, 'rating nighttime'] = rating_night
         return rating_day, rating_night
 
+    def c_SSRating_array(self, calculation_units, diameter, conductor_temp, ambient_air_temp, elevation, wind_angle,
+                         wind_speed, emissivity, solar_absorptivity, atmosphere, latitude, day, month, year, hour,
+                         conductor_direction, conductor_projection, conductor_resistance, trace=None):
+        """
+        Vectorized version of c_SSRating, calculates steady state current for every point in one evaluation (Amps)
+        Numeric inputs may be scalars or numpy arrays and are broadcast against each other, calculation_units,
+        atmosphere and conductor_direction are shared by all points. Intermediate values are only recorded when a
+        TraceArray is passed.
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param diameter: Conductor diameter (mm or in)
+        :param conductor_temp: Conductor temperature (C)
+        :param ambient_air_temp: Ambient air temperature (C)
+        :param elevation: elevation of conductors
+        :param wind_angle: Angle between conductor and applied wind (degrees)
+        :param wind_speed: Wind speed (m/s or ft/hr)
+        :param emissivity: Emissivity
+        :param solar_absorptivity: Solar absorptivity
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :param latitude: latitude
+        :param day: Day of month (int)
+        :param month: Month (int)
+        :param year: Year (int)
+        :param hour: Hour of day (int)
+        :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
+        :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
+        :param trace: TraceArray with the shape of the results, receives the intermediate values
+        :return: Steady state current arrays (Amps), day rating includes solar heat gain, night rating does not
+        """
+        diameter, conductor_temp, ambient_air_temp, elevation, wind_angle, wind_speed, emissivity, \
+            solar_absorptivity, latitude, hour, conductor_projection = \
+            [np.asarray(x, dtype=float) for x in (diameter, conductor_temp, ambient_air_temp, elevation, wind_angle,
+                                                  wind_speed, emissivity, solar_absorptivity, latitude, hour,
+                                                  conductor_projection)]
+        shape = np.broadcast_shapes(diameter.shape, conductor_temp.shape, ambient_air_temp.shape, elevation.shape,
+                                    wind_angle.shape, wind_speed.shape, emissivity.shape, solar_absorptivity.shape,
+                                    latitude.shape, np.shape(day), np.shape(month), np.shape(year), hour.shape,
+                                    conductor_projection.shape)
+
+        # conductor below ambient temperature results in nan convection, same as the scalar path
+        with np.errstate(invalid='ignore', divide='ignore'):
+            qc = self.c_qcHeatLoss(calculation_units, diameter, conductor_temp, ambient_air_temp, elevation,
+                                   wind_angle, wind_speed, trace)
+            qr = self.c_qrHeatLoss(calculation_units, diameter, emissivity, conductor_temp, ambient_air_temp, trace)
+            # solar heat gain is independent of conductor/ambient temperature, only evaluated on its own inputs
+            qs = self.c_qsHeatGain(calculation_units, solar_absorptivity, elevation, atmosphere, latitude, day, month,
+                                   year, hour, conductor_direction, conductor_projection, trace)
+            r_cond = self.c_cond_resistance(conductor_temp, conductor_resistance, trace)
+            rating_day = self.current_steady_state(qr, qs, qc, r_cond)
+            rating_night = self.current_steady_state(qr, 0, qc, r_cond)
+
+        rating_day = np.broadcast_to(rating_day, shape).copy()
+        rating_night = np.broadcast_to(rating_night, shape).copy()
+        if trace is not None:
+            trace.at[0, 'rating daytime'] = rating_day
+            trace.at[0, 'rating nighttime'] = rating_night
+        return rating_day, rating_night
+
+    def c_rating_table(self, df_adjusted, _idx=0, rating='normal', conductor_temp=None, ambient_air_temp=None,
+                       wind_speed=None, wind_angle=None, hour=None):
+        """
+        Precomputes steady state ratings of one conductor/configuration (unit_conversion row) on a grid for
+        RatingTable lookups. The remaining inputs (elevation, latitude, date, direction, ...) come from the row.
+        The table is evaluated again at the center of every grid cell, max_error is the largest lookup error found
+        there. It is an estimate, not a bound: for a rating that is quadratic along each axis the interpolation error
+        peaks at the cell center, but curvatures of opposite sign along different axes partly cancel there and the
+        ratings have kinks (natural/forced convection switch), so points away from the centers can exceed it.
+        :param df_adjusted: data frame containing all configuration parameters adjusted to required units
+        :param _idx: index (row) for dataframe
+        :param rating: 'normal' or 'emergency', selects the default conductor temperature
+        :param conductor_temp: Conductor temperature (C), defaults to the temperature rating of the conductor spec
+        :param ambient_air_temp: ambient grid (C), defaults to the configuration ambient range and increment
+        :param wind_speed: wind speed grid (calculation units), defaults to rating_table_wind_speed
+        :param wind_angle: wind angle grid (degrees), defaults to rating_table_wind_angle
+        :param hour: hour of day grid, when None the table is built for the configuration hour only
+        :return: RatingTable
+        """
+        df = df_adjusted
+        if conductor_temp is None:
+            conductor_temp = df.at[_idx, rating + ' temperature rating']
+        if ambient_air_temp is None:
+            increment = df.at[_idx, 'temperature increment']
+            ambient_air_temp = np.arange(df.at[_idx, 'ambient air temperature lower range'],
+                                         df.at[_idx, 'ambient air temperature upper range'] + increment / 2, increment)
+        if wind_speed is None:
+            wind_speed = uc.speed_convert_array(self.rating_table_wind_speed, 'm/s',
+                                                df.at[_idx, 'normal wind speed units'])
+        if wind_angle is None:
+            wind_angle = self.rating_table_wind_angle
+
+        axes = {'ambient air temperature': ambient_air_temp, 'wind speed': wind_speed, 'wind angle': wind_angle}
+        if hour is not None:
+            axes['hour'] = hour
+        axes = {name: np.asarray(values, dtype=float) for name, values in axes.items()}
+        conductor = ConductorParameters.from_adjusted(df, _idx)
+
+        def ratings(points):
+            grid = np.ix_(*points)
+            return self.c_SSRating_array(
+                df.at[_idx, 'calculation units'], conductor.diameter, conductor_temp, grid[0],
+                df.at[_idx, 'elevation'], grid[2], grid[1], conductor.emissivity, conductor.solar_absorptivity,
+                df.at[_idx, 'atmosphere'], df.at[_idx, 'latitude'], int(df.at[_idx, 'day']),
+                int(df.at[_idx, 'month']), int(df.at[_idx, 'year']), grid[3] if hour is not None else
+                df.at[_idx, 'hour'], df.at[_idx, 'conductor direction'], conductor.projection, conductor)
+
+        with self.stage('rating table'):
+            rating_day, rating_night = ratings(list(axes.values()))
+            info = {'config name': df.at[_idx, 'config name'], 'conductor temperature': float(conductor_temp),
+                    'calculation units': df.at[_idx, 'calculation units'],
+                    'wind speed units': df.at[_idx, 'normal wind speed units'],
+                    'true to standard': self.true_to_standard, 'version': ver}
+            for column in ConductorCatalog.levels + ('Name', 'elevation', 'latitude', 'day', 'month', 'year', 'hour',
+                                                     'atmosphere', 'conductor direction'):
+                value = df.at[_idx, column]
+                info[column] = value.item() if isinstance(value, np.generic) else value
+            table = RatingTable(axes, rating_day, rating_night, info)
+
+            # interpolated value at a cell center is the mean of the cell corners
+            center_day, center_night = ratings([(values[1:] + values[:-1]) / 2 for values in axes.values()])
+            lookup = sum(table.ratings[tuple(slice(1, None) if c else slice(None, -1) for c in corner)]
+                         for corner in table.corners) / len(table.corners)
+            with np.errstate(invalid='ignore'):
+                table.max_error = {
+                    'rating daytime': float(np.nanmax(np.abs(lookup[..., 0] - center_day), initial=0)),
+                    'rating nighttime': float(np.nanmax(np.abs(lookup[..., 1] - center_night), initial=0))}
+        return table
+
+    def c_rating_tables(self, df_conductor_list, df_spec_list, df_config_list, **kwargs):
+        """
+        Builds a RatingTable for every (configuration, conductor) pair with temperature ratings (c_rating_pairs)
+        :param df_conductor_list: conductor catalog (import_conductor)
+        :param df_spec_list: conductor specifications (import_conductor)
+        :param df_config_list: configurations (import_config)
+        :param kwargs: grid and rating arguments passed to c_rating_table
+        :return: dict of (config name, Conductor Spec, Size, Cond Strand, Core Strand) to RatingTable
+        """
+        df_conductor_list = df_conductor_list.reset_index(drop=True)
+        df_adjusted = self.unit_conversion_table(df_conductor_list, df_spec_list, df_config_list)
+        tables = {}
+        for config_idx, conductor_idx in self.c_rating_pairs(df_conductor_list, df_spec_list, df_config_list):
+            table = self.c_rating_table(df_adjusted, config_idx * df_conductor_list.shape[0] + conductor_idx,
+                                        **kwargs)
+            key = (table.info['config name'],) + tuple(table.info[level] for level in ConductorCatalog.levels)
+            tables[key] = table
+        return tables
+
     @staticmethod
     def c_mcp(df, _idx):
         """
@@ -1106,7 +2841,7 @@ class IEEE738:
         :param hour: Hour of day (int)
         :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
         :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
-        :param conductor_resistance: Dataframe containing resistance values/temperatures/distance
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
         :return:
         """
 
@@ -1136,6 +2871,10 @@ class IEEE738:
                                                     conductor_projection, conductor_resistance, initial_current_night,
                                                     "Night"))
 
+        if self.instrumentation is not None:
+            self.instrumentation.count('c_initial_temp day', result_day.nfev)
+            self.instrumentation.count('c_initial_temp night', result_night.nfev)
+
         return result_day.x, result_night.x
 
     def c_find_initial_temp(self, conductor_temperature, calculation_units, diameter, ambient_air_temp, elevation, wind_angle,
@@ -1165,7 +2904,7 @@ class IEEE738:
         :param hour: Hour of day (int)
         :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
         :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
-        :param conductor_resistance: Dataframe containing resistance values/temperatures/distance
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
         :param initial_current: initial current of conductor
         :param condition: Day/Night
         :return:
@@ -1209,7 +2948,7 @@ class IEEE738:
         :param hour: Hour of day (int)
         :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
         :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
-        :param conductor_resistance: Dataframe containing resistance values/temperatures/distance
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
         :param initial_temperature: conductor initial temperature (C)
         :param initial_current: initial current of conductor
         :param conductor_temp_emergency: conductor emergency ampacity rating (amps)
@@ -1273,7 +3012,7 @@ class IEEE738:
         :param hour: Hour of day (int)
         :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
         :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
-        :param conductor_resistance: Dataframe containing resistance values/temperatures/distance
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
         :param mcp: conductor heat capacity (lb-C)
         :param duration: time frame for increased current rating (seconds)
         :return: current (A)
@@ -1315,6 +3054,10 @@ class IEEE738:
                                                     initial_temperature_night, initial_current_night,
                                                     conductor_temp_emergency, mcp, 'Night', duration))
 
+        if self.instrumentation is not None:
+            self.instrumentation.count('load_dump day', result_day.nfev)
+            self.instrumentation.count('load_dump night', result_night.nfev)
+
         # optimize.minimize_scalar returns more than just a value, .x returns desired values
         final_temperature_day = result_day.x
         final_temperature_night = result_night.x
@@ -1333,3 +3076,272 @@ class IEEE738:
                                                  conductor_projection, conductor_resistance)
 
         return final_current_day, final_current_night
+
+    @staticmethod
+    def c_bracket_root(func, lower, upper, xtol=1e-6, maxiter=100):
+        """
+        Vectorized bracketing root finder (Illinois / modified regula falsi), solves func(x) = 0 for every element
+        between lower and upper at once. Elements without a sign change between the bounds return the bound closest
+        to a root (smallest |func|), the same result a bounded minimization of |func| converges to.
+        :param func: function of an array of x values returning an array of signed residuals
+        :param lower: lower bounds (array)
+        :param upper: upper bounds (array)
+        :param xtol: absolute tolerance on x
+        :param maxiter: maximum number of iterations
+        :return: roots (array)
+        """
+        a, b = np.broadcast_arrays(np.asarray(lower, dtype=float), np.asarray(upper, dtype=float))
+        a = a.copy()
+        b = b.copy()
+        fa = np.asarray(func(a), dtype=float).copy()
+        fb = np.asarray(func(b), dtype=float).copy()
+
+        no_root = np.sign(fa) * np.sign(fb) > 0
+        x = np.where(np.abs(fa) <= np.abs(fb), a, b)
+        x = np.where(fa == 0, a, np.where(fb == 0, b, x))
+        active = ~no_root & (fa != 0) & (fb != 0) & ~np.isnan(fa) & ~np.isnan(fb)
+        side = np.zeros(a.shape, dtype=int)
+
+        for _ in range(maxiter):
+            if not active.any():
+                break
+            with np.errstate(invalid='ignore', divide='ignore'):
+                c = (a * fb - b * fa) / (fb - fa)
+            # fall back to bisection when the secant step is unusable
+            c = np.where(np.isfinite(c) & (c > np.minimum(a, b)) & (c < np.maximum(a, b)), c, (a + b) / 2)
+            c = np.where(active, c, x)
+            fc = np.asarray(func(c), dtype=float)
+
+            move_a = active & (np.sign(fc) == np.sign(fa))
+            move_b = active & ~move_a
+            # Illinois step, halve the stale end point when the same side moves twice in a row
+            fb = np.where(move_a & (side == 1), fb / 2, fb)
+            fa = np.where(move_b & (side == -1), fa / 2, fa)
+            a = np.where(move_a, c, a)
+            fa = np.where(move_a, fc, fa)
+            b = np.where(move_b, c, b)
+            fb = np.where(move_b, fc, fb)
+            side = np.where(move_a, 1, np.where(move_b, -1, side))
+
+            x = np.where(active, c, x)
+            active = active & (fc != 0) & ~np.isnan(fc) & (np.abs(b - a) > xtol)
+
+        return x
+
+    def conductor_temperature_for_current(self, calculation_units, diameter, current, ambient_air_temp, elevation,
+                                          wind_angle, wind_speed, emissivity, solar_absorptivity, atmosphere,
+                                          latitude, day, month, year, hour, conductor_direction, conductor_projection,
+                                          conductor_resistance, condition='Day', max_temperature=600):
+        """
+        Inverse of c_SSRating, calculates the steady state conductor temperature for a given current (C)
+        Solves the heat balance I^2 * R(Tc) + qs = qc(Tc) + qr(Tc) for every point at once, numeric inputs may be
+        scalars or numpy arrays and are broadcast against each other.
+        Points that would exceed max_temperature return max_temperature.
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param diameter: Conductor diameter (mm or in)
+        :param current: Conductor current (A)
+        :param ambient_air_temp: Ambient air temperature (C)
+        :param elevation: elevation of conductors
+        :param wind_angle: Angle between conductor and applied wind (degrees)
+        :param wind_speed: Wind speed (m/s or ft/hr)
+        :param emissivity: Emissivity
+        :param solar_absorptivity: Solar absorptivity
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :param latitude: latitude
+        :param day: Day of month (int)
+        :param month: Month (int)
+        :param year: Year (int)
+        :param hour: Hour of day (int)
+        :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
+        :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
+        :param condition: Day/Night, solar heat gain is only included for Day
+        :param max_temperature: upper bound of the conductor temperature search (C)
+        :return: Conductor temperature (C)
+        """
+        current, ambient_air_temp, diameter, elevation, wind_angle, wind_speed, emissivity = \
+            [np.asarray(x, dtype=float) for x in (current, ambient_air_temp, diameter, elevation, wind_angle,
+                                                  wind_speed, emissivity)]
+
+        qs = 0
+        if condition == 'Day':
+            # solar heat gain does not depend on conductor temperature, evaluated once
+            qs = self.c_qsHeatGain(calculation_units, solar_absorptivity, elevation, atmosphere, latitude, day,
+                                   month, year, hour, conductor_direction, conductor_projection)
+
+        def residual(conductor_temperature):
+            # heat loss - heat gain, increases with conductor temperature
+            with np.errstate(invalid='ignore', divide='ignore'):
+                qc = self.c_qcHeatLoss(calculation_units, diameter, conductor_temperature, ambient_air_temp,
+                                       elevation, wind_angle, wind_speed)
+                qr = self.c_qrHeatLoss(calculation_units, diameter, emissivity, conductor_temperature,
+                                       ambient_air_temp)
+            r_cond = self.c_cond_resistance(conductor_temperature, conductor_resistance)
+            return qc + qr - qs - current ** 2 * r_cond
+
+        shape = np.broadcast_shapes(current.shape, ambient_air_temp.shape, diameter.shape, elevation.shape,
+                                    wind_angle.shape, wind_speed.shape, emissivity.shape, np.shape(qs),
+                                    np.shape(max_temperature))
+        lower = np.broadcast_to(ambient_air_temp, shape)
+        upper = np.broadcast_to(np.asarray(max_temperature, dtype=float), shape)
+        conductor_temperature = self.c_bracket_root(residual, lower, upper)
+
+        return conductor_temperature[()]
+
+    def c_initial_temp_array(self, calculation_units, diameter, conductor_temp_normal, conductor_temp_emergency,
+                             ambient_air_temp, elevation, wind_angle, wind_speed, emissivity, solar_absorptivity,
+                             atmosphere, latitude, day, month, year, hour, conductor_direction, conductor_projection,
+                             conductor_resistance):
+        """
+        Vectorized version of c_initial_temp, solves the initial conductor temperatures for day and night ratings
+        for every ambient temperature at once with conductor_temperature_for_current
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param diameter: Conductor diameter (mm or in)
+        :param conductor_temp_normal: conductor normal temperature rating (C)
+        :param conductor_temp_emergency: conductor emergency temperature rating (C)
+        :param ambient_air_temp: Ambient air temperature (C), scalar or array
+        :param elevation: elevation of conductors
+        :param wind_angle: Angle between conductor and applied wind (degrees)
+        :param wind_speed: Wind speed (m/s or ft/hr)
+        :param emissivity: Emissivity
+        :param solar_absorptivity: Solar absorptivity
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :param latitude: latitude
+        :param day: Day of month (int)
+        :param month: Month (int)
+        :param year: Year (int)
+        :param hour: Hour of day (int)
+        :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
+        :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
+        :return: initial conductor temperature arrays (C), day and night
+        """
+        ambient_air_temp = np.asarray(ambient_air_temp, dtype=float)
+
+        initial_current_day, initial_current_night = \
+            self.c_SSRating_array(calculation_units, diameter, conductor_temp_normal, ambient_air_temp, elevation,
+                                  wind_angle, 0, emissivity, solar_absorptivity, atmosphere, latitude, day, month,
+                                  year, hour, conductor_direction, conductor_projection, conductor_resistance)
+
+        result = []
+        for condition, initial_current in (('Day', initial_current_day), ('Night', initial_current_night)):
+            result.append(np.asarray(
+                self.conductor_temperature_for_current(calculation_units, diameter, initial_current,
+                                                       ambient_air_temp, elevation, wind_angle, wind_speed,
+                                                       emissivity, solar_absorptivity, atmosphere, latitude, day,
+                                                       month, year, hour, conductor_direction, conductor_projection,
+                                                       conductor_resistance, condition, conductor_temp_emergency)))
+
+        return result[0], result[1]
+
+    def load_dump_array(self, calculation_units, diameter, conductor_temp_normal, conductor_temp_emergency,
+                        ambient_air_temp, elevation, wind_angle, wind_speed, emissivity, solar_absorptivity,
+                        atmosphere, latitude, day, month, year, hour, conductor_direction, conductor_projection,
+                        conductor_resistance, mcp, duration):
+        """
+        Vectorized version of load_dump, calculates the maximum current through a conductor over a specified duration
+        for every ambient temperature at once. The final conductor temperature is solved as the root of
+        (transient temperature - emergency temperature) instead of minimizing its absolute value.
+        :param calculation_units: Units: 'Metric' or 'Imperial'
+        :param diameter: Conductor diameter (mm or in)
+        :param conductor_temp_normal: conductor normal temperature rating (C)
+        :param conductor_temp_emergency: conductor emergency temperature rating (C)
+        :param ambient_air_temp: Ambient air temperature (C), scalar or array
+        :param elevation: elevation of conductors
+        :param wind_angle: Angle between conductor and applied wind (degrees)
+        :param wind_speed: Wind speed (m/s or ft/hr)
+        :param emissivity: Emissivity
+        :param solar_absorptivity: Solar absorptivity
+        :param atmosphere: Atmospheric conditions 'Industrial' or 'Clear'
+        :param latitude: latitude
+        :param day: Day of month (int)
+        :param month: Month (int)
+        :param year: Year (int)
+        :param hour: Hour of day (int)
+        :param conductor_direction: Direction conductors run 'North/South' or 'East/West' (string)
+        :param conductor_projection: Projected area of the conductor per unit length (diameter / 1000 or diameter / 12)
+        :param conductor_resistance: ConductorParameters or Dataframe containing resistance values/temperatures/distance
+        :param mcp: conductor heat capacity (lb-C)
+        :param duration: time frame for increased current rating (minutes)
+        :return: current arrays (A), day and night
+        """
+        ambient_air_temp = np.asarray(ambient_air_temp, dtype=float)
+
+        # Calculate steady state current for daytime & nighttime rating with 0 wind
+        initial_current_day, initial_current_night = \
+            self.c_SSRating_array(calculation_units, diameter, conductor_temp_normal, ambient_air_temp, elevation,
+                                  wind_angle, 0, emissivity, solar_absorptivity, atmosphere, latitude, day, month,
+                                  year, hour, conductor_direction, conductor_projection, conductor_resistance)
+        initial_current = np.stack((initial_current_day, initial_current_night))
+
+        # Calculate initial conductor temperature for daytime & nighttime rating with emergency wind applied
+        initial_temperature = np.stack(
+            self.c_initial_temp_array(calculation_units, diameter, conductor_temp_normal, conductor_temp_emergency,
+                                      ambient_air_temp, elevation, wind_angle, wind_speed, emissivity,
+                                      solar_absorptivity, atmosphere, latitude, day, month, year, hour,
+                                      conductor_direction, conductor_projection, conductor_resistance))
+
+        if self.true_to_standard:
+            # conductor resistance at 162% of conductor initial temperature
+            r = self.c_cond_resistance(initial_temperature * 1.62, conductor_resistance)
+        else:
+            # conductor resistance at conductor initial temperature
+            r = self.c_cond_resistance(initial_temperature, conductor_resistance)
+
+        def final_rating(conductor_temperature):
+            rating_day, rating_night = \
+                self.c_SSRating_array(calculation_units, diameter, conductor_temperature, ambient_air_temp,
+                                      elevation, wind_angle, wind_speed, emissivity, solar_absorptivity, atmosphere,
+                                      latitude, day, month, year, hour, conductor_direction, conductor_projection,
+                                      conductor_resistance)
+            return np.stack((rating_day[0], rating_night[1]))
+
+        def residual(conductor_temperature):
+            final_ = final_rating(conductor_temperature)
+            with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+                calc_tau = (mcp * (conductor_temperature - initial_temperature)) / \
+                           (r * (final_ ** 2 - initial_current ** 2)) * 1 / 60
+                tc = initial_temperature + (conductor_temperature - initial_temperature) * \
+                    (1 - np.exp(-duration / calc_tau))
+            return tc - conductor_temp_emergency
+
+        # transient temperature is below the initial temperature up to it, the root is between it and 600 C
+        lower = np.maximum(np.broadcast_to(ambient_air_temp, initial_temperature.shape), initial_temperature) + 1e-6
+        upper = np.full(initial_temperature.shape, 600.0)
+        final_temperature = self.c_bracket_root(residual, lower, upper)
+
+        final_current = final_rating(final_temperature)
+
+        return final_current[0], final_current[1]
+
+
+# catalog and settings held by each c_reporting_parallel worker process, set once by _init_rating_worker
+_rating_worker = {}
+
+
+def _init_rating_worker(app, df_conductor_list, df_spec_list, df_config_list, method):
+    _rating_worker['app'] = app
+    _rating_worker['conductor'] = df_conductor_list
+    _rating_worker['spec'] = df_spec_list
+    _rating_worker['config'] = df_config_list
+    _rating_worker['method'] = method
+
+
+def _rate_pair(task):
+    config_idx, conductor_idx = task
+    app = _rating_worker['app']
+    df_conductor = _rating_worker['conductor'].iloc[[conductor_idx]].reset_index(drop=True)
+    df_spec_list = _rating_worker['spec']
+    df_spec = df_spec_list[df_spec_list['Conductor Spec'] == df_conductor.at[0, 'Conductor Spec']].reset_index(
+        drop=True)
+    df_config = _rating_worker['config'].iloc[[config_idx]].reset_index(drop=True)
+
+    # record the pair into a fresh Instrumentation and return it with the frames, the caller merges the counters
+    instrumentation = app.instrumentation
+    if instrumentation is not None:
+        app.instrumentation = Instrumentation()
+    try:
+        df_N, df_E, df_L = getattr(app, _rating_worker['method'])(df_conductor, df_spec, df_config)
+        return df_N, df_E, df_L, app.instrumentation
+    finally:
+        app.instrumentation = instrumentation
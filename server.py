@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+MIT License
+
+Copyright (c) 2023 Mark Shuck
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@author: Mark Shuck
+email: mark@shuck.engineering
+
+Local rating server (standard library asyncio HTTP/1.1, TCP or Unix socket).
+
+    python server.py --port 8738
+    python server.py --unix /tmp/ieee738.sock
+
+POST /steady_state
+    {"conductor": ["ACSR", 795, 36, 1], "config": "default", "ambient air temperature": 35,
+     "conductor temperature": 75, "rating": "normal"}
+POST /load_dump
+    {"conductor": ["ACSR", 795, 36, 1], "config": "default", "ambient air temperature": 35}
+GET /status
+
+"conductor" lists the catalog levels (Conductor Spec, Size, Cond Strand, Core Strand) needed to identify the
+conductor. Temperatures are in C. Optional point values: "wind speed" (+ "wind speed units", defaults to the
+calculation units), "wind angle" (degrees), "day", "month", "year", "hour" and for load dump "duration (minutes)";
+missing values come from the configuration (normal/emergency wind by "rating" for steady state, load dump always
+uses the emergency wind and rejects "rating").
+Responses: {"rating daytime": A, "rating nighttime": A}
+
+Requests arriving within --window milliseconds of each other are rated together in one vectorized evaluation.
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import sys
+import warnings
+
+import numpy as np
+
+import main as ieee738
+
+path_config = 'Sample/config-sample.xlsx'  # location of configuration file
+path_conductor = 'Sample/Conductor_Prop-Sample.xlsx'  # location of conductor file
+
+reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class RatingService:
+    """
+    Catalog and configurations converted once at start up, rates batches of single point requests with the array
+    engines (c_SSRating_array, load_dump_array)
+    """
+
+    def __init__(self, app, df_conductor_list, df_spec_list, df_config_list):
+        self.app = app
+        df_conductor_list = df_conductor_list.reset_index(drop=True)
+        self.catalog = ieee738.ConductorCatalog(df_conductor_list, df_spec_list)
+        self.configs = {str(name): _idx for _idx, name in enumerate(df_config_list['config name'])}
+        self.n_conductor = df_conductor_list.shape[0]
+        # one row per (configuration, conductor), configuration major
+        self.df_adjusted = app.unit_conversion_table(df_conductor_list, df_spec_list, df_config_list)
+        # (configuration, conductor) pairs with normal/emergency temperature ratings
+        self.rated = set(app.c_rating_pairs(df_conductor_list, df_spec_list, df_config_list))
+        self.conductors = [
+            ieee738.ConductorParameters.stack([ieee738.ConductorParameters.from_adjusted(self.df_adjusted, row)
+                                               for row in range(config_idx * self.n_conductor,
+                                                                (config_idx + 1) * self.n_conductor)])
+            for config_idx in range(df_config_list.shape[0])]
+
+    def parse(self, kind, request):
+        """
+        Validates a request and resolves its conductor/configuration
+        :param kind: 'steady state' or 'load dump'
+        :param request: decoded JSON body
+        :return: point dict used by rate_batch
+        """
+        if not isinstance(request, dict):
+            raise ValueError('request body must be a JSON object')
+        config_name = str(request.get('config', next(iter(self.configs))))
+        if config_name not in self.configs:
+            raise ValueError(f'{config_name} is not a valid configuration')
+        config_idx = self.configs[config_name]
+
+        keys = request.get('conductor')
+        if not isinstance(keys, list) or not keys:
+            raise ValueError('conductor must list the catalog levels (spec, size, cond strand, core strand)')
+        if self.catalog.count(*keys) != 1:
+            raise ValueError(f'{keys} does not identify a single conductor')
+        conductor_idx = self.catalog.rows[self.catalog.key(*keys)][0]
+        if kind == 'load dump' and (config_idx, conductor_idx) not in self.rated:
+            raise ValueError(f'{keys} has no normal/emergency temperature rating')
+
+        row = config_idx * self.n_conductor + conductor_idx
+        df = self.df_adjusted
+        if kind == 'load dump':
+            # load_dump heats the conductor to its emergency rating, the wind always comes from the emergency values
+            if 'rating' in request:
+                raise ValueError('rating is not used for load dump, the emergency wind applies')
+            rating = 'emergency'
+        else:
+            rating = request.get('rating', 'normal')
+            if rating not in ('normal', 'emergency'):
+                raise ValueError(f'{rating} is not a valid rating, normal or emergency')
+
+        wind_speed = request.get('wind speed', df.at[row, rating + ' wind speed'])
+        if 'wind speed' in request and 'wind speed units' in request:
+            wind_speed = float(ieee738.uc.speed_convert_array(wind_speed, request['wind speed units'],
+                                                              df.at[row, rating + ' wind speed units']))
+        point = {
+            'config': config_idx,
+            'conductor': conductor_idx,
+            'row': row,
+            'ambient air temperature': request.get('ambient air temperature', df.at[row, 'ambient air temperature']),
+            'wind speed': wind_speed,
+            'wind angle': request.get('wind angle', df.at[row, rating + ' wind angle']),
+        }
+        for column in ('day', 'month', 'year', 'hour'):
+            point[column] = request.get(column, df.at[row, column])
+        if kind == 'steady state':
+            if 'conductor temperature' not in request:
+                raise ValueError('conductor temperature is required')
+            point['conductor temperature'] = request['conductor temperature']
+        else:
+            point['duration (minutes)'] = request.get('duration (minutes)', df.at[row, 'duration (minutes)'])
+        for column, value in point.items():
+            if not isinstance(value, (int, float, np.number)) or isinstance(value, bool) or not np.isfinite(value):
+                raise ValueError(f'{column} must be a finite number')
+        if any(point[column] != int(point[column]) for column in ('day', 'month', 'year')):
+            raise ValueError('day, month and year must be whole numbers')
+        try:
+            datetime.date(int(point['year']), int(point['month']), int(point['day']))
+        except ValueError as error:
+            raise ValueError(f'invalid date: {error}')
+        if not 0 <= point['hour'] <= 2400:
+            raise ValueError(f'hour must be between 0 and 2400, got {point["hour"]}')
+        return point
+
+    def rate_batch(self, batch):
+        """
+        Rates a batch of parsed points, points sharing kind and configuration are evaluated in one array call
+        :param batch: list of (kind, point)
+        :return: list of results ({'rating daytime', 'rating nighttime'} or an exception), same order as batch
+        """
+        results = [None] * len(batch)
+        groups = {}
+        for _pos, (kind, point) in enumerate(batch):
+            groups.setdefault((kind, point['config']), []).append(_pos)
+
+        for (kind, config_idx), positions in groups.items():
+            try:
+                ratings = self.rate_group(kind, config_idx, [batch[_pos][1] for _pos in positions])
+            except Exception as error:
+                ratings = [error] * len(positions)
+            for _pos, rating in zip(positions, ratings):
+                results[_pos] = rating
+        return results
+
+    def rate_group(self, kind, config_idx, points):
+        df = self.df_adjusted
+        row = config_idx * self.n_conductor
+        values = {column: np.array([point[column] for point in points], dtype=float) for column in points[0]}
+        conductor = self.conductors[config_idx].take(values['conductor'].astype(int))
+        rows = values['row'].astype(int)
+
+        args = (df.at[row, 'elevation'], values['wind angle'], values['wind speed'], conductor.emissivity,
+                conductor.solar_absorptivity, df.at[row, 'atmosphere'], df.at[row, 'latitude'],
+                values['day'].astype(int), values['month'].astype(int), values['year'].astype(int), values['hour'],
+                df.at[row, 'conductor direction'], conductor.projection, conductor)
+        if kind == 'steady state':
+            rating_day, rating_night = self.app.c_SSRating_array(
+                df.at[row, 'calculation units'], conductor.diameter, values['conductor temperature'],
+                values['ambient air temperature'], *args)
+        else:
+            rating_day, rating_night = self.app.load_dump_array(
+                df.at[row, 'calculation units'], conductor.diameter,
+                df['normal temperature rating'].values[rows].astype(float),
+                df['emergency temperature rating'].values[rows].astype(float), values['ambient air temperature'],
+                *args, conductor.mcp, values['duration (minutes)'])
+
+        return [{'rating daytime': None if np.isnan(day) else float(day),
+                 'rating nighttime': None if np.isnan(night) else float(night)}
+                for day, night in zip(rating_day, rating_night)]
+
+
+class RatingBatcher:
+    """
+    Collects requests for up to window seconds (or max_batch requests) and rates them together in a worker thread,
+    the event loop keeps accepting requests while a batch is calculated
+    """
+
+    def __init__(self, service, window=0.002, max_batch=4096):
+        self.service = service
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue()
+        self.requests = 0
+        self.batches = 0
+
+    async def submit(self, kind, point):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((kind, point, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await loop.run_in_executor(None, self.service.rate_batch,
+                                                     [(kind, point) for kind, point, _ in batch])
+            except Exception as error:
+                results = [error] * len(batch)
+            self.requests += len(batch)
+            self.batches += 1
+
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+class RatingServer:
+    """
+    Minimal HTTP/1.1 front end (keep-alive, JSON bodies) for RatingBatcher
+    """
+    routes = {'/steady_state': 'steady state', '/load_dump': 'load dump'}
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin-1').split(maxsplit=2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                status, response = await self.respond(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close' and version.strip() == 'HTTP/1.1'
+                payload = json.dumps(response).encode()
+                writer.write(f'HTTP/1.1 {status} {reasons[status]}\r\nContent-Type: application/json\r\n'
+                             f'Content-Length: {len(payload)}\r\n'
+                             f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode() + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, path, body):
+        if path == '/status':
+            return 200, {'version': ieee738.ver, 'requests': self.batcher.requests, 'batches': self.batcher.batches}
+        if path not in self.routes:
+            return 404, {'error': f'{path} not found'}
+        if method != 'POST':
+            return 405, {'error': 'use POST'}
+
+        kind = self.routes[path]
+        try:
+            point = self.batcher.service.parse(kind, json.loads(body or b'{}'))
+        except (ValueError, TypeError, KeyError) as error:
+            return 400, {'error': str(error)}
+        try:
+            return 200, await self.batcher.submit(kind, point)
+        except Exception as error:
+            return 500, {'error': str(error)}
+
+
+async def serve(service, host='127.0.0.1', port=8738, unix=None, window=0.002, max_batch=4096, ready=None):
+    """
+    Runs the rating server until cancelled
+    :param service: RatingService
+    :param host: TCP host
+    :param port: TCP port
+    :param unix: Unix socket path, used instead of TCP when given
+    :param window: batching window (seconds)
+    :param max_batch: maximum requests per batch
+    :param ready: asyncio.Event set once the server accepts connections
+    """
+    batcher = RatingBatcher(service, window, max_batch)
+    rating_server = RatingServer(batcher)
+    batch_task = asyncio.create_task(batcher.run())
+    if unix is None:
+        server = await asyncio.start_server(rating_server.handle, host, port)
+    else:
+        server = await asyncio.start_unix_server(rating_server.handle, unix)
+    if ready is not None:
+        ready.set()
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batch_task.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='IEEE 738 local rating server')
+    parser.add_argument('--config', default=path_config, help='configuration workbook')
+    parser.add_argument('--conductor', default=path_conductor, help='conductor workbook')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8738)
+    parser.add_argument('--unix', default=None, help='Unix socket path (instead of TCP)')
+    parser.add_argument('--window', type=float, default=2, help='batching window (milliseconds)')
+    parser.add_argument('--max-batch', type=int, default=4096, help='maximum requests per batch')
+    args = parser.parse_args(argv)
+
+    # openpyxl warns about workbook features it drops on read (data validation, conditional formatting), the
+    # values are not affected
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+    app = ieee738.IEEE738()
+    config_list = app.import_config(args.config, sheet_name='config', cache=True)
+    conductor_list, spec_list = app.import_conductor(args.conductor, ['conductors', 'conductor spec'], cache=True)
+    service = RatingService(app, conductor_list, spec_list, config_list)
+
+    print(f'IEEE 738 rating server {ieee738.ver} on {args.unix or f"{args.host}:{args.port}"}')
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix, args.window / 1000, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
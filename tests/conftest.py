@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import main as ieee738  # noqa: E402
+
+path_config = os.path.join(root, 'Sample', 'config-sample.xlsx')
+path_conductor = os.path.join(root, 'Sample', 'Conductor_Prop-Sample.xlsx')
+
+
+@pytest.fixture(scope='session')
+def sample():
+    """
+    Sample workbooks, imported once: configurations, conductors (default index) and conductor specifications
+    """
+    config_list = ieee738.IEEE738.import_config(path_config, sheet_name='config')
+    conductor_list, spec_list = ieee738.IEEE738.import_conductor(path_conductor, ['conductors', 'conductor spec'])
+    return config_list.reset_index(drop=True), conductor_list.reset_index(drop=True), spec_list
+
+
+@pytest.fixture
+def app():
+    return ieee738.IEEE738()
+
+
+@pytest.fixture
+def pair(sample):
+    """
+    :return: function returning the conductor, its specification and the configuration of one catalog pair
+    """
+    config_list, conductor_list, spec_list = sample
+
+    def select(conductor_idx=0, config_idx=0):
+        df_conductor = conductor_list.iloc[[conductor_idx]].reset_index(drop=True)
+        df_spec = spec_list[spec_list['Conductor Spec'] == df_conductor.at[0, 'Conductor Spec']].reset_index(drop=True)
+        df_config = config_list.iloc[[config_idx]].reset_index(drop=True)
+        return df_conductor, df_spec, df_config
+    return select
+
+
+@pytest.fixture
+def adjusted(app, pair):
+    """
+    :return: function returning the unit_conversion output (one row) of one catalog pair
+    """
+    def convert(conductor_idx=0, config_idx=0):
+        return app.unit_conversion(*pair(conductor_idx, config_idx))
+    return convert
@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+import main as ieee738
+
+levels = ieee738.ConductorCatalog.levels
+
+
+def filtered(conductor_list, key):
+    """
+    Conductors matching the leading levels by filtering the dataframe, NaN matches None
+    """
+    match = pd.Series(True, index=conductor_list.index)
+    for level, value in zip(levels, key):
+        match &= conductor_list[level].isna() if value is None else conductor_list[level] == value
+    return conductor_list[match]
+
+
+def test_catalog_matches_dataframe_filter(sample):
+    _, conductor_list, spec_list = sample
+    catalog = ieee738.ConductorCatalog(conductor_list, spec_list)
+
+    keys = {()}
+    for row in conductor_list[list(levels)].itertuples(index=False, name=None):
+        row = ieee738.ConductorCatalog.key(*row)
+        keys.update(row[:depth] for depth in range(1, len(levels) + 1))
+
+    for key in keys:
+        df_expected = filtered(conductor_list, key)
+        assert catalog.count(*key) == df_expected.shape[0]
+        if len(key) < len(levels):
+            expected = list(dict.fromkeys(ieee738.ConductorCatalog.key(*df_expected[levels[len(key)]])))
+            assert catalog.choices(*key) == expected
+        if key:
+            df_conductor, df_spec = catalog.lookup(*key)
+            pd.testing.assert_frame_equal(df_conductor, df_expected.reset_index(drop=True))
+            pd.testing.assert_frame_equal(
+                df_spec, spec_list[spec_list['Conductor Spec'] == key[0]].reset_index(drop=True))
+
+
+def test_catalog_nan_levels_and_copies(sample):
+    _, conductor_list, spec_list = sample
+    catalog = ieee738.ConductorCatalog(conductor_list, spec_list)
+    # HD Copper has no core stranding
+    assert None in catalog.choices('HD Copper', 500, catalog.choices('HD Copper', 500)[0])
+    assert catalog.count('HD Copper', float('nan')) == 0
+    assert catalog.choices('unknown') == []
+
+    df_conductor, df_spec = catalog.lookup('ACSR')
+    df_conductor.loc[0, 'Size'] = -1
+    df_spec.loc[0, 'normal temperature rating'] = -1
+    df_conductor, df_spec = catalog.lookup('ACSR')
+    assert (df_conductor['Size'] > 0).all()
+    assert df_spec.at[0, 'normal temperature rating'] == 140
+
+    with pytest.raises(KeyError):
+        catalog.lookup('ACSR', 123456)
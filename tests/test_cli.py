@@ -0,0 +1,77 @@
+import os
+
+import pandas as pd
+import pytest
+
+import cli
+from conftest import path_config, path_conductor
+
+conductor = 'HD Copper,500'  # first sample conductor
+
+
+def run(tmp_path, *args):
+    return cli.main(['--config', path_config, '--conductor', path_conductor, '--output', str(tmp_path / 'ratings'),
+                     '--quiet'] + list(args))
+
+
+def test_ratings_written(app, sample, tmp_path):
+    config_list, conductor_list, spec_list = sample
+    assert run(tmp_path, '--conductors', conductor, '--config-name', 'default', '--format', 'npz') == cli.EXIT_OK
+
+    df_n, df_e, df_l, df_config = app.import_columnar(str(tmp_path / 'ratings'), file_format='npz')
+    expected = app.c_reporting_batch(conductor_list.iloc[[0]].reset_index(drop=True), spec_list,
+                                     config_list.iloc[[0]].reset_index(drop=True))
+    assert [df.shape[0] for df in (df_n, df_e, df_l)] == [df.shape[0] for df in expected]
+    assert df_config['config name'].tolist() == ['default']
+
+
+def test_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    for _ in range(2):
+        assert run(tmp_path, '--conductors', conductor, '--config-name', 'default', '--format', 'npz',
+                   '--cache') == cli.EXIT_OK
+    assert len(os.listdir(tmp_path / 'cache' / 'ieee738')) == 2
+
+
+@pytest.mark.parametrize('args', [['--conductors', 'ACSR,1'],
+                                  ['--conductors', conductor, 'Unknown'],
+                                  ['--conductors', 'ACSR,795,36,1,2,3'],
+                                  ['--config-name', 'default', 'unknown']])
+def test_invalid_selection(tmp_path, capsys, args):
+    assert run(tmp_path, *args) == cli.EXIT_USAGE
+    assert capsys.readouterr().err.startswith('error:')
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.parametrize('args', [['--workers', '0'],
+                                  ['--per-conductor', '--format', 'xlsx'],
+                                  ['--format', 'csv']])
+def test_invalid_arguments(tmp_path, args):
+    with pytest.raises(SystemExit) as error:
+        run(tmp_path, *args)
+    assert error.value.code == cli.EXIT_USAGE
+
+
+def test_input_not_readable(tmp_path, capsys):
+    assert cli.main(['--conductor', str(tmp_path / 'missing.xlsx'), '--quiet']) == cli.EXIT_INPUT
+    assert 'could not read input workbooks' in capsys.readouterr().err
+
+
+def test_no_ratings(sample, tmp_path, capsys):
+    config_list, conductor_list, spec_list = sample
+    conductor_list = conductor_list.copy()
+    conductor_list['Conductor Spec'] = 'AACSR'  # no temperature ratings in the sample specifications
+    path = str(tmp_path / 'conductors.xlsx')
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        conductor_list.to_excel(writer, sheet_name='conductors', index=False)
+        spec_list.to_excel(writer, sheet_name='conductor spec', index=False)
+
+    assert cli.main(['--config', path_config, '--conductor', path, '--quiet']) == cli.EXIT_NO_RATINGS
+    assert 'normal/emergency temperature ratings' in capsys.readouterr().err
+
+
+def test_export_failure(tmp_path, capsys):
+    output = str(tmp_path / 'missing' / 'ratings')
+    assert cli.main(['--config', path_config, '--conductor', path_conductor, '--output', output, '--quiet',
+                     '--conductors', conductor, '--config-name', 'default', '--format', 'npz']) == cli.EXIT_FAILURE
+    assert capsys.readouterr().err.startswith('error: FileNotFoundError')
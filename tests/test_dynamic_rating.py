@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import main as ieee738
+
+
+@pytest.fixture
+def weather():
+    rng = np.random.default_rng(6)
+    index = pd.date_range('2023-06-10 00:00', periods=48, freq='30min')
+    return pd.DataFrame({'ambient air temperature': rng.uniform(10, 35, index.size),
+                         'wind speed': rng.uniform(0.5, 4, index.size),
+                         'wind angle': rng.uniform(0, 90, index.size)}, index=index)
+
+
+def test_c_dynamic_rating_matches_c_SSRating(app, adjusted, weather):
+    df = adjusted(1, 1)
+    conductor = ieee738.ConductorParameters.from_adjusted(df)
+    result = app.c_dynamic_rating(df, weather)
+
+    assert list(result.index) == list(weather.index)
+    for timestamp, record in weather.iterrows():
+        # local solar time as hour x 100, 14:30 -> 1450
+        hour = (timestamp.hour + timestamp.minute / 60) * 100
+        expected = app.c_SSRating(df.at[0, 'calculation units'], conductor.diameter,
+                                  df.at[0, 'normal temperature rating'], record['ambient air temperature'],
+                                  df.at[0, 'elevation'], record['wind angle'], record['wind speed'],
+                                  conductor.emissivity, conductor.solar_absorptivity, df.at[0, 'atmosphere'],
+                                  df.at[0, 'latitude'], timestamp.day, timestamp.month, timestamp.year, hour,
+                                  df.at[0, 'conductor direction'], conductor.projection, conductor)
+        assert result.at[timestamp, 'rating daytime'] == pytest.approx(expected[0], rel=1e-9)
+        assert result.at[timestamp, 'rating nighttime'] == pytest.approx(expected[1], rel=1e-9)
+
+    day = result['solar altitude'] > 0
+    assert day.any() and (~day).any()
+    np.testing.assert_array_equal(result['rating'], np.where(day, result['rating daytime'],
+                                                             result['rating nighttime']))
+
+
+def test_c_dynamic_rating_inputs(app, adjusted, weather):
+    df = adjusted(1, 1)
+    expected = app.c_dynamic_rating(df, weather)
+
+    # timestamp column and dict of arrays instead of a DatetimeIndex
+    records = weather.reset_index().rename(columns={'index': 'timestamp'})
+    result = app.c_dynamic_rating(df, {column: records[column].to_numpy() for column in records.columns})
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+    # conductor temperature per record, a hotter conductor carries more current
+    conductor_temp = np.full(len(weather), df.at[0, 'normal temperature rating'])
+    conductor_temp[::2] += 20
+    result = app.c_dynamic_rating(df, weather, conductor_temp=conductor_temp)
+    np.testing.assert_allclose(result['rating nighttime'].to_numpy()[1::2],
+                               expected['rating nighttime'].to_numpy()[1::2], rtol=1e-12)
+    assert (result['rating nighttime'].to_numpy()[::2] > expected['rating nighttime'].to_numpy()[::2]).all()
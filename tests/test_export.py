@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import main as ieee738
+
+
+@pytest.fixture
+def ratings(app, sample):
+    config_list, conductor_list, spec_list = sample
+    df_n, df_e, df_l = app.c_reporting_batch(conductor_list.iloc[[0, 1, 2]].reset_index(drop=True), spec_list,
+                                             config_list)
+    # every 8th row keeps the file small, every conductor and configuration is still present
+    return df_n.iloc[::8], df_e.iloc[::8], df_l.iloc[::8], config_list
+
+
+def read_sheets(filename_):
+    return pd.read_excel(filename_, sheet_name=None)
+
+
+def test_export_excel_stream_matches_export_excel(ratings, tmp_path):
+    ieee738.IEEE738.export_excel(*ratings, str(tmp_path / 'table'))
+    # chunks smaller than a sheet
+    ieee738.IEEE738.export_excel_stream(*ratings, str(tmp_path / 'stream'), chunk_rows=100)
+
+    expected = read_sheets(tmp_path / 'table.xlsx')
+    result = read_sheets(tmp_path / 'stream.xlsx')
+    assert list(result) == ['normal', 'emergency', 'load', 'config']
+    for title, df in expected.items():
+        pd.testing.assert_frame_equal(result[title], df)
+
+
+def test_export_excel_stream_per_conductor(ratings, tmp_path):
+    df_n, df_e, df_l, config_list = ratings
+    ieee738.IEEE738.export_excel_stream(*ratings, str(tmp_path / 'stream'), per_conductor=True)
+
+    result = read_sheets(tmp_path / 'stream.xlsx')
+    # 3 conductors x 2 configurations, sheets in row order
+    numbers = range(1, 3 * config_list.shape[0] + 1)
+    assert result['conductors']['sheet number'].tolist() == list(numbers)
+    for title, df, column in (('normal', df_n, 'rating daytime'), ('emergency', df_e, 'rating nighttime'),
+                              ('load', df_l, 'load dump rating daytime')):
+        df_sheets = pd.concat([result[f'{title} {number}'] for number in numbers], axis=0, ignore_index=True)
+        assert df_sheets.shape == df.shape
+        np.testing.assert_allclose(df_sheets[column], df[column])
+    for number in numbers:
+        conductor = result['conductors'].iloc[number - 1]
+        assert (result[f'normal {number}']['config name'] == conductor['config name']).all()
+        assert (result[f'normal {number}']['Size'] == conductor['Size']).all()
+
+
+@pytest.mark.parametrize('file_format', ieee738.IEEE738.columnar_formats)
+def test_columnar_round_trip(app, ratings, tmp_path, file_format):
+    if file_format != 'npz':
+        pytest.importorskip('pyarrow')
+    df_n, df_e, df_l, config_list = ratings
+    df_n = df_n.copy()
+    # text with missing values (None and NaN) and a mixed text/number column
+    df_n['Name'] = ['Coot', None, np.nan] + ['Macaw'] * (df_n.shape[0] - 3)
+    df_n['Core Strand'] = [7, 'unknown'] + [np.nan] * (df_n.shape[0] - 2)
+
+    filename_list = app.export_columnar(df_n, df_e, df_l, config_list, str(tmp_path / 'ratings'),
+                                        file_format=file_format)
+    assert all((tmp_path / filename_).exists() for filename_ in map(str, filename_list))
+    result = app.import_columnar(str(tmp_path / 'ratings'), file_format=file_format)
+
+    for df_result, df in zip(result, (df_n, df_e, df_l, config_list)):
+        pd.testing.assert_frame_equal(df_result, ieee738.IEEE738.columnar_frame(df))
+    # missing text stays missing instead of turning into the text 'nan' or 'None'
+    assert result[0]['Name'].isna().tolist()[:4] == [False, True, True, False]
+    assert result[0].at[0, 'Name'] == 'Coot'
+    assert result[0]['Core Strand'].tolist()[:2] == ['7', 'unknown']
+
+
+def test_columnar_errors(app, ratings, tmp_path):
+    with pytest.raises(ValueError):
+        app.export_columnar(*ratings, str(tmp_path / 'ratings'), file_format='csv')
+    if ieee738.feather is None:
+        with pytest.raises(ImportError):
+            app.export_columnar(*ratings, str(tmp_path / 'ratings'), file_format='parquet')
@@ -0,0 +1,121 @@
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main as ieee738
+from conftest import path_conductor, path_config
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    return tmp_path / 'cache' / 'ieee738'
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / 'conductors.xlsx'
+    shutil.copyfile(path_conductor, path)
+    return str(path)
+
+
+class CountingLoader:
+    """
+    import_conductor that counts how often the workbook is parsed
+    """
+    __name__ = 'import_conductor'
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path, sheet_name):
+        self.calls += 1
+        return ieee738.IEEE738.import_conductor(path, sheet_name)
+
+
+sheets = ['conductors', 'conductor spec']
+
+
+def assert_frames_equal(result, expected):
+    assert isinstance(result, type(expected))
+    for df_result, df in zip(result, expected):
+        pd.testing.assert_frame_equal(df_result, df, check_index_type=True, check_column_type=True)
+
+
+def test_cache_miss_hit_and_hash(cache_home, workbook):
+    expected = ieee738.IEEE738.import_conductor(workbook, sheets)
+    loader = CountingLoader()
+
+    # miss, parsed and written
+    assert_frames_equal(ieee738.IEEE738.import_cached(workbook, sheets, loader), expected)
+    assert loader.calls == 1
+    assert len(os.listdir(cache_home)) == 1
+
+    # hit on modification time and size
+    assert_frames_equal(ieee738.IEEE738.import_cached(workbook, sheets, loader), expected)
+    assert loader.calls == 1
+
+    # touched, same content, hit on the content hash
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert_frames_equal(ieee738.IEEE738.import_cached(workbook, sheets, loader), expected)
+    assert loader.calls == 1
+
+    # content changed, parsed again
+    shutil.copyfile(path_config, workbook)
+    loader.calls = 0
+    with pytest.raises(ValueError):
+        ieee738.IEEE738.import_cached(workbook, sheets, loader)
+    assert loader.calls == 1
+    # no temporary files left behind
+    assert all(filename_.endswith('.cache') for filename_ in os.listdir(cache_home))
+
+
+def test_cache_round_trip_keeps_types(cache_home, tmp_path):
+    df = pd.DataFrame({'number': [1.5, np.nan, 3.0], 'integer': [1, 2, 3], 'text': ['a', None, 'c'],
+                       'mixed': [7, 'unknown', np.nan], 'date': pd.to_datetime(['2023-01-01', '2023-06-10', None])},
+                      index=[5, 2, 9])
+    filename_cache = str(cache_home / 'frames.cache')
+    ieee738.IEEE738.export_cache(filename_cache, {'key': ['a']}, [df, df.iloc[0:0]])
+
+    header, frames = ieee738.IEEE738.import_cache(filename_cache)
+    assert header['key'] == ['a']
+    pd.testing.assert_frame_equal(frames[0], df)
+    assert frames[0].at[2, 'text'] is None and frames[0].at[9, 'mixed'] != frames[0].at[9, 'mixed']
+    assert frames[0].at[5, 'mixed'] == 7 and frames[0].at[2, 'mixed'] == 'unknown'
+    assert frames[1].shape == (0, 5)
+
+
+def test_cache_never_unpickles(cache_home, workbook, monkeypatch):
+    loader = CountingLoader()
+    ieee738.IEEE738.import_cached(workbook, sheets, loader)
+    filename_cache = os.path.join(cache_home, os.listdir(cache_home)[0])
+
+    # a pickle in place of the cache file is not loaded, the workbook is parsed and the cache rewritten
+    with open(filename_cache, 'wb') as f:
+        pickle.dump({'key': None}, f)
+    monkeypatch.setattr(pickle, 'loads', lambda *args, **kwargs: pytest.fail('cache file unpickled'))
+    monkeypatch.setattr(pickle, 'load', lambda *args, **kwargs: pytest.fail('cache file unpickled'))
+    ieee738.IEEE738.import_cached(workbook, sheets, loader)
+    assert loader.calls == 2
+
+    # the rewritten cache is used again
+    ieee738.IEEE738.import_cached(workbook, sheets, loader)
+    assert loader.calls == 2
+
+    # another cache layout is parsed again
+    monkeypatch.setattr(ieee738.IEEE738, 'cache_format', ieee738.IEEE738.cache_format + 1)
+    ieee738.IEEE738.import_cached(workbook, sheets, loader)
+    assert loader.calls == 3
+
+
+def test_import_with_cache(cache_home):
+    expected = ieee738.IEEE738.import_config(path_config, sheet_name='config')
+    for _ in range(2):
+        pd.testing.assert_frame_equal(ieee738.IEEE738.import_config(path_config, sheet_name='config', cache=True),
+                                      expected)
+    assert len(os.listdir(cache_home)) == 1
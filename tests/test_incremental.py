@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+import main as ieee738
+
+
+def grid_rows(df_config):
+    ambient = np.arange(df_config.at[0, 'ambient air temperature lower range'],
+                        df_config.at[0, 'ambient air temperature upper range'] + 1,
+                        df_config.at[0, 'temperature increment'])
+    return ambient.size
+
+
+def test_counters_reuse_unchanged_grid(app, pair):
+    df_conductor, df_spec, df_config = pair(1)
+    app.incremental = ieee738.IncrementalCache()
+
+    df_N, _, _ = app.c_reporting_grid(df_conductor, df_spec, df_config)
+    n_cells = df_N.shape[0]
+    n_ambient = grid_rows(df_config)
+    # normal and emergency ratings share everything but the wind (Qc)
+    assert app.incremental.evaluated == {'Qs': 1, 'conductor resistance': n_cells // n_ambient, 'Qc': 2 * n_cells,
+                                         'Qr': n_cells, 'load dump': n_ambient}
+    assert app.incremental.reused == {'Qs': 1, 'conductor resistance': n_cells // n_ambient, 'Qc': 0, 'Qr': n_cells,
+                                      'load dump': 0}
+
+    evaluated = dict(app.incremental.evaluated)
+    app.c_reporting_grid(df_conductor, df_spec, df_config)
+    assert app.incremental.evaluated == evaluated
+    assert app.incremental.reused == {'Qs': 3, 'conductor resistance': 3 * n_cells // n_ambient, 'Qc': 2 * n_cells,
+                                      'Qr': 3 * n_cells, 'load dump': n_ambient}
+
+
+def test_counters_new_ambient_temperatures_only(app, pair):
+    df_conductor, df_spec, df_config = pair(1)
+    app.incremental = ieee738.IncrementalCache()
+    df_N, _, _ = app.c_reporting_grid(df_conductor, df_spec, df_config)
+
+    df_config_wide = df_config.copy()
+    df_config_wide['ambient air temperature upper range'] += 2 * df_config.at[0, 'temperature increment']
+    df_N_wide, _, _ = app.c_reporting_grid(df_conductor, df_spec, df_config_wide)
+
+    assert app.incremental.evaluated['Qs'] == 1
+    assert app.incremental.evaluated['Qr'] == df_N_wide.shape[0]
+    assert app.incremental.evaluated['Qc'] == 2 * df_N_wide.shape[0]
+    assert app.incremental.reused['Qc'] == 2 * df_N.shape[0]
+    assert app.incremental.evaluated['load dump'] == grid_rows(df_config_wide)
+    assert app.incremental.reused['load dump'] == grid_rows(df_config)
+
+
+def test_counters_wind_change_keeps_solar_and_radiation(app, pair):
+    df_conductor, df_spec, df_config = pair(1)
+    app.incremental = ieee738.IncrementalCache()
+    app.c_reporting_grid(df_conductor, df_spec, df_config)
+    evaluated = dict(app.incremental.evaluated)
+
+    df_config_wind = df_config.copy()
+    df_config_wind['normal wind speed'] = 2.0
+    app.c_reporting_grid(df_conductor, df_spec, df_config_wind)
+
+    # only the normal rating convection depends on the normal wind
+    assert app.incremental.evaluated['Qc'] == evaluated['Qc'] + evaluated['Qr']
+    for name in ('Qs', 'conductor resistance', 'Qr', 'load dump'):
+        assert app.incremental.evaluated[name] == evaluated[name]
+
+
+def test_solar_ephemeris_is_part_of_the_key(app, pair):
+    df_conductor, df_spec, df_config = pair(1)
+    app.incremental = ieee738.IncrementalCache()
+    app.c_reporting_grid(df_conductor, df_spec, df_config)
+    evaluated = dict(app.incremental.evaluated)
+
+    app.solar_ephemeris = ieee738.SolarEphemeris()
+    app.c_reporting_grid(df_conductor, df_spec, df_config)
+    assert app.incremental.evaluated['Qs'] == evaluated['Qs'] + 1
+    assert app.incremental.evaluated['load dump'] == 2 * evaluated['load dump']
+    assert app.incremental.evaluated['Qc'] == evaluated['Qc']
+
+    # a different table set is a different input as well
+    app.solar_ephemeris = ieee738.SolarEphemeris(resolution=1)
+    app.c_reporting_grid(df_conductor, df_spec, df_config)
+    assert app.incremental.evaluated['Qs'] == evaluated['Qs'] + 2
+
+
+def test_grid_ratings_match_uncached(app, pair):
+    df_conductor, df_spec, df_config = pair(1)
+    expected = app.c_reporting_grid(df_conductor, df_spec, df_config)
+    app.incremental = ieee738.IncrementalCache()
+    app.c_reporting_grid(df_conductor, df_spec, df_config)
+    result = app.c_reporting_grid(df_conductor, df_spec, df_config)
+    for df_expected, df_result in zip(expected, result):
+        pd.testing.assert_frame_equal(df_result, df_expected, check_exact=False, rtol=1e-9)
+
+
+def test_c_reporting_uses_cache(app, pair):
+    df_conductor, df_spec, df_config = pair(1)
+    expected = app.c_reporting(df_conductor, df_spec, df_config)
+    app.incremental = ieee738.IncrementalCache()
+    result = app.c_reporting(df_conductor, df_spec, df_config)
+
+    assert app.incremental.evaluated['Qr'] == expected[0].shape[0]
+    for df_expected, df_result in zip(expected, result):
+        assert list(df_result.columns) == list(df_expected.columns)
+        ratings = [column for column in df_expected.columns if column.endswith(('rating daytime', 'rating nighttime'))]
+        pd.testing.assert_frame_equal(df_result.drop(columns=ratings), df_expected.drop(columns=ratings))
+        # load dump: bracketing solver (load_dump_array) against minimize_scalar (load_dump)
+        np.testing.assert_allclose(df_result[ratings].values.astype(float), df_expected[ratings].values.astype(float),
+                                   rtol=1e-6, atol=1e-3)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import main as ieee738
+
+
+def test_bracket_root_converges():
+    target = np.array([0.5, 2.0, 9.0, 50.0])
+    roots = ieee738.IEEE738.c_bracket_root(lambda x: x ** 3 - target, 0, 10, xtol=1e-10)
+    np.testing.assert_allclose(roots, np.cbrt(target), atol=1e-8)
+
+
+def test_bracket_root_per_element_bounds():
+    lower = np.array([0.0, 3.0, -2.0])
+    upper = np.array([3.0, 6.0, 0.0])
+    roots = ieee738.IEEE738.c_bracket_root(np.sin, lower, upper)
+    np.testing.assert_allclose(roots, [0.0, np.pi, 0.0], atol=1e-6)
+
+
+def test_bracket_root_without_sign_change_returns_closest_bound():
+    # x^2 + 1 has no root, |func| is smallest at the bound closest to 0
+    roots = ieee738.IEEE738.c_bracket_root(lambda x: x ** 2 + 1, np.array([1.0, -5.0]), np.array([4.0, -0.5]))
+    np.testing.assert_array_equal(roots, [1.0, -0.5])
+
+
+def test_bracket_root_root_on_bound():
+    roots = ieee738.IEEE738.c_bracket_root(lambda x: x - 2, np.array([2.0, 0.0]), np.array([5.0, 2.0]))
+    np.testing.assert_array_equal(roots, [2.0, 2.0])
+
+
+@pytest.mark.parametrize('true_to_standard', [False, True])
+@pytest.mark.parametrize('conductor_idx, config_idx', [(0, 0), (1, 0), (2, 1)])
+def test_load_dump_array_matches_scalar(app, adjusted, conductor_idx, config_idx, true_to_standard):
+    app.true_to_standard = true_to_standard
+    df = adjusted(conductor_idx, config_idx)
+    conductor = ieee738.ConductorParameters.from_adjusted(df)
+    ambient_temp = np.array([-15.0, 0.0, 20.0, 40.0])
+    config = [df.at[0, column] for column in ('elevation', 'emergency wind angle', 'emergency wind speed')]
+    solar = [df.at[0, column] for column in ('atmosphere', 'latitude', 'day', 'month', 'year', 'hour',
+                                             'conductor direction')]
+    temperatures = [df.at[0, 'normal temperature rating'], df.at[0, 'emergency temperature rating']]
+    duration = df.at[0, 'duration (minutes)']
+
+    expected = np.array([app.load_dump(df.at[0, 'calculation units'], df.at[0, 'Metal OD'], *temperatures, ambient,
+                                       *config, df.at[0, 'emissivity'], df.at[0, 'solar absorptivity'], *solar,
+                                       conductor.projection, df, ieee738.IEEE738.c_mcp(df, 0), duration)
+                         for ambient in ambient_temp])
+    load_dump_day, load_dump_night = app.load_dump_array(
+        df.at[0, 'calculation units'], conductor.diameter, *temperatures, ambient_temp, *config, conductor.emissivity,
+        conductor.solar_absorptivity, *solar, conductor.projection, conductor, conductor.mcp, duration)
+
+    # bracketing root against the bounded minimization of the scalar path
+    np.testing.assert_allclose(load_dump_day, expected[:, 0], rtol=1e-6, atol=1e-3)
+    np.testing.assert_allclose(load_dump_night, expected[:, 1], rtol=1e-6, atol=1e-3)
@@ -0,0 +1,137 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import main as ieee738
+
+hours = np.arange(600, 1900, 100)
+
+
+def reference(app, df, table, ambient_air_temp, wind_speed, wind_angle, hour):
+    conductor = ieee738.ConductorParameters.from_adjusted(df)
+    return app.c_SSRating(df.at[0, 'calculation units'], df.at[0, 'Metal OD'], table.info['conductor temperature'],
+                          ambient_air_temp, df.at[0, 'elevation'], wind_angle, wind_speed, df.at[0, 'emissivity'],
+                          df.at[0, 'solar absorptivity'], df.at[0, 'atmosphere'], df.at[0, 'latitude'],
+                          int(df.at[0, 'day']), int(df.at[0, 'month']), int(df.at[0, 'year']), hour,
+                          df.at[0, 'conductor direction'], conductor.projection, df)
+
+
+@pytest.fixture(params=[(1, 0), (0, 1)], ids=['ACSR imperial', 'HD Copper metric'])
+def table(request, app, adjusted):
+    df = adjusted(*request.param)
+    return df, app.c_rating_table(df, hour=hours)
+
+
+def test_exact_at_grid_points(app, table):
+    df, table = table
+    grid = np.meshgrid(*table.axes.values(), indexing='ij')
+    rating_day, rating_night = table.lookup(*grid)
+    np.testing.assert_allclose(rating_day, table.rating_day, rtol=1e-12)
+    np.testing.assert_allclose(rating_night, table.rating_night, rtol=1e-12)
+
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        point = [rng.choice(values) for values in table.axes.values()]
+        expected = reference(app, df, table, *point)
+        assert table.lookup(*point) == pytest.approx(expected, rel=1e-9)
+
+
+def test_cell_centers_within_max_error(app, table):
+    df, table = table
+    centers = [(values[1:] + values[:-1]) / 2 for values in table.axes.values()]
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        point = [rng.choice(values) for values in centers]
+        expected = reference(app, df, table, *point)
+        day, night = table.lookup(*point)
+        assert abs(day - expected[0]) <= table.max_error['rating daytime'] + 1e-9
+        assert abs(night - expected[1]) <= table.max_error['rating nighttime'] + 1e-9
+
+
+def interpolation_bound(table, point):
+    """
+    Error bound of multilinear interpolation in the cell holding point, sum over the axes of h^2 / 8 * max|f''|
+    (h cell width). The curvature f'' along an axis is taken as the largest second divided difference of the table
+    touching the cell, over all values of the other axes.
+    :return: bound for the day and night ratings (Amps)
+    """
+    bound = 0
+    for axis, (values, x) in enumerate(zip(table.axes.values(), point)):
+        i = min(max(np.searchsorted(values, x, side='right') - 1, 0), values.size - 2)
+        h = np.diff(values)
+        ratings = np.moveaxis(table.ratings, axis, 0)
+        slope = np.diff(ratings, axis=0) / h.reshape((-1,) + (1,) * (ratings.ndim - 1))
+        curvature = np.diff(slope, axis=0) / ((h[1:] + h[:-1]) / 2).reshape((-1,) + (1,) * (ratings.ndim - 1))
+        # second differences centered on the lower and upper node of the cell
+        nodes = curvature[max(i - 1, 0):i + 1].reshape(-1, 2)
+        bound = bound + h[i] ** 2 / 8 * np.nanmax(np.abs(nodes), axis=0)
+    return bound
+
+
+def test_random_points_within_interpolation_bound(app, table):
+    """
+    max_error is an estimate from the cell centers, points anywhere in the grid are checked against the
+    multilinear interpolation error bound instead
+    """
+    df, table = table
+    rng = np.random.default_rng(2)
+    for _ in range(50):
+        point = [rng.uniform(values[0], values[-1]) for values in table.axes.values()]
+        expected = reference(app, df, table, *point)
+        error = np.abs(np.array(table.lookup(*point)) - expected)
+        assert (error <= interpolation_bound(table, point)).all()
+
+
+def test_multilinear_function_is_reproduced():
+    axes = {'ambient air temperature': [-10, 0, 25, 40], 'wind speed': [0, 0.5, 2], 'wind angle': [0, 45, 90],
+            'hour': [600, 1200, 1800]}
+    grid = np.meshgrid(*axes.values(), indexing='ij')
+    # multilinear (products of single axis terms), interpolated exactly inside and, extrapolated, outside the grid
+    rating = 1000 + 3 * grid[0] + 200 * grid[1] * grid[2] / 90 - 0.01 * grid[0] * grid[3]
+    table = ieee738.RatingTable(axes, rating, rating / 2)
+
+    rng = np.random.default_rng(3)
+    points = [rng.uniform(-20, 50, 200), rng.uniform(0, 3, 200), rng.uniform(0, 90, 200),
+              rng.uniform(600, 1800, 200)]
+    expected = 1000 + 3 * points[0] + 200 * points[1] * points[2] / 90 - 0.01 * points[0] * points[3]
+    day, night = table.lookup(*points, extrapolate=True)
+    np.testing.assert_allclose(day, expected, rtol=1e-12)
+    np.testing.assert_allclose(night, expected / 2, rtol=1e-12)
+
+    day, _ = table.lookup(*points)
+    outside = (points[0] < -10) | (points[0] > 40) | (points[1] > 2)
+    assert np.isnan(day[outside]).all()
+    np.testing.assert_allclose(day[~outside], expected[~outside], rtol=1e-12)
+
+
+def test_hour_axis_validation(table):
+    _, table = table
+    with pytest.raises(ValueError):
+        table.lookup(20, 1, 45)
+    corners = list(itertools.product(*[values[[0, -1]] for values in table.axes.values()]))
+    assert all(np.isfinite(table.lookup(*corner)).all() for corner in corners)
+
+
+def test_table_without_hour_axis(app, adjusted):
+    df = adjusted(1)
+    table = app.c_rating_table(df)
+    assert 'hour' not in table.axes
+    with pytest.raises(ValueError):
+        table.lookup(20, 1, 45, hour=1400)
+    point = [values[1] for values in table.axes.values()]
+    assert table.lookup(*point) == pytest.approx(reference(app, df, table, *point, df.at[0, 'hour']), rel=1e-9)
+
+
+def test_save_load_round_trip(table, tmp_path):
+    _, table = table
+    filename_ = table.save(str(tmp_path / 'table'))
+    assert filename_.endswith('.npz')
+    loaded = ieee738.RatingTable.load(str(tmp_path / 'table'))
+    assert list(loaded.axes) == list(table.axes)
+    np.testing.assert_array_equal(loaded.rating_day, table.rating_day)
+    np.testing.assert_array_equal(loaded.rating_night, table.rating_night)
+    assert loaded.info == table.info
+    assert loaded.max_error == table.max_error
+    point = [20, 1.3, 33, 1430]
+    assert loaded.lookup(*point) == table.lookup(*point)
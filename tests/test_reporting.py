@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import main as ieee738
+
+# heat balance values of the scalar chain, only filled in trace mode
+intermediate_columns = ['qc heat loss', 'qc0', 'qc1', 'qc2', 'uf', 'kf', 'pf', 'Qse', 'theta', 'hc: solar altitude',
+                        'delta', 'omega', 'chi', 'qs heat gain', 'solar altitude correction factor', 'qr heat loss',
+                        'day of year', 'k angle', 'solar azimuth constant', 'solar azimuth', 'Qs',
+                        'conductor resistance']
+
+
+def assert_frame_matches(result, expected, skip=()):
+    assert list(result.columns) == list(expected.columns)
+    assert result.shape == expected.shape
+    columns = [column for column in expected.columns if column not in skip]
+    # ratings within the bounded load dump minimization tolerance, every other column exact
+    pd.testing.assert_frame_equal(result[columns], expected[columns], check_dtype=False, rtol=1e-6, atol=1e-3)
+
+
+@pytest.mark.parametrize('conductor_idx, config_idx', [(0, 0), (1, 0), (2, 1)])
+def test_c_reporting_grid_matches_c_reporting(app, pair, conductor_idx, config_idx):
+    expected = app.c_reporting(*pair(conductor_idx, config_idx))
+    result = app.c_reporting_grid(*pair(conductor_idx, config_idx))
+
+    for df_result, df_expected in zip(result, expected):
+        assert_frame_matches(df_result, df_expected)
+    # load dump duration only on the rows that solve the load dump, the first conductor temperature
+    df_L = result[2]
+    first = df_L['conductor temperature'] == df_L['conductor temperature'].min()
+    assert df_L.loc[first, 'load dump duration'].notna().all()
+    assert df_L.loc[~first, 'load dump duration'].isna().all()
+    assert np.isnan(result[0][intermediate_columns].to_numpy(dtype=float)).all()
+
+
+def test_c_reporting_grid_trace_matches_c_reporting(app, pair):
+    app.trace = True
+    expected = app.c_reporting(*pair(1, 1))
+    result = app.c_reporting_grid(*pair(1, 1))
+
+    for df_result, df_expected in zip(result, expected):
+        assert_frame_matches(df_result, df_expected)
+    assert not np.isnan(result[0][['Qs', 'conductor resistance', 'qr heat loss']].to_numpy(dtype=float)).any()
+
+
+def test_c_reporting_batch_matches_c_reporting(app, sample, caplog):
+    config_list, conductor_list, spec_list = sample
+    # ACSR, ACSS, ACSR interleaved and batched per specification, the fourth conductor has no temperature ratings
+    df_conductor_list = conductor_list.iloc[[1, 2, 3, 0]].reset_index(drop=True)
+    df_conductor_list.loc[3, 'Conductor Spec'] = 'AACSR'
+
+    with caplog.at_level('WARNING', logger='ieee738'):
+        result = app.c_reporting_batch(df_conductor_list, spec_list, config_list)
+    assert 'AACSR' in caplog.text
+
+    expected = [[], [], []]
+    for config_idx in range(config_list.shape[0]):
+        df_config = config_list.iloc[[config_idx]].reset_index(drop=True)
+        for conductor_idx in range(3):
+            df_conductor = df_conductor_list.iloc[[conductor_idx]].reset_index(drop=True)
+            df_spec = spec_list[spec_list['Conductor Spec'] == df_conductor.at[0, 'Conductor Spec']]
+            for frames, df in zip(expected, app.c_reporting(df_conductor, df_spec.reset_index(drop=True), df_config)):
+                frames.append(df)
+
+    for df_result, frames in zip(result, expected):
+        assert_frame_matches(df_result, pd.concat(frames, axis=0, ignore_index=True))
+
+
+def test_c_reporting_batch_nothing_to_rate(app, sample):
+    config_list, conductor_list, spec_list = sample
+    with pytest.raises(ValueError):
+        app.c_reporting_batch(conductor_list.iloc[0:0], spec_list, config_list)
+    df_conductor_list = conductor_list.iloc[[0, 1]].reset_index(drop=True)
+    df_conductor_list['Conductor Spec'] = 'Alumoweld'
+    with pytest.raises(ValueError):
+        app.c_reporting_batch(df_conductor_list, spec_list, config_list)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_c_reporting_parallel_matches_c_reporting_batch(app, sample, workers):
+    config_list, conductor_list, spec_list = sample
+    df_conductor_list = conductor_list.iloc[[1, 2, 3]].reset_index(drop=True)
+    expected = app.c_reporting_batch(df_conductor_list, spec_list, config_list)
+    result = app.c_reporting_parallel(df_conductor_list, spec_list, config_list, workers=workers,
+                                      method='c_reporting_grid')
+
+    for df_result, df_expected in zip(result, expected):
+        assert_frame_matches(df_result, df_expected)
+    # the in-process run does not keep the catalog alive
+    assert not ieee738._rating_worker
@@ -0,0 +1,163 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+import main as ieee738
+import server
+
+key = ['ACSR', 795, 36, 1]  # README example
+
+
+@pytest.fixture(scope='module')
+def service(sample):
+    config_list, conductor_list, spec_list = sample
+    return server.RatingService(ieee738.IEEE738(), conductor_list, spec_list, config_list)
+
+
+def scalar_args(service, point, rating):
+    """
+    c_SSRating arguments of a parsed point taken from the unit_conversion output of its row
+    """
+    df = service.df_adjusted.iloc[[point['row']]].reset_index(drop=True)
+    diameter = df.at[0, 'Metal OD']
+    if ieee738.uc.units_lookup[df.at[0, 'calculation units']] == ieee738.uc.metric_value:
+        projection = diameter / 1000
+    else:
+        projection = diameter / 12
+    assert point['wind speed'] == df.at[0, rating + ' wind speed']
+    return df, (df.at[0, 'calculation units'], diameter, point.get('conductor temperature'),
+                point['ambient air temperature'], df.at[0, 'elevation'], point['wind angle'], point['wind speed'],
+                df.at[0, 'emissivity'], df.at[0, 'solar absorptivity'], df.at[0, 'atmosphere'], df.at[0, 'latitude'],
+                int(point['day']), int(point['month']), int(point['year']), point['hour'],
+                df.at[0, 'conductor direction'], projection, df)
+
+
+@pytest.mark.parametrize('config', ['default', 'metric'])
+@pytest.mark.parametrize('rating', ['normal', 'emergency'])
+def test_steady_state_matches_c_SSRating(service, config, rating):
+    point = service.parse('steady state', {'conductor': key, 'config': config, 'ambient air temperature': 35,
+                                           'conductor temperature': 100, 'rating': rating})
+    result, = service.rate_batch([('steady state', point)])
+    _, args = scalar_args(service, point, rating)
+    expected = service.app.c_SSRating(*args)
+    np.testing.assert_allclose([result['rating daytime'], result['rating nighttime']], expected, rtol=1e-9)
+
+
+def test_load_dump_matches_load_dump(service):
+    point = service.parse('load dump', {'conductor': key, 'ambient air temperature': 35})
+    result, = service.rate_batch([('load dump', point)])
+    df, args = scalar_args(service, point, 'emergency')
+    expected = service.app.load_dump(args[0], args[1], df.at[0, 'normal temperature rating'],
+                                     df.at[0, 'emergency temperature rating'], *args[3:],
+                                     ieee738.IEEE738.c_mcp(df, 0), point['duration (minutes)'])
+    np.testing.assert_allclose([result['rating daytime'], result['rating nighttime']], expected, atol=1e-3)
+
+
+def test_rate_batch_order(service):
+    """
+    A mixed batch (kinds, configurations, conductors) returns the results of the points rated one by one
+    """
+    requests = [('steady state', {'conductor': key, 'conductor temperature': 75}),
+                ('load dump', {'conductor': key, 'config': 'metric'}),
+                ('steady state', {'conductor': ['ACSR', 954, 54, 7], 'config': 'metric',
+                                  'conductor temperature': 90, 'rating': 'emergency'}),
+                ('steady state', {'conductor': key, 'conductor temperature': 125, 'wind speed': 2,
+                                  'wind speed units': 'm/s', 'hour': 1400}),
+                ('load dump', {'conductor': key, 'ambient air temperature': 10})]
+    batch = [(kind, service.parse(kind, request)) for kind, request in requests]
+    results = service.rate_batch(batch)
+    assert results == [service.rate_batch([item])[0] for item in batch]
+    assert len({result['rating daytime'] for result in results}) == len(results)
+
+
+@pytest.mark.parametrize('kind, request_, message', [
+    ('steady state', [], 'JSON object'),
+    ('steady state', {'conductor': key, 'config': 'none', 'conductor temperature': 75}, 'valid configuration'),
+    ('steady state', {'conductor': 'ACSR', 'conductor temperature': 75}, 'catalog levels'),
+    ('steady state', {'conductor': ['ACSR', 795], 'conductor temperature': 75}, 'single conductor'),
+    ('steady state', {'conductor': ['ACSR', 1], 'conductor temperature': 75}, 'single conductor'),
+    ('steady state', {'conductor': key}, 'conductor temperature is required'),
+    ('steady state', {'conductor': key, 'conductor temperature': 'hot'}, 'finite number'),
+    ('steady state', {'conductor': key, 'conductor temperature': True}, 'finite number'),
+    ('steady state', {'conductor': key, 'conductor temperature': 75, 'rating': 'high'}, 'valid rating'),
+    ('steady state', {'conductor': key, 'conductor temperature': 75, 'day': 1.5}, 'whole numbers'),
+    ('steady state', {'conductor': key, 'conductor temperature': 75, 'month': 2, 'day': 30}, 'invalid date'),
+    ('steady state', {'conductor': key, 'conductor temperature': 75, 'hour': 2500}, 'hour'),
+    ('load dump', {'conductor': key, 'rating': 'normal'}, 'rating is not used for load dump'),
+    ('load dump', {'conductor': key, 'rating': 'emergency'}, 'rating is not used for load dump'),
+])
+def test_parse_rejects(service, kind, request_, message):
+    with pytest.raises(ValueError, match=message):
+        service.parse(kind, request_)
+
+
+def test_load_dump_needs_temperature_ratings(sample):
+    config_list, conductor_list, spec_list = sample
+    conductor_list = conductor_list.copy()
+    conductor_list.loc[0, 'Conductor Spec'] = 'AACSR'  # no temperature ratings in the sample specifications
+    service = server.RatingService(ieee738.IEEE738(), conductor_list, spec_list, config_list)
+    assert service.parse('steady state', {'conductor': ['AACSR'], 'conductor temperature': 75})
+    with pytest.raises(ValueError, match='no normal/emergency temperature rating'):
+        service.parse('load dump', {'conductor': ['AACSR']})
+
+
+def test_batcher_groups_requests(service):
+    """
+    Requests submitted within the window are rated in one batch, each caller gets its own result
+    """
+    points = [('steady state', service.parse('steady state', {'conductor': key, 'conductor temperature': temp}))
+              for temp in (60, 75, 90, 105)]
+
+    async def run():
+        batcher = server.RatingBatcher(service, window=0.5)
+        task = asyncio.create_task(batcher.run())
+        try:
+            results = await asyncio.gather(*[batcher.submit(kind, point) for kind, point in points])
+        finally:
+            task.cancel()
+        return batcher, results
+
+    batcher, results = asyncio.run(run())
+    assert (batcher.requests, batcher.batches) == (4, 1)
+    assert results == service.rate_batch(points)
+
+
+def test_batcher_max_batch(service):
+    point = service.parse('steady state', {'conductor': key, 'conductor temperature': 75})
+
+    async def run():
+        batcher = server.RatingBatcher(service, window=0.5, max_batch=2)
+        task = asyncio.create_task(batcher.run())
+        try:
+            await asyncio.gather(*[batcher.submit('steady state', point) for _ in range(5)])
+        finally:
+            task.cancel()
+        return batcher
+
+    batcher = asyncio.run(run())
+    assert (batcher.requests, batcher.batches) == (5, 3)
+
+
+def test_respond_status_codes(service):
+    async def run():
+        batcher = server.RatingBatcher(service, window=0.001)
+        rating_server = server.RatingServer(batcher)
+        task = asyncio.create_task(batcher.run())
+        try:
+            body = json.dumps({'conductor': key, 'conductor temperature': 75}).encode()
+            return [await rating_server.respond('POST', '/steady_state', body),
+                    await rating_server.respond('POST', '/load_dump', json.dumps({'conductor': key,
+                                                                                  'rating': 'normal'}).encode()),
+                    await rating_server.respond('GET', '/steady_state', body),
+                    await rating_server.respond('POST', '/transient', body),
+                    await rating_server.respond('GET', '/status', b'')]
+        finally:
+            task.cancel()
+
+    (ok, result), (bad, error), (method, _), (missing, _), (status, info) = asyncio.run(run())
+    assert ok == 200 and set(result) == {'rating daytime', 'rating nighttime'}
+    assert bad == 400 and 'load dump' in error['error']
+    assert (method, missing, status) == (405, 404, 200)
+    assert info == {'version': ieee738.ver, 'requests': 1, 'batches': 1}
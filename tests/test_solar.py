@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import main as ieee738
+
+# (calculation units, elevation, atmosphere, latitude, conductor direction)
+sites = [('Imperial', 500, 'Clear', 30, 'North/South'), ('Metric', 1200, 'Industrial', -42.5, 'East/West'),
+         ('Metric', 0, 'Clear', 61, 'North/South')]
+dates = [(21, 3, 2023, 1000), (10, 6, 2009, 1400), (29, 2, 2024, 1730), (31, 12, 2023, 800)]
+
+
+@pytest.mark.parametrize('calculation_units, elevation, atmosphere, latitude, conductor_direction', sites)
+def test_c_solar_state_matches_helpers(app, calculation_units, elevation, atmosphere, latitude, conductor_direction):
+    for day, month, year, hour in dates:
+        state = app.c_solar_state(calculation_units, elevation, atmosphere, latitude, day, month, year, hour,
+                                  conductor_direction)
+        assert state['hc: solar altitude'] == pytest.approx(app.c_solar_altitude(latitude, day, month, year, hour))
+        assert state['solar azimuth'] == pytest.approx(app.c_solar_azimuth(latitude, day, month, year, hour))
+        assert state['theta'] == pytest.approx(app.c_Theta(latitude, day, month, year, hour, conductor_direction))
+        assert state['Qs'] == pytest.approx(app.c_Qs(calculation_units, atmosphere, latitude, day, month, year, hour))
+        assert state['Qse'] == pytest.approx(app.c_qse(calculation_units, elevation, atmosphere, latitude, day, month,
+                                                       year, hour))
+        # solar heat gain as composed from the separate helpers
+        expected = 0.8 * state['Qse'] * np.sin(np.radians(state['theta'])) * 0.1
+        assert app.c_qsHeatGain(calculation_units, 0.8, elevation, atmosphere, latitude, day, month, year, hour,
+                                conductor_direction, 0.1) == pytest.approx(expected)
+
+
+def test_c_solar_state_arrays_and_dataframe(app):
+    day, month, year, hour = (np.array(column) for column in zip(*dates))
+    state = app.c_solar_state('Metric', 1200, 'Industrial', -42.5, day, month, year, hour, 'East/West')
+
+    df = pd.DataFrame(index=[0])
+    for i, (day_i, month_i, year_i, hour_i) in enumerate(dates):
+        expected = app.c_solar_state('Metric', 1200, 'Industrial', -42.5, day_i, month_i, year_i, hour_i, 'East/West',
+                                     df, 0)
+        for column in ('day of year', 'hc: solar altitude', 'solar azimuth', 'theta', 'Qs', 'Qse'):
+            assert state[column][i] == pytest.approx(expected[column])
+            assert df.at[0, column] == pytest.approx(expected[column])
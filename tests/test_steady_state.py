@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+import main as ieee738
+
+# HD Copper 500, ACSR Coot, ACSS Macaw against the imperial (0) and metric (1) sample configurations
+pairs = [(conductor_idx, config_idx) for conductor_idx in (0, 1, 2) for config_idx in (0, 1)]
+
+
+def scalar_args(df):
+    """
+    c_SSRating arguments of a unit_conversion row without the point inputs, resistance passed as the DataFrame
+    """
+    metric = ieee738.uc.units_lookup[df.at[0, 'calculation units']] == ieee738.uc.metric_value
+    projection = df.at[0, 'Metal OD'] / (1000 if metric else 12)
+    return {'calculation_units': df.at[0, 'calculation units'], 'diameter': df.at[0, 'Metal OD'],
+            'elevation': df.at[0, 'elevation'], 'emissivity': df.at[0, 'emissivity'],
+            'solar_absorptivity': df.at[0, 'solar absorptivity'], 'atmosphere': df.at[0, 'atmosphere'],
+            'latitude': df.at[0, 'latitude'], 'conductor_direction': df.at[0, 'conductor direction'],
+            'conductor_projection': projection}
+
+
+@pytest.mark.parametrize('conductor_idx, config_idx', pairs)
+def test_c_SSRating_array_matches_scalar(app, adjusted, conductor_idx, config_idx):
+    df = adjusted(conductor_idx, config_idx)
+    args = scalar_args(df)
+    rng = np.random.default_rng(conductor_idx * 10 + config_idx)
+    points = 40
+    ambient_temp = rng.uniform(-15, 45, points)
+    conductor_temp = ambient_temp + rng.uniform(1, 200, points)
+    wind_angle = rng.uniform(0, 90, points)
+    wind_speed = rng.uniform(0, 2, points) * (1 if config_idx else 11811)  # m/s or ft/hr
+    day = rng.integers(1, 29, points)
+    month = rng.integers(1, 13, points)
+    hour = rng.choice([0, 600, 930, 1200, 1545, 1800, 2300], points)
+
+    expected = np.array([app.c_SSRating(args['calculation_units'], args['diameter'], conductor_temp[i],
+                                        ambient_temp[i], args['elevation'], wind_angle[i], wind_speed[i],
+                                        args['emissivity'], args['solar_absorptivity'], args['atmosphere'],
+                                        args['latitude'], int(day[i]), int(month[i]), 2023, int(hour[i]),
+                                        args['conductor_direction'], args['conductor_projection'], df)
+                         for i in range(points)])
+    rating_day, rating_night = app.c_SSRating_array(
+        args['calculation_units'], args['diameter'], conductor_temp, ambient_temp, args['elevation'], wind_angle,
+        wind_speed, args['emissivity'], args['solar_absorptivity'], args['atmosphere'], args['latitude'], day,
+        month, np.full(points, 2023), hour, args['conductor_direction'], args['conductor_projection'], df)
+
+    np.testing.assert_allclose(rating_day, expected[:, 0], rtol=1e-9)
+    np.testing.assert_allclose(rating_night, expected[:, 1], rtol=1e-9)
+
+
+def test_c_SSRating_array_broadcasts_grid(app, adjusted):
+    df = adjusted(1)
+    args = scalar_args(df)
+    ambient_temp = np.arange(-10, 41, 10.0)[:, None]
+    conductor_temp = np.arange(50, 151, 25.0)[None, :]
+
+    rating_day, rating_night = app.c_SSRating_array(
+        args['calculation_units'], args['diameter'], conductor_temp, ambient_temp, args['elevation'], 90, 2,
+        args['emissivity'], args['solar_absorptivity'], args['atmosphere'], args['latitude'], 10, 6, 2009, 1400,
+        args['conductor_direction'], args['conductor_projection'], df)
+
+    assert rating_day.shape == rating_night.shape == (ambient_temp.size, conductor_temp.size)
+    i, j = 2, 3
+    expected = app.c_SSRating(args['calculation_units'], args['diameter'], conductor_temp[0, j], ambient_temp[i, 0],
+                              args['elevation'], 90, 2, args['emissivity'], args['solar_absorptivity'],
+                              args['atmosphere'], args['latitude'], 10, 6, 2009, 1400, args['conductor_direction'],
+                              args['conductor_projection'], df)
+    assert rating_day[i, j] == pytest.approx(expected[0], rel=1e-9)
+    assert rating_night[i, j] == pytest.approx(expected[1], rel=1e-9)
+    # no solar heat gain at night, a hotter conductor carries more current
+    assert (rating_day <= rating_night).all()
+    assert (np.diff(rating_night, axis=1) > 0).all()
+
+
+def test_current_steady_state_scalar_types():
+    # scalar heat balances keep the types of the original scalar implementation
+    assert type(ieee738.IEEE738.current_steady_state(20.0, 5.0, 10.0, 1e-4)) is np.float64
+    assert ieee738.IEEE738.current_steady_state(5.0, 20.0, 10.0, 1e-4) == 0
+    assert type(ieee738.IEEE738.current_steady_state(5.0, 20.0, 10.0, 1e-4)) is int
+    rating = ieee738.IEEE738.current_steady_state(np.array([20.0, 5.0]), 10.0, 0.0, 1e-4)
+    np.testing.assert_allclose(rating, [np.sqrt(1e5), 0])
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import main as ieee738
+
+
+def rating(app, df, conductor, conductor_temp):
+    """
+    Steady state day rating at the configuration ambient temperature, normal wind and solar time
+    """
+    return app.c_SSRating(df.at[0, 'calculation units'], conductor.diameter, conductor_temp,
+                          df.at[0, 'ambient air temperature'], df.at[0, 'elevation'], df.at[0, 'normal wind angle'],
+                          df.at[0, 'normal wind speed'], conductor.emissivity, conductor.solar_absorptivity,
+                          df.at[0, 'atmosphere'], df.at[0, 'latitude'], df.at[0, 'day'], df.at[0, 'month'],
+                          df.at[0, 'year'], df.at[0, 'hour'], df.at[0, 'conductor direction'], conductor.projection,
+                          conductor)[0]
+
+
+@pytest.mark.parametrize('method', ['euler', 'heun', 'rk4'])
+def test_steady_state_current_holds_temperature(app, adjusted, method):
+    df = adjusted(1)
+    conductor = ieee738.ConductorParameters.from_adjusted(df)
+    current = np.full(30, rating(app, df, conductor, 100))
+
+    temperature = app.c_transient(df, current, 60, initial_temperature=100, method=method)
+    np.testing.assert_allclose(temperature, 100, atol=1e-6)
+    # without an initial temperature the steady state temperature of the first sample is used
+    np.testing.assert_allclose(app.c_transient(df, current, 60, method=method), 100, atol=1e-6)
+
+
+def test_current_step_approaches_new_steady_state(app, adjusted):
+    df = adjusted(1)
+    conductor = ieee738.ConductorParameters.from_adjusted(df)
+    current = np.full(600, rating(app, df, conductor, 140))
+
+    temperature = {method: app.c_transient(df, current, 60, initial_temperature=100, method=method)
+                   for method in ('euler', 'heun', 'rk4')}
+    for result in temperature.values():
+        assert (np.diff(result) >= -1e-9).all()
+        assert result[-1] == pytest.approx(140, abs=1e-3)
+    np.testing.assert_allclose(temperature['heun'], temperature['rk4'], atol=0.05)
+    np.testing.assert_allclose(temperature['euler'], temperature['rk4'], atol=1)
+    # subdividing the sample interval does not change the rk4 result
+    np.testing.assert_allclose(app.c_transient(df, current[:30], 60, initial_temperature=100, method='rk4',
+                                               max_step=5), temperature['rk4'][:30], atol=1e-3)
+
+
+def test_lines_are_independent(app, adjusted):
+    df = adjusted(1)
+    conductors = [ieee738.ConductorParameters.from_adjusted(df),
+                  ieee738.ConductorParameters.from_adjusted(adjusted(2))]
+    current = np.column_stack([np.linspace(500, 1200, 40), np.linspace(1500, 300, 40)])
+
+    temperature = app.c_transient(df, current, 60, conductors=conductors, initial_temperature=75)
+    assert temperature.shape == current.shape
+    for line, conductor in enumerate(conductors):
+        single = app.c_transient(df, current[:, line], 60, conductors=conductor, initial_temperature=75)
+        np.testing.assert_allclose(temperature[:, line], single, rtol=1e-12)
+
+
+def test_unknown_method(app, adjusted):
+    with pytest.raises(ValueError):
+        app.c_transient(adjusted(1), np.ones(3), 60, method='midpoint')
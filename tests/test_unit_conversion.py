@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import UnitConversion as Unc
+
+uc = Unc.UnitConvert()
+
+scalar_convert = {'temp': uc.temp_convert, 'speed': uc.speed_convert, 'length': uc.length_convert,
+                  'angle': uc.angle_convert}
+
+
+@pytest.mark.parametrize('quantity', list(scalar_convert))
+def test_convert_array_matches_scalar(quantity):
+    labels = list(uc.conversion_units[quantity])
+    values = np.array([-40.0, 0.0, 1.5, 95.0])
+    for input_units in labels:
+        for output_units in labels:
+            expected = [scalar_convert[quantity](value, input_units, output_units) for value in values]
+            result = uc.convert_array(values, input_units, output_units, quantity)
+            np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12,
+                                       err_msg=f'{input_units} -> {output_units}')
+
+
+def test_convert_array_per_element_units():
+    value = pd.Series([10.0, 20.0, 30.0], index=[4, 5, 6], name='elevation')
+    result = uc.convert_array(value, np.array(['m', 'ft', 'in']), 'm', 'length')
+    assert isinstance(result, pd.Series)
+    assert list(result.index) == [4, 5, 6] and result.name == 'elevation'
+    np.testing.assert_allclose(result.values, [uc.length_convert(10.0, 'm', 'm'), uc.length_convert(20.0, 'ft', 'm'),
+                                               uc.length_convert(30.0, 'in', 'm')])
+
+
+def test_convert_array_in_place():
+    value = np.array([0.0, 100.0])
+    result = uc.temp_convert_array(value, 'C', 'F', out=value)
+    assert result is value
+    np.testing.assert_allclose(value, [32.0, 212.0])
+
+
+def test_convert_array_unknown_units():
+    with pytest.raises(Unc.UnitConversionError):
+        uc.speed_convert_array([1.0, 2.0], ['m/s', 'furlongs/fortnight'], 'ft/hr')
+    result = uc.speed_convert_array([1.0, 2.0, 3.0], ['m/s', 'furlongs/fortnight', np.nan], 'ft/hr', errors='nan')
+    assert result[0] == pytest.approx(uc.speed_convert(1.0, 'm/s', 'ft/hr'))
+    assert np.isnan(result[1:]).all()
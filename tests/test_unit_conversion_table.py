@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import UnitConversion as Unc
+
+
+def test_unit_conversion_table_matches_unit_conversion(app, sample):
+    config_list, conductor_list, spec_list = sample
+    result = app.unit_conversion_table(conductor_list, spec_list, config_list)
+    assert result.shape[0] == conductor_list.shape[0] * config_list.shape[0]
+
+    _pos = 0
+    for config_idx in range(config_list.shape[0]):
+        df_config = config_list.iloc[[config_idx]].reset_index(drop=True)
+        for conductor_idx in range(conductor_list.shape[0]):
+            df_conductor = conductor_list.iloc[[conductor_idx]].reset_index(drop=True)
+            df_spec = spec_list[spec_list['Conductor Spec'] == df_conductor.at[0, 'Conductor Spec']]
+            expected = app.unit_conversion(df_conductor, df_spec.reset_index(drop=True), df_config)
+            assert list(result.columns) == list(expected.columns)
+
+            for column in expected.columns:
+                value, expected_value = result.at[_pos, column], expected.at[0, column]
+                if isinstance(expected_value, str) and expected_value == 'error':
+                    # unknown units (ex. missing core dimensions) are 0 instead of the text 'error'
+                    assert value == 0, column
+                elif pd.isna(expected_value):
+                    assert pd.isna(value), column
+                elif isinstance(expected_value, (int, float, np.number)) and not isinstance(expected_value, bool):
+                    assert value == pytest.approx(expected_value, rel=1e-12), column
+                else:
+                    assert value == expected_value, column
+            _pos += 1
+
+
+def test_unit_conversion_table_unknown_calculation_units(app, sample):
+    config_list, conductor_list, spec_list = sample
+    df_config = config_list.iloc[[0]].reset_index(drop=True)
+    df_config.loc[0, 'calculation units'] = 'Cubits'
+    with pytest.raises(Unc.UnitConversionError):
+        app.unit_conversion_table(conductor_list, spec_list, df_config)